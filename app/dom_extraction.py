@@ -229,6 +229,72 @@ function extractDomElements(options) {
         element_count: elements.length
     };
 }
+
+// Split an extraction into tiled capture tiles, in the same evaluate.
+// Rects are viewport-relative, so normal elements are moved to full-page
+// coordinates with the current scroll offset and go to every tile their
+// rect overlaps. Touching edges count, so an element ending exactly where
+// a tile starts belongs to it. Fixed/sticky elements repeat in every tile
+// at their viewport position.
+function binElementsByTile(result, tiles) {
+    const scrollX = window.scrollX;
+    const scrollY = window.scrollY;
+    const binned = tiles.map(() => []);
+
+    for (const element of result.elements) {
+        const rect = element.rect;
+
+        if (element.is_fixed) {
+            tiles.forEach((tile, i) => {
+                binned[i].push({
+                    ...element,
+                    rect: {
+                        x: rect.x + tile.x,
+                        y: rect.y + tile.y,
+                        width: rect.width,
+                        height: rect.height
+                    },
+                    tile_index: tile.index,
+                    tile_relative_rect: rect
+                });
+            });
+            continue;
+        }
+
+        const pageRect = {
+            x: rect.x + scrollX,
+            y: rect.y + scrollY,
+            width: rect.width,
+            height: rect.height
+        };
+        tiles.forEach((tile, i) => {
+            if (
+                pageRect.x <= tile.x + tile.width &&
+                pageRect.x + pageRect.width >= tile.x &&
+                pageRect.y <= tile.y + tile.height &&
+                pageRect.y + pageRect.height >= tile.y
+            ) {
+                binned[i].push({
+                    ...element,
+                    rect: pageRect,
+                    tile_index: tile.index,
+                    tile_relative_rect: {
+                        x: pageRect.x - tile.x,
+                        y: pageRect.y - tile.y,
+                        width: rect.width,
+                        height: rect.height
+                    }
+                });
+            }
+        });
+    }
+
+    return {
+        tiles: binned,
+        viewport: result.viewport,
+        extraction_time_ms: result.extraction_time_ms
+    };
+}
 '''
 
 
@@ -237,6 +303,7 @@ def get_extraction_script() -> str:
 
     Returns:
         JavaScript code string containing getUniqueSelector, getXPath,
-        isVisible, getZIndex, and extractDomElements functions.
+        isVisible, getZIndex, extractDomElements and binElementsByTile
+        functions.
     """
     return _EXTRACTION_JS
@@ -2,6 +2,8 @@
 
 import asyncio
 import base64
+import uuid
+from collections.abc import Iterator
 from contextlib import asynccontextmanager
 from importlib.metadata import version as get_version
 from typing import Optional
@@ -13,7 +15,7 @@ except Exception:
     __version__ = "1.2.0"  # Fallback if not installed as package
 
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
 from .models import (
     Cookie,
@@ -103,10 +105,49 @@ def parse_storage_string(storage_string: Optional[str]) -> dict[str, str]:
     return storage
 
 
+def iter_tiled_multipart(
+    result: TiledScreenshotResponse, image_media_type: str, boundary: str
+) -> Iterator[bytes]:
+    """Yield a tiled capture as a multipart/mixed body, part by part.
+
+    The first part is the JSON response without image data. Each following
+    part is one raw tile image, in tile order, identified by a
+    "Content-ID: <tile-N>" header where N is the tile index.
+
+    Args:
+        result: Tiled capture whose tiles are MultipartTile with image_bytes
+        image_media_type: Content-Type of the tile images
+        boundary: Multipart boundary string
+
+    Yields:
+        Chunks of the encoded multipart body
+    """
+    delimiter = f"--{boundary}\r\n".encode()
+    metadata = result.model_dump_json(
+        exclude={"tiles": {"__all__": {"image_base64"}}}
+    )
+    yield (
+        delimiter
+        + b"Content-Type: application/json\r\n\r\n"
+        + metadata.encode()
+        + b"\r\n"
+    )
+    for tile in result.tiles:
+        yield delimiter + (
+            f"Content-Type: {image_media_type}\r\n"
+            f"Content-ID: <tile-{tile.index}>\r\n"
+            f"Content-Length: {len(tile.image_bytes)}\r\n\r\n"
+        ).encode()
+        yield tile.image_bytes
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle - initialize and cleanup browser."""
-    await screenshot_service.initialize()
+    # Launch in the background so startup is not blocked on Chromium
+    screenshot_service.start_background()
     yield
     await screenshot_service.shutdown()
 
@@ -230,16 +271,18 @@ async def take_screenshot_with_metadata(request: ScreenshotRequest):
                 for el in dom_result["elements"]
             ]
 
-            # Assess extraction quality
-            quality_result = assess_extraction_quality(elements)
+            # Assess extraction quality; the detailed text/tag metrics are
+            # only computed when they will be returned
+            include_metrics = bool(
+                request.extract_dom and request.extract_dom.include_metrics
+            )
+            quality_result = assess_extraction_quality(
+                elements, detailed=include_metrics
+            )
 
             # Convert metrics dataclass to Pydantic model if include_metrics=True
             metrics = None
-            if (
-                request.extract_dom
-                and request.extract_dom.include_metrics
-                and quality_result.metrics
-            ):
+            if include_metrics and quality_result.metrics:
                 metrics = QualityMetrics(
                     element_count=quality_result.metrics.element_count,
                     visible_count=quality_result.metrics.visible_count,
@@ -248,7 +291,7 @@ async def take_screenshot_with_metadata(request: ScreenshotRequest):
                     unique_tag_count=quality_result.metrics.unique_tag_count,
                     visible_ratio=quality_result.metrics.visible_ratio,
                     hidden_ratio=quality_result.metrics.hidden_ratio,
-                    unique_tags=quality_result.metrics.unique_tags,
+                    unique_tags=sorted(quality_result.metrics.unique_tags),
                     has_headings=quality_result.metrics.has_headings,
                     tag_distribution=quality_result.metrics.tag_distribution,
                     total_text_length=quality_result.metrics.total_text_length,
@@ -332,9 +375,21 @@ async def take_tiled_screenshot(request: TiledScreenshotRequest):
     - `claude`: 1568x1568 tiles with 50px overlap
     - `gemini`: 3072x3072 tiles with 100px overlap
     - `gpt4v`: 2048x2048 tiles with 75px overlap
+
+    Set `response_format` to `multipart` to receive `multipart/mixed`
+    instead: the JSON metadata part first, then one raw image part per tile.
     """
     try:
         result = await screenshot_service.capture_tiled(request)
+        if request.response_format == "multipart":
+            boundary = uuid.uuid4().hex
+            media_type = (
+                "image/png" if request.format == ImageFormat.PNG else "image/jpeg"
+            )
+            return StreamingResponse(
+                iter_tiled_multipart(result, media_type, boundary),
+                media_type=f"multipart/mixed; boundary={boundary}",
+            )
         return result
     except Exception as e:
         raise HTTPException(
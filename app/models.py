@@ -464,6 +464,14 @@ class ScreenshotRequest(BaseModel):
         le=100,
         description="Image quality (1-100, only applies to JPEG)",
     )
+    wait_strategy: Literal["domcontentloaded", "load", "networkidle"] = Field(
+        default="networkidle",
+        description=(
+            "Page load event to wait for before capture. 'domcontentloaded' and "
+            "'load' return sooner on pages with long-lived trackers; combine "
+            "them with wait_for_selector or wait_for_timeout"
+        ),
+    )
     wait_for_timeout: int = Field(
         default=0,
         ge=0,
@@ -560,10 +568,26 @@ class Tile(BaseModel):
     file_size_bytes: int = Field(..., ge=0, description="Tile image file size in bytes")
     dom_extraction: Optional[DomExtractionResult] = Field(
         default=None,
-        description="DOM extraction results for this tile, if enabled",
+        description=(
+            "DOM extraction results for this tile, if enabled: the elements "
+            "whose rect overlaps the tile bounds (touching edges count), "
+            "plus fixed/sticky elements, which repeat in every tile"
+        ),
     )
 
 
+class MultipartTile(Tile):
+    """Tile captured for a multipart/mixed response (internal).
+
+    Carries the raw image in image_bytes instead of base64 text. The
+    endpoint sends the bytes as their own part and leaves image_base64 out
+    of the JSON part, so this type never appears in the public schema.
+    """
+
+    image_base64: Optional[str] = None  # type: ignore[assignment]
+    image_bytes: bytes = Field(..., exclude=True)
+
+
 class TileConfig(BaseModel):
     """Configuration and metadata for tile grid generation.
 
@@ -630,6 +654,13 @@ class TiledScreenshotRequest(BaseModel):
         le=500,
         description="Overlap between adjacent tiles in pixels (default: 50)",
     )
+    uniform_tiles: bool = Field(
+        default=False,
+        description=(
+            "Widen the overlap so every tile is full size instead of clipping "
+            "the last row and column (overlap becomes a minimum)"
+        ),
+    )
     max_tile_count: int = Field(
         default=20,
         ge=1,
@@ -650,6 +681,14 @@ class TiledScreenshotRequest(BaseModel):
         le=100,
         description="Image quality (1-100, only applies to JPEG)",
     )
+    wait_strategy: Literal["domcontentloaded", "load", "networkidle"] = Field(
+        default="networkidle",
+        description=(
+            "Page load event to wait for before capture. 'domcontentloaded' and "
+            "'load' return sooner on pages with long-lived trackers; combine "
+            "them with wait_for_selector or wait_for_timeout"
+        ),
+    )
     wait_for_timeout: int = Field(
         default=0,
         ge=0,
@@ -684,6 +723,14 @@ class TiledScreenshotRequest(BaseModel):
         default=None,
         description="Options for extracting DOM elements from each tile",
     )
+    response_format: Literal["json", "multipart"] = Field(
+        default="json",
+        description=(
+            "'json' returns tiles as base64 inside the JSON body. 'multipart' "
+            "returns multipart/mixed: the JSON metadata first, then one raw "
+            "image part per tile (no base64 overhead)"
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_overlap_less_than_tile(self) -> "TiledScreenshotRequest":
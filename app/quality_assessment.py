@@ -5,38 +5,45 @@ generating quality levels and actionable warnings to help users
 understand extraction quality and debug issues.
 """
 
+import functools
 import json
 import os
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Sequence
+from typing import Any, Final, Optional, Sequence
 
-from app.models import DomElement, ExtractionQuality, QualityWarning
+from app.models import DomElement, ExtractionQuality, QualityWarning, VisionAIHints
 
+# Use orjson for config parsing when installed (its JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is unchanged)
+try:
+    import orjson
 
-def _load_model_config() -> Optional[dict]:
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_MODEL_CONFIG_PATH = Path(__file__).parent / "vision_model_config.json"
+
+
+def _load_model_config(config_path: Path = _MODEL_CONFIG_PATH) -> Optional[dict]:
     """Load vision model configuration from JSON file if it exists.
 
     Looks for vision_model_config.json in the app directory.
     Returns None if file doesn't exist or can't be parsed.
     """
-    config_path = Path(__file__).parent / "vision_model_config.json"
-    if not config_path.exists():
-        return None
-
     try:
-        with open(config_path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return _json_loads(config_path.read_bytes())
+    except (ValueError, OSError):
+        # ValueError covers JSONDecodeError and UnicodeDecodeError from
+        # the stdlib parser on badly encoded bytes
         return None
 
 
 # Load JSON config at module level (optional)
 _MODEL_CONFIG = _load_model_config()
 
-if TYPE_CHECKING:
-    from app.models import VisionAIHints
-
 # Thresholds for quality levels
 THRESHOLD_EMPTY = 0
 THRESHOLD_POOR = 4
@@ -45,6 +52,7 @@ THRESHOLD_GOOD = 21
 THRESHOLD_TAG_DIVERSITY = 3
 THRESHOLD_HIDDEN_RATIO = 0.5
 THRESHOLD_MIN_TEXT_LENGTH = 10
+THRESHOLD_HEADING_MIN = THRESHOLD_LOW // 2  # Minimum elements before NO_HEADINGS fires
 
 # Heading tags for detection
 HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
@@ -55,8 +63,79 @@ VERIFICATION_URLS = [
     "https://httpbin.org/html",
 ]
 
+# Static warning suggestions (built once at import, shared by every assessment)
+_SUGGESTION_NO_ELEMENTS: Final = (
+    "Verify the page has loaded completely and contains "
+    "the expected content. Try testing with a simple URL like "
+    f"{VERIFICATION_URLS[0]} to confirm extraction is working."
+)
+_SUGGESTION_LOW_ELEMENT_COUNT: Final = (
+    "Check if the page has finished loading, or expand the extraction "
+    f"selectors. Test with {VERIFICATION_URLS[0]} to verify setup."
+)
+_SUGGESTION_LOW_TAG_DIVERSITY: Final = (
+    "Consider expanding extraction selectors to capture a broader "
+    "variety of content (headings, paragraphs, links, etc.)."
+)
+_SUGGESTION_NO_HEADINGS: Final = (
+    "Heading elements often contain important structural information. "
+    "Consider adding h1-h6 to your extraction selectors."
+)
+_SUGGESTION_MANY_HIDDEN: Final = (
+    "Many hidden elements may indicate the page hasn't rendered fully "
+    "or content is behind user interaction. Consider adding wait time "
+    "or check for dynamic content loading."
+)
+_SUGGESTION_MINIMAL_TEXT: Final = (
+    "Elements have minimal text content. This may indicate extraction "
+    "of UI elements rather than content, or the page may have limited text."
+)
+
+# Pre-built warning templates. Every result gets its own model_copy(), which
+# skips field validation, so callers may modify returned warnings freely.
+_WARN_NO_ELEMENTS: Final = QualityWarning(
+    code="NO_ELEMENTS",
+    message="No DOM elements were extracted from the page.",
+    suggestion=_SUGGESTION_NO_ELEMENTS,
+)
+_WARN_NO_HEADINGS: Final = QualityWarning(
+    code="NO_HEADINGS",
+    message="No heading elements (h1-h6) found in the extraction.",
+    suggestion=_SUGGESTION_NO_HEADINGS,
+)
+# LOW_ELEMENT_COUNT only fires for 1..THRESHOLD_POOR elements, so every
+# variant is built up front, indexed by element count
+_WARN_LOW_ELEMENT_COUNT: Final = tuple(
+    QualityWarning(
+        code="LOW_ELEMENT_COUNT",
+        message=f"Only {count} element(s) extracted, which is very sparse.",
+        suggestion=_SUGGESTION_LOW_ELEMENT_COUNT,
+    )
+    for count in range(THRESHOLD_POOR + 1)
+)
+_WARN_LOW_TAG_DIVERSITY: Final = QualityWarning(
+    code="LOW_TAG_DIVERSITY", message="", suggestion=_SUGGESTION_LOW_TAG_DIVERSITY
+)
+_WARN_MANY_HIDDEN: Final = QualityWarning(
+    code="MANY_HIDDEN", message="", suggestion=_SUGGESTION_MANY_HIDDEN
+)
+_WARN_MINIMAL_TEXT: Final = QualityWarning(
+    code="MINIMAL_TEXT", message="", suggestion=_SUGGESTION_MINIMAL_TEXT
+)
+
+# Quality level keyed by (is_poor, is_low, diverse_with_headings).
+# is_poor implies is_low, so (True, False, *) never occurs.
+_QUALITY_TABLE: Final = {
+    (True, True, False): ExtractionQuality.POOR,
+    (True, True, True): ExtractionQuality.POOR,
+    (False, True, False): ExtractionQuality.LOW,
+    (False, True, True): ExtractionQuality.LOW,
+    (False, False, False): ExtractionQuality.LOW,
+    (False, False, True): ExtractionQuality.GOOD,
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class QualityMetricsData:
     """Internal dataclass for computed quality metrics.
 
@@ -75,7 +154,8 @@ class QualityMetricsData:
     visible_ratio: float = 0.0
     hidden_ratio: float = 0.0
 
-    # Tag analysis
+    # Tag analysis; unique_tags is in first-seen order, sorted by the
+    # API layer only when metrics are serialized
     unique_tags: list[str] = field(default_factory=list)
     has_headings: bool = False
     tag_distribution: dict[str, int] = field(default_factory=dict)
@@ -87,7 +167,7 @@ class QualityMetricsData:
     max_text_length: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityAssessmentResult:
     """Result of quality assessment.
 
@@ -102,6 +182,7 @@ class QualityAssessmentResult:
 
 def assess_extraction_quality(
     elements: Optional[Sequence[DomElement]],
+    detailed: bool = True,
 ) -> QualityAssessmentResult:
     """Assess the quality of DOM extraction results.
 
@@ -112,11 +193,14 @@ def assess_extraction_quality(
     Args:
         elements: List of DomElement objects from extraction.
                   Can be None or empty list.
+        detailed: Compute unique_tags, tag_distribution and min/max text length.
+                  Pass False when only the quality level and warnings
+                  are needed; those metrics are then left at zero/empty.
 
     Returns:
         QualityAssessmentResult with quality level, warnings, and metrics.
 
-    Performance: O(n) - single pass through elements.
+    Performance: O(n) - one column pass per attribute, reduced with builtins.
     """
     # Handle None input
     if elements is None:
@@ -127,154 +211,89 @@ def assess_extraction_quality(
 
     # === Element Count Analysis ===
     if element_count == 0:
-        warnings.append(QualityWarning(
-            code="NO_ELEMENTS",
-            message="No DOM elements were extracted from the page.",
-            suggestion=(
-                "Verify the page has loaded completely and contains "
-                "the expected content. Try testing with a simple URL like "
-                f"{VERIFICATION_URLS[0]} to confirm extraction is working."
-            ),
-        ))
-        # Return empty metrics for zero elements
-        empty_metrics = QualityMetricsData(
-            element_count=0,
-            visible_count=0,
-            hidden_count=0,
-            heading_count=0,
-            unique_tag_count=0,
-            visible_ratio=0.0,
-            hidden_ratio=0.0,
-            unique_tags=[],
-            has_headings=False,
-            tag_distribution={},
-            total_text_length=0,
-            avg_text_length=0.0,
-            min_text_length=0,
-            max_text_length=0,
-        )
+        warnings.append(_WARN_NO_ELEMENTS.model_copy())
+        # Field defaults already describe an empty extraction
         return QualityAssessmentResult(
             quality=ExtractionQuality.EMPTY,
             warnings=warnings,
-            metrics=empty_metrics,
+            metrics=QualityMetricsData(),
         )
 
-    if element_count <= THRESHOLD_POOR:
-        warnings.append(QualityWarning(
-            code="LOW_ELEMENT_COUNT",
-            message=f"Only {element_count} element(s) extracted, which is very sparse.",
-            suggestion=(
-                "Check if the page has finished loading, or expand the extraction "
-                f"selectors. Test with {VERIFICATION_URLS[0]} to verify setup."
-            ),
-        ))
-
-    # === Tag Analysis (single pass) ===
-    unique_tags_set: set[str] = set()
-    tag_distribution: dict[str, int] = {}
-    has_heading = False
-    heading_count = 0
-    visible_count = 0
-    total_text_length = 0
-    min_text_length = float("inf")
-    max_text_length = 0
-
-    for element in elements:
-        # Safe attribute access
-        tag_name = getattr(element, "tag_name", "") or ""
-        tag_lower = tag_name.lower()
-        unique_tags_set.add(tag_lower)
-
-        # Track tag distribution
-        tag_distribution[tag_lower] = tag_distribution.get(tag_lower, 0) + 1
-
-        if tag_lower in HEADING_TAGS:
-            has_heading = True
-            heading_count += 1
-
-        is_visible = getattr(element, "is_visible", True)
-        if is_visible:
-            visible_count += 1
-
-        text = getattr(element, "text", "") or ""
-        text_len = len(text)
-        total_text_length += text_len
-        if text_len < min_text_length:
-            min_text_length = text_len
-        if text_len > max_text_length:
-            max_text_length = text_len
-
-    # Handle case where min_text_length was never updated (shouldn't happen with elements)
-    if min_text_length == float("inf"):
-        min_text_length = 0
+    # Every element_count threshold decision, evaluated once
+    is_poor = element_count <= THRESHOLD_POOR
+    is_low = element_count <= THRESHOLD_LOW
+    is_good_eligible = element_count >= THRESHOLD_GOOD
+    needs_heading_check = element_count >= THRESHOLD_HEADING_MIN
+
+    if is_poor:
+        warnings.append(_WARN_LOW_ELEMENT_COUNT[element_count].model_copy())
+
+    # === Column extraction ===
+    # Read each attribute into its own list once and reduce with C-level
+    # builtins, rather than updating several accumulators per element.
+    # tag_name and text are required str fields on DomElement, so no None guards.
+    tags = [element.tag_name for element in elements]
+    text_lengths = [len(element.text) for element in elements]
+    visible_count = sum([element.is_visible for element in elements])
+
+    # === Tag Analysis ===
+    # Counter(iterable) counts in C via _count_elements. Count raw tag names
+    # first and fold case over the few distinct keys, so .lower() runs once
+    # per distinct tag rather than once per element.
+    tag_counts: Counter[str] = Counter()
+    for tag, count in Counter(tags).items():
+        tag_counts[tag.lower()] += count
+    heading_count = sum(tag_counts[tag] for tag in HEADING_TAGS)
+    has_heading = heading_count > 0
+
+    # === Text statistics ===
+    total_text_length = sum(text_lengths)
+    if detailed:
+        min_text_length = min(text_lengths)
+        max_text_length = max(text_lengths)
+    else:
+        min_text_length = max_text_length = 0
 
     # === Compute derived metrics ===
+    unique_tags_set = tag_counts.keys()
+    tag_distribution = dict(tag_counts) if detailed else {}
     hidden_count = element_count - visible_count
     tag_diversity = len(unique_tags_set)
+    # True division: multiplying by a reciprocal is not exact and can drop
+    # an average just below a threshold (249 x 10 chars -> 9.999...)
     visible_ratio = visible_count / element_count
     hidden_ratio = hidden_count / element_count
     avg_text_length = total_text_length / element_count
 
     # === Tag Diversity Check ===
-    if tag_diversity < THRESHOLD_TAG_DIVERSITY and element_count >= THRESHOLD_GOOD:
-        warnings.append(QualityWarning(
-            code="LOW_TAG_DIVERSITY",
-            message=f"Only {tag_diversity} unique tag type(s) found "
+    if is_good_eligible and tag_diversity < THRESHOLD_TAG_DIVERSITY:
+        warnings.append(_WARN_LOW_TAG_DIVERSITY.model_copy(update={
+            "message": f"Only {tag_diversity} unique tag type(s) found "
             f"among {element_count} elements.",
-            suggestion=(
-                "Consider expanding extraction selectors to capture a broader "
-                "variety of content (headings, paragraphs, links, etc.)."
-            ),
-        ))
+        }))
 
     # === Heading Check ===
-    if not has_heading and element_count >= THRESHOLD_LOW // 2:
-        warnings.append(QualityWarning(
-            code="NO_HEADINGS",
-            message="No heading elements (h1-h6) found in the extraction.",
-            suggestion=(
-                "Heading elements often contain important structural information. "
-                "Consider adding h1-h6 to your extraction selectors."
-            ),
-        ))
+    if needs_heading_check and not has_heading:
+        warnings.append(_WARN_NO_HEADINGS.model_copy())
 
     # === Hidden Elements Check ===
     if hidden_ratio > THRESHOLD_HIDDEN_RATIO:
-        warnings.append(QualityWarning(
-            code="MANY_HIDDEN",
-            message=f"{int(hidden_ratio * 100)}% of elements are hidden "
+        warnings.append(_WARN_MANY_HIDDEN.model_copy(update={
+            "message": f"{hidden_count * 100 // element_count}% of elements are hidden "
             f"({hidden_count}/{element_count}).",
-            suggestion=(
-                "Many hidden elements may indicate the page hasn't rendered fully "
-                "or content is behind user interaction. Consider adding wait time "
-                "or check for dynamic content loading."
-            ),
-        ))
+        }))
 
     # === Text Length Check ===
     if avg_text_length < THRESHOLD_MIN_TEXT_LENGTH:
-        warnings.append(QualityWarning(
-            code="MINIMAL_TEXT",
-            message=f"Average text length is only "
+        warnings.append(_WARN_MINIMAL_TEXT.model_copy(update={
+            "message": f"Average text length is only "
             f"{avg_text_length:.1f} characters per element.",
-            suggestion=(
-                "Elements have minimal text content. This may indicate extraction "
-                "of UI elements rather than content, or the page may have limited text."
-            ),
-        ))
+        }))
 
     # === Determine Quality Level ===
-    if element_count <= THRESHOLD_POOR:
-        quality = ExtractionQuality.POOR
-    elif element_count <= THRESHOLD_LOW:
-        quality = ExtractionQuality.LOW
-    else:
-        # 21+ elements: Check for GOOD eligibility
-        # Requires diversity AND headings
-        if tag_diversity >= THRESHOLD_TAG_DIVERSITY and has_heading:
-            quality = ExtractionQuality.GOOD
-        else:
-            quality = ExtractionQuality.LOW
+    # GOOD requires more than THRESHOLD_LOW elements, diversity AND headings
+    diverse_with_headings = tag_diversity >= THRESHOLD_TAG_DIVERSITY and has_heading
+    quality = _QUALITY_TABLE[(is_poor, is_low, diverse_with_headings)]
 
     # === Build metrics dataclass ===
     metrics = QualityMetricsData(
@@ -285,12 +304,12 @@ def assess_extraction_quality(
         unique_tag_count=tag_diversity,
         visible_ratio=visible_ratio,
         hidden_ratio=hidden_ratio,
-        unique_tags=sorted(unique_tags_set),
+        unique_tags=list(unique_tags_set) if detailed else [],
         has_headings=has_heading,
         tag_distribution=tag_distribution,
         total_text_length=total_text_length,
         avg_text_length=avg_text_length,
-        min_text_length=int(min_text_length),
+        min_text_length=min_text_length,
         max_text_length=max_text_length,
     )
 
@@ -357,6 +376,47 @@ VISION_MODEL_CONSTRAINTS: dict[str, dict[str, float]] = {
     "qwen-vl-max": {"max_pixels": 4_096 * 4_096, "max_aspect_ratio": 6.0},
 }
 
+
+def _build_model_table() -> dict[str, tuple[int, float, float]]:
+    """Flatten VISION_MODEL_LIMITS and VISION_MODEL_CONSTRAINTS per model.
+
+    Returns model -> (max_dimension, max_pixels, max_aspect_ratio) so a
+    compatibility check is a single lookup and tuple unpack.
+    """
+    table = {}
+    for model, limit in VISION_MODEL_LIMITS.items():
+        constraints = VISION_MODEL_CONSTRAINTS.get(model, {})
+        table[model] = (
+            limit,
+            constraints.get("max_pixels", float("inf")),
+            constraints.get("max_aspect_ratio", float("inf")),
+        )
+    return table
+
+
+# Rebuilt by clear_vision_caches() if the source dicts change at runtime
+_MODEL_TABLE: dict[str, tuple[int, float, float]] = _build_model_table()
+_UNKNOWN_MODEL_ENTRY = (0, float("inf"), float("inf"))
+
+# Display names used in tiling_reason, in reported order
+_MODEL_DISPLAY_NAMES: Final = (
+    ("claude", "Claude"),
+    ("gemini", "Gemini"),
+    ("gpt4v", "GPT-4V"),
+    ("qwen-vl-max", "Qwen-VL"),
+)
+
+
+def _build_model_labels() -> tuple[str, ...]:
+    """Format the "Name (limitpx)" label for each model in _MODEL_DISPLAY_NAMES."""
+    return tuple(
+        f"{name} ({VISION_MODEL_LIMITS[model]}px)" for model, name in _MODEL_DISPLAY_NAMES
+    )
+
+
+# Rebuilt by clear_vision_caches() alongside _MODEL_TABLE
+_MODEL_LABELS: tuple[str, ...] = _build_model_labels()
+
 # Default Vision AI model (configurable via VISION_DEFAULT_MODEL env var or JSON config)
 def _get_default_model() -> str:
     """Get default model from env var, JSON config, or use 'claude'."""
@@ -385,17 +445,22 @@ def _get_tile_overlap() -> float:
 VISION_TILE_OVERLAP_PERCENT: float = _get_tile_overlap()
 
 
-def _calculate_resize_impact(max_dimension: int, model_limit: int) -> float:
-    """Calculate resize impact percentage for a model.
+def _calculate_resize_impacts(max_dimension: int) -> dict[str, float]:
+    """Calculate resize impact percentage for every model in one pass.
 
     Formula: (max(width, height) - limit) / max(width, height) * 100
-    Returns 0.0 if no resize is needed.
+    A model's impact is 0.0 if no resize is needed.
     """
-    if max_dimension <= model_limit:
-        return 0.0
-    return ((max_dimension - model_limit) / max_dimension) * 100
+    return {
+        model: (
+            0.0 if max_dimension <= limit
+            else ((max_dimension - limit) / max_dimension) * 100
+        )
+        for model, (limit, _, _) in _MODEL_TABLE.items()
+    }
 
 
+@functools.lru_cache(maxsize=4096)
 def _calculate_recommended_dimensions(
     width: int, height: int, target_limit: int
 ) -> tuple[Optional[int], Optional[int]]:
@@ -412,6 +477,7 @@ def _calculate_recommended_dimensions(
     return int(width * scale), int(height * scale)
 
 
+@functools.lru_cache(maxsize=4096)
 def _check_model_compatibility(
     width: int, height: int, model: str
 ) -> tuple[bool, Optional[str]]:
@@ -419,17 +485,14 @@ def _check_model_compatibility(
 
     Returns (is_compatible, reason_if_not_compatible).
     """
+    limit, max_pixels, max_aspect = _MODEL_TABLE.get(model, _UNKNOWN_MODEL_ENTRY)
     max_dimension = max(width, height)
-    limit = VISION_MODEL_LIMITS.get(model, 0)
 
     if max_dimension > limit:
         return False, f"max dimension {max_dimension}px exceeds {model} limit of {limit}px"
 
-    constraints = VISION_MODEL_CONSTRAINTS.get(model, {})
-
     # Check max_pixels constraint
     total_pixels = width * height
-    max_pixels = constraints.get("max_pixels", float("inf"))
     if total_pixels > max_pixels:
         return False, (
             f"total pixels ({total_pixels:,}) exceeds "
@@ -437,42 +500,33 @@ def _check_model_compatibility(
         )
 
     # Check aspect ratio constraint
-    aspect_ratio = max(width, height) / min(width, height) if min(width, height) > 0 else 1.0
-    max_aspect = constraints.get("max_aspect_ratio", float("inf"))
+    min_dimension = min(width, height)
+    aspect_ratio = max_dimension / min_dimension if min_dimension > 0 else 1.0
     if aspect_ratio > max_aspect:
         return False, f"aspect ratio ({aspect_ratio:.2f}) exceeds {model} max ({max_aspect:.1f})"
 
     return True, None
 
 
-def generate_vision_hints(
+@functools.lru_cache(maxsize=256)
+def _compute_vision_hints(
     image_width: int,
     image_height: int,
-    image_size_bytes: int,
-    target_model: Optional[str] = None,
-    document_width: Optional[int] = None,
-    document_height: Optional[int] = None,
-) -> "VisionAIHints":
-    """Generate Vision AI optimization hints for an image.
-
-    Calculates compatibility with various Vision AI models based on
-    image dimensions, and provides resize impact estimation and
-    tiling recommendations.
-
-    Args:
-        image_width: Image width in pixels
-        image_height: Image height in pixels
-        image_size_bytes: Image file size in bytes
-        target_model: Optional specific model to optimize for.
-                      If None, uses VISION_DEFAULT_MODEL env var or 'claude'.
-        document_width: Full document width for full_page screenshots
-        document_height: Full document height for full_page screenshots
-
-    Returns:
-        VisionAIHints with compatibility flags, resize factors, and
-        tiling recommendations.
+    target_model: Optional[str],
+    document_width: Optional[int],
+    document_height: Optional[int],
+) -> tuple[tuple[str, Any], ...]:
+    """Compute the dimension-dependent VisionAIHints fields.
+
+    The result depends only on the dimensions and target model, so it is
+    memoized; screenshots taken at a fixed viewport hit the cache. Fields
+    are returned as immutable (name, value) pairs, with suggested_tile_size
+    as a (width, height) tuple, so cached values cannot be mutated.
     """
-    from app.models import VisionAIHints
+    # Bind module-level settings to locals once (LOAD_FAST instead of LOAD_GLOBAL).
+    # Not frozen at import: clear_vision_caches() supports runtime overrides.
+    limits = VISION_MODEL_LIMITS
+    overlap_percent = VISION_TILE_OVERLAP_PERCENT
 
     # Use document dimensions for tiling if available (full_page screenshots)
     tiling_width = document_width if document_width else image_width
@@ -482,20 +536,25 @@ def generate_vision_hints(
     max_tiling_dimension = max(tiling_width, tiling_height)
 
     # Calculate compatibility for each model (using image dimensions)
-    claude_compat, claude_reason = _check_model_compatibility(image_width, image_height, "claude")
-    gemini_compat, gemini_reason = _check_model_compatibility(image_width, image_height, "gemini")
-    gpt4v_compat, gpt4v_reason = _check_model_compatibility(image_width, image_height, "gpt4v")
-    qwen_compat, qwen_reason = _check_model_compatibility(image_width, image_height, "qwen-vl-max")
+    compat = {
+        model: _check_model_compatibility(image_width, image_height, model)[0]
+        for model in _MODEL_TABLE
+    }
+    claude_compat = compat["claude"]
+    gemini_compat = compat["gemini"]
+    gpt4v_compat = compat["gpt4v"]
+    qwen_compat = compat["qwen-vl-max"]
 
     # Calculate per-model resize impact percentages
-    resize_impact_claude = _calculate_resize_impact(max_dimension, VISION_MODEL_LIMITS["claude"])
-    resize_impact_gemini = _calculate_resize_impact(max_dimension, VISION_MODEL_LIMITS["gemini"])
-    resize_impact_gpt4v = _calculate_resize_impact(max_dimension, VISION_MODEL_LIMITS["gpt4v"])
-    resize_impact_qwen = _calculate_resize_impact(max_dimension, VISION_MODEL_LIMITS["qwen-vl-max"])
+    resize_impacts = _calculate_resize_impacts(max_dimension)
+    resize_impact_claude = resize_impacts["claude"]
+    resize_impact_gemini = resize_impacts["gemini"]
+    resize_impact_gpt4v = resize_impacts["gpt4v"]
+    resize_impact_qwen = resize_impacts["qwen-vl-max"]
 
     # Determine target model for resize calculations
-    effective_target = target_model if target_model in VISION_MODEL_LIMITS else VISION_DEFAULT_MODEL
-    target_limit = VISION_MODEL_LIMITS.get(effective_target, VISION_MODEL_LIMITS["claude"])
+    effective_target = target_model if target_model in limits else VISION_DEFAULT_MODEL
+    target_limit = limits.get(effective_target, limits["claude"])
 
     # Calculate resize factor and recommended dimensions
     if max_dimension <= target_limit:
@@ -518,7 +577,7 @@ def generate_vision_hints(
         tiling_recommended = True
         # Calculate suggested tile count based on target model limit
         # Account for overlap
-        overlap_factor = 1.0 - (VISION_TILE_OVERLAP_PERCENT / 100.0)
+        overlap_factor = 1.0 - (overlap_percent / 100.0)
         effective_tile_dim = int(target_limit * overlap_factor)
 
         tiles_x = max(1, (tiling_width + effective_tile_dim - 1) // effective_tile_dim)
@@ -528,7 +587,7 @@ def generate_vision_hints(
         # Calculate tile size (before overlap)
         tile_width = min(target_limit, (tiling_width + tiles_x - 1) // tiles_x)
         tile_height = min(target_limit, (tiling_height + tiles_y - 1) // tiles_y)
-        suggested_tile_size = {"width": tile_width, "height": tile_height}
+        suggested_tile_size = (tile_width, tile_height)
 
         # Build specific reasoning message
         dimension_info = f"{tiling_width}x{tiling_height}"
@@ -538,28 +597,23 @@ def generate_vision_hints(
             dimension_info = f"image size {dimension_info}"
 
         # Determine which thresholds are exceeded
-        exceeded_models = []
-        if not claude_compat:
-            exceeded_models.append(f"Claude ({VISION_MODEL_LIMITS['claude']}px)")
-        if not gemini_compat:
-            exceeded_models.append(f"Gemini ({VISION_MODEL_LIMITS['gemini']}px)")
-        if not gpt4v_compat:
-            exceeded_models.append(f"GPT-4V ({VISION_MODEL_LIMITS['gpt4v']}px)")
-        if not qwen_compat:
-            exceeded_models.append(f"Qwen-VL ({VISION_MODEL_LIMITS['qwen-vl-max']}px)")
+        compats = (claude_compat, gemini_compat, gpt4v_compat, qwen_compat)
+        exceeded_models = [
+            label for ok, label in zip(compats, _MODEL_LABELS) if not ok
+        ]
 
         if exceeded_models:
             models_str = ", ".join(exceeded_models)
             tiling_reason = (
                 f"The {dimension_info} exceeds limits for: {models_str}. "
                 f"Recommended {tiles_x}x{tiles_y} grid ({suggested_tile_count} tiles) "
-                f"with {VISION_TILE_OVERLAP_PERCENT:.0f}% overlap for {effective_target}."
+                f"with {overlap_percent:.0f}% overlap for {effective_target}."
             )
         else:
             tiling_reason = (
                 f"The {dimension_info} exceeds {effective_target} limit ({target_limit}px). "
                 f"Recommended {tiles_x}x{tiles_y} grid ({suggested_tile_count} tiles) "
-                f"with {VISION_TILE_OVERLAP_PERCENT:.0f}% overlap."
+                f"with {overlap_percent:.0f}% overlap."
             )
     else:
         tiling_recommended = False
@@ -567,27 +621,80 @@ def generate_vision_hints(
         suggested_tile_size = None
         tiling_reason = None
 
-    return VisionAIHints(
-        image_width=image_width,
-        image_height=image_height,
-        image_size_bytes=image_size_bytes,
-        document_width=document_width,
-        document_height=document_height,
-        claude_compatible=claude_compat,
-        gemini_compatible=gemini_compat,
-        gpt4v_compatible=gpt4v_compat,
-        qwen_compatible=qwen_compat,
-        estimated_resize_factor=estimated_resize_factor,
-        coordinate_accuracy=coordinate_accuracy,
-        resize_impact_claude=resize_impact_claude,
-        resize_impact_gemini=resize_impact_gemini,
-        resize_impact_gpt4v=resize_impact_gpt4v,
-        resize_impact_qwen=resize_impact_qwen,
-        recommended_width=recommended_width,
-        recommended_height=recommended_height,
-        tiling_recommended=tiling_recommended,
-        suggested_tile_count=suggested_tile_count,
-        suggested_tile_size=suggested_tile_size,
-        tile_overlap_percent=VISION_TILE_OVERLAP_PERCENT,
-        tiling_reason=tiling_reason,
+    return (
+        ("image_width", image_width),
+        ("image_height", image_height),
+        ("document_width", document_width),
+        ("document_height", document_height),
+        ("claude_compatible", claude_compat),
+        ("gemini_compatible", gemini_compat),
+        ("gpt4v_compatible", gpt4v_compat),
+        ("qwen_compatible", qwen_compat),
+        ("estimated_resize_factor", estimated_resize_factor),
+        ("coordinate_accuracy", coordinate_accuracy),
+        ("resize_impact_claude", resize_impact_claude),
+        ("resize_impact_gemini", resize_impact_gemini),
+        ("resize_impact_gpt4v", resize_impact_gpt4v),
+        ("resize_impact_qwen", resize_impact_qwen),
+        ("recommended_width", recommended_width),
+        ("recommended_height", recommended_height),
+        ("tiling_recommended", tiling_recommended),
+        ("suggested_tile_count", suggested_tile_count),
+        ("suggested_tile_size", suggested_tile_size),
+        ("tile_overlap_percent", overlap_percent),
+        ("tiling_reason", tiling_reason),
     )
+
+
+def clear_vision_caches() -> None:
+    """Clear memoized vision hint computations.
+
+    Call after changing VISION_MODEL_LIMITS, VISION_MODEL_CONSTRAINTS or
+    VISION_TILE_OVERLAP_PERCENT at runtime (e.g. in tests).
+    """
+    global _MODEL_LABELS
+    _MODEL_TABLE.clear()
+    _MODEL_TABLE.update(_build_model_table())
+    _MODEL_LABELS = _build_model_labels()
+    _calculate_recommended_dimensions.cache_clear()
+    _check_model_compatibility.cache_clear()
+    _compute_vision_hints.cache_clear()
+
+
+def generate_vision_hints(
+    image_width: int,
+    image_height: int,
+    image_size_bytes: int,
+    target_model: Optional[str] = None,
+    document_width: Optional[int] = None,
+    document_height: Optional[int] = None,
+) -> VisionAIHints:
+    """Generate Vision AI optimization hints for an image.
+
+    Calculates compatibility with various Vision AI models based on
+    image dimensions, and provides resize impact estimation and
+    tiling recommendations.
+
+    Args:
+        image_width: Image width in pixels
+        image_height: Image height in pixels
+        image_size_bytes: Image file size in bytes
+        target_model: Optional specific model to optimize for.
+                      If None, uses VISION_DEFAULT_MODEL env var or 'claude'.
+        document_width: Full document width for full_page screenshots
+        document_height: Full document height for full_page screenshots
+
+    Returns:
+        VisionAIHints with compatibility flags, resize factors, and
+        tiling recommendations.
+    """
+    fields = dict(
+        _compute_vision_hints(
+            image_width, image_height, target_model, document_width, document_height
+        )
+    )
+    tile_size = fields["suggested_tile_size"]
+    if tile_size is not None:
+        fields["suggested_tile_size"] = {"width": tile_size[0], "height": tile_size[1]}
+
+    return VisionAIHints(image_size_bytes=image_size_bytes, **fields)
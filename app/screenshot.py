@@ -1,19 +1,36 @@
 """Screenshot service using Playwright with Chromium."""
 
 import asyncio
+import base64
+import functools
 import json
+import os
+import socket
+import sys
+import tempfile
 import time
-from contextlib import asynccontextmanager
-from typing import Any, Optional
+import weakref
+from contextlib import asynccontextmanager, suppress
+from typing import Any, Awaitable, Iterable, Optional, Sequence, TypeVar
 from urllib.parse import urlparse
 
-from playwright.async_api import Browser, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    CDPSession,
+    Page,
+    Request,
+    async_playwright,
+)
 
 from .dom_extraction import get_extraction_script
 from .models import (
     Cookie,
     CoordinateMapping,
+    DomExtractionOptions,
+    DomExtractionResult,
     ImageFormat,
+    MultipartTile,
     ScreenshotRequest,
     ScreenshotType,
     Tile,
@@ -21,12 +38,48 @@ from .models import (
     TiledScreenshotRequest,
     TiledScreenshotResponse,
 )
-from .tiling import apply_vision_preset, calculate_per_tile_wait, calculate_tile_grid
+from .tiling import (
+    TileBounds,
+    apply_vision_preset,
+    calculate_per_tile_wait,
+    calculate_tile_grid,
+    split_tile_shards,
+)
+
+# Exclusive file locks for SHARE_BROWSER startup, per platform
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(lock_file) -> None:
+        lock_file.seek(0)
+        while True:
+            try:
+                # LK_LOCK gives up with OSError after ~10 s, so keep waiting
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(lock_file) -> None:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(lock_file) -> None:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
 
+    def _unlock_file(lock_file) -> None:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
 
+
+@functools.lru_cache(maxsize=1024)
 def extract_domain_from_url(url: str) -> Optional[str]:
     """Extract the domain/hostname from a URL.
 
+    Memoized: cookie preparation and retries parse the same URLs repeatedly.
+
     Args:
         url: The URL to extract the domain from
 
@@ -40,9 +93,12 @@ def extract_domain_from_url(url: str) -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_origin(url: str) -> str:
     """Extract the origin (scheme + host + port) from a URL.
 
+    Memoized like extract_domain_from_url().
+
     Used for storage injection - localStorage/sessionStorage are origin-scoped.
     Example: "https://example.com:8080/path" -> "https://example.com:8080"
 
@@ -79,6 +135,10 @@ def build_storage_injection_script(storage_type: str, values: dict[str, Any]) ->
     Values are JSON-stringified if they are not strings. This matches how
     frameworks like Wasp expect localStorage values to be stored.
 
+    Keys and values are emitted as JSON string literals, which are valid
+    JavaScript string literals. The default ASCII escaping also covers
+    newlines, U+2028/U+2029 and unpaired surrogates.
+
     Args:
         storage_type: Either "localStorage" or "sessionStorage"
         values: Dictionary of key-value pairs to inject
@@ -86,18 +146,163 @@ def build_storage_injection_script(storage_type: str, values: dict[str, Any]) ->
     Returns:
         JavaScript code string to execute via page.evaluate()
     """
-    lines = []
-    for key, value in values.items():
-        # Stringify non-string values (objects, arrays, numbers, booleans)
-        if isinstance(value, str):
-            serialized = value
-        else:
-            serialized = json.dumps(value)
-        # Escape for JavaScript string literal
-        escaped_key = key.replace("\\", "\\\\").replace("'", "\\'")
-        escaped_value = serialized.replace("\\", "\\\\").replace("'", "\\'")
-        lines.append(f"{storage_type}.setItem('{escaped_key}', '{escaped_value}');")
-    return "\n".join(lines)
+    return "\n".join(
+        f"{storage_type}.setItem({json.dumps(key)}, "
+        f"{json.dumps(value if isinstance(value, str) else json.dumps(value))});"
+        for key, value in values.items()
+    )
+
+
+def build_request_storage_script(
+    request: ScreenshotRequest | TiledScreenshotRequest,
+) -> str:
+    """Build one script injecting both of a request's storage types.
+
+    Lets localStorage and sessionStorage be injected with a single
+    page.evaluate() round-trip.
+
+    Args:
+        request: Request with localStorage and/or sessionStorage values
+
+    Returns:
+        JavaScript code string to execute via page.evaluate()
+    """
+    scripts = []
+    if request.localStorage:
+        scripts.append(
+            build_storage_injection_script("localStorage", request.localStorage)
+        )
+    if request.sessionStorage:
+        scripts.append(
+            build_storage_injection_script("sessionStorage", request.sessionStorage)
+        )
+    return "\n".join(scripts)
+
+
+# sessionStorage key marking a tab whose request storage was injected
+STORAGE_INJECTED_SENTINEL = "__chromium_screenshots_storage_injected__"
+
+
+def build_storage_init_script(
+    request: ScreenshotRequest | TiledScreenshotRequest, origin: str
+) -> str:
+    """Build an init script injecting a request's storage into its origin.
+
+    Registered with context.add_init_script(), it runs before any page
+    script in every top-level document of the context, so storage is in
+    place for the first navigation without a separate hop to the origin.
+    Documents from other origins are left alone.
+
+    The values are written once per tab: a STORAGE_INJECTED_SENTINEL
+    entry in sessionStorage makes later loads of the origin (redirects,
+    reloads) keep whatever the page has written since.
+
+    Args:
+        request: Request with localStorage and/or sessionStorage values
+        origin: Origin of the request URL (see extract_origin)
+
+    Returns:
+        JavaScript code string for context.add_init_script()
+    """
+    sentinel = json.dumps(STORAGE_INJECTED_SENTINEL)
+    return (
+        f"if (window === window.top && location.origin === {json.dumps(origin)}\n"
+        f"    && sessionStorage.getItem({sentinel}) === null) {{\n"
+        f"sessionStorage.setItem({sentinel}, \"1\");\n"
+        f"{build_request_storage_script(request)}\n"
+        "}"
+    )
+
+
+def build_extraction_expression(
+    options: DomExtractionOptions,
+    tiles: Optional[Sequence[TileBounds]] = None,
+) -> str:
+    """Build the page.evaluate() expression that runs DOM extraction.
+
+    The script text and serialized options do not change between tiles, so
+    callers build the expression once per capture and reuse it.
+
+    Args:
+        options: DOM extraction options from the request
+        tiles: Tiles of a tiled capture. When given, the result is moved to
+            full-page coordinates and split per tile in the browser by
+            binElementsByTile()
+
+    Returns:
+        JavaScript expression defining the helpers and calling
+        extractDomElements() with the given options
+    """
+    js_options = {
+        "selectors": options.selectors,
+        "includeHidden": options.include_hidden,
+        "minTextLength": options.min_text_length,
+        "maxElements": options.max_elements,
+    }
+    call = f"extractDomElements({json.dumps(js_options)})"
+    if tiles is not None:
+        js_tiles = [
+            {
+                "index": bounds.index,
+                "x": bounds.x,
+                "y": bounds.y,
+                "width": bounds.width,
+                "height": bounds.height,
+            }
+            for bounds in tiles
+        ]
+        call = f"binElementsByTile({call}, {json.dumps(js_tiles)})"
+    return f"""
+    {_EXTRACTION_SCRIPT}
+    {call};
+    """
+
+
+def build_tile_dom_extraction(
+    tiled_dom: dict[str, Any], bounds: TileBounds, position: int
+) -> dict[str, Any]:
+    """Build one tile's DOM extraction result from a binned extraction.
+
+    The tile's elements are taken as returned: binElementsByTile() already
+    selected those overlapping the tile (touching edges count) plus the
+    fixed/sticky elements, and set their tile_index, tile_relative_rect and
+    full-page rect.
+
+    Args:
+        tiled_dom: Result of binElementsByTile()
+        bounds: Tile position within the full page
+        position: Position of the tile in the list given to
+            binElementsByTile()
+
+    Returns:
+        Extraction result for the tile, with a low_element_count_per_tile
+        warning below 5 elements
+    """
+    elements = tiled_dom["tiles"][position]
+    dom_extraction = {
+        "elements": elements,
+        "viewport": tiled_dom["viewport"],
+        "extraction_time_ms": tiled_dom["extraction_time_ms"],
+        "element_count": len(elements),
+    }
+
+    # Add low element warning if fewer than 5 elements in tile
+    elem_count = len(elements)
+    if elem_count < 5:
+        dom_extraction["warnings"] = [{
+            "code": "low_element_count_per_tile",
+            "message": (
+                f"Tile {bounds.index} has only {elem_count} elements "
+                f"(threshold: 5)"
+            ),
+            "severity": "info",
+            "suggestion": (
+                "Consider using different selectors or checking "
+                "if page content loaded correctly"
+            ),
+        }]
+
+    return dom_extraction
 
 
 def prepare_cookies_for_playwright(
@@ -158,6 +363,188 @@ AD_DOMAINS = [
     "tracking.",
 ]
 
+# Browser launch flags and the user agent given to every context
+_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-extensions",
+)
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+
+# Static DOM extraction helpers, fetched once at import
+_EXTRACTION_SCRIPT = get_extraction_script()
+
+# Browser contexts and their warm page are pooled per (width, height,
+# color_scheme) for requests that bring no cookies or storage. Idle entries
+# beyond the cap are closed, and an entry is retired after
+# BROWSER_POOL_RECYCLE_AFTER captures.
+CONTEXT_POOL_MAX_IDLE = 4
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+ContextKey = tuple[int, int, str]
+
+
+def keeps_pooled_http_cache() -> bool:
+    """Check whether pooled contexts keep their HTTP cache between captures.
+
+    Off by default: a cached response may have been fetched with another
+    request's cookies, and cache timing reveals previously visited URLs.
+    Set CONTEXT_POOL_KEEP_HTTP_CACHE=1 only when every request may see
+    every other request's responses.
+    """
+    return os.getenv("CONTEXT_POOL_KEEP_HTTP_CACHE") == "1"
+
+
+T = TypeVar("T")
+
+# Pages capturing tiles of one tiled screenshot in parallel. Extra pages
+# load the URL again, so content may differ between shards; the default
+# of 1 keeps every tile on the originally loaded page.
+TILE_CAPTURE_CONCURRENCY_DEFAULT = 1
+TILE_CAPTURE_CONCURRENCY_MAX = 8
+
+def get_tile_capture_concurrency() -> int:
+    """Get the number of pages capturing tiles of one request in parallel.
+
+    Returns:
+        TILE_CAPTURE_CONCURRENCY (default 1), clamped to
+        1..TILE_CAPTURE_CONCURRENCY_MAX
+    """
+    value = int(os.getenv("TILE_CAPTURE_CONCURRENCY", TILE_CAPTURE_CONCURRENCY_DEFAULT))
+    return max(1, min(value, TILE_CAPTURE_CONCURRENCY_MAX))
+
+
+# With SHARE_BROWSER=1, workers share one Chromium: the first to start
+# launches it with a CDP port on a random localhost port, recorded in a
+# per-user state directory, and the rest connect to it.
+def is_browser_shared() -> bool:
+    """Check whether workers share one browser (SHARE_BROWSER=1)."""
+    return os.getenv("SHARE_BROWSER") == "1"
+
+
+def get_shared_browser_dir() -> str:
+    """Get the per-user directory holding the shared browser's lock and port.
+
+    Created with mode 0700 under XDG_RUNTIME_DIR, or the temp directory
+    when that is unset. On POSIX, a directory owned by another user or
+    open to group/others is refused, so no one else can plant or read the
+    recorded port.
+
+    Raises:
+        PermissionError: If the directory is not private to this user
+    """
+    base = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    path = os.path.join(base, f"chromium-screenshots-{user}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid"):
+        st = os.lstat(path)
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise PermissionError(f"Shared browser directory is not private: {path}")
+    return path
+
+
+def _pick_free_port() -> int:
+    """Ask the OS for a free localhost port for the shared browser's CDP."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _read_port_file(path: str) -> Optional[int]:
+    """Read the recorded CDP port, or None if absent or unreadable."""
+    try:
+        with open(path) as port_file:
+            return int(port_file.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_port_file(path: str, port: int) -> None:
+    """Record the CDP port in a file readable by this user only."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as port_file:
+        port_file.write(str(port))
+
+
+# AD_DOMAINS as CDP Network.setBlockedURLs wildcards ("*" matches any run of
+# characters, so each pattern is a substring match on the request URL)
+BLOCKED_URL_PATTERNS = [f"*{domain}*" for domain in AD_DOMAINS]
+
+
+async def block_ads(context: BrowserContext, page: Page) -> CDPSession:
+    """Block AD_DOMAINS requests for a page inside Chromium's network stack.
+
+    Uses a CDP session instead of context.route(), so blocked and allowed
+    requests alike are handled by the browser without a Python callback.
+    Must be called before the page navigates.
+
+    Args:
+        context: Browser context that owns the page
+        page: Page to block ad requests for
+
+    Returns:
+        The CDP session holding the block list; detaching it lifts the block
+    """
+    cdp = await context.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return cdp
+
+
+async def gather_or_cancel(*coros: Awaitable[T]) -> list[T]:
+    """Run coroutines concurrently; if one fails, cancel and await the rest.
+
+    Unlike a bare asyncio.gather(), no sibling keeps running after a
+    failure, so callers can tear down shared resources (e.g. the browser
+    context of a tiled capture) without the siblings hitting closed pages.
+    Unlike a TaskGroup, the first error is re-raised as is rather than
+    wrapped in an ExceptionGroup.
+
+    Args:
+        coros: Coroutines to run
+
+    Returns:
+        Their results, in argument order
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def track_navigation_origins(context: BrowserContext) -> set[str]:
+    """Record the http(s) origin of every navigation in a browser context.
+
+    Covers main-frame and iframe navigations of all the context's pages,
+    including each redirect hop, so origins no longer loaded in any frame
+    when the capture ends are still known.
+
+    Args:
+        context: Browser context to watch
+
+    Returns:
+        Set of origins, updated as navigation requests are issued
+    """
+    origins: set[str] = set()
+
+    def record(request: Request) -> None:
+        url = request.url
+        if request.is_navigation_request() and url.startswith(("http://", "https://")):
+            origins.add(extract_origin(url))
+
+    context.on("request", record)
+    return origins
+
 
 class ScreenshotService:
     """Service for capturing screenshots using Chromium via Playwright."""
@@ -165,7 +552,20 @@ class ScreenshotService:
     def __init__(self):
         self._playwright = None
         self._browser: Optional[Browser] = None
+        # False when connected to a browser launched by another worker
+        self._owns_browser = True
         self._lock = asyncio.Lock()
+        # Set once the browser is up; start_background() launches it early
+        self._ready_event = asyncio.Event()
+        self._init_task: Optional[asyncio.Task] = None
+        # Idle (context, page, use_count) entries per context key
+        self._ctx_pools: dict[
+            ContextKey, asyncio.Queue[tuple[BrowserContext, Page, int]]
+        ] = {}
+        # Origins navigated to in each context created by _new_context()
+        self._ctx_origins: weakref.WeakKeyDictionary[
+            BrowserContext, set[str]
+        ] = weakref.WeakKeyDictionary()
 
     async def initialize(self) -> None:
         """Initialize Playwright and launch Chromium browser."""
@@ -176,94 +576,340 @@ class ScreenshotService:
             if self._browser is not None:
                 return
 
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--disable-software-rasterizer",
-                    "--disable-extensions",
-                ],
-            )
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            try:
+                if is_browser_shared():
+                    self._browser = await self._connect_or_launch_shared()
+                else:
+                    self._browser = await self._launch_browser()
+                    self._owns_browser = True
+            except BaseException:
+                # Start Playwright afresh on the next attempt
+                with suppress(Exception):
+                    await self._playwright.stop()
+                self._playwright = None
+                raise
+            # A lost browser (e.g. the owning worker exited) is re-initialized
+            # by the next capture
+            self._browser.on("disconnected", self._on_browser_disconnected)
+            self._ready_event.set()
+
+    async def _launch_browser(self, *extra_args: str) -> Browser:
+        """Launch headless Chromium with the service's flags."""
+        return await self._playwright.chromium.launch(
+            headless=True,
+            args=[*_CHROME_ARGS, *extra_args],
+        )
+
+    async def _connect_or_launch_shared(self) -> Browser:
+        """Connect to the workers' shared browser, launching it if absent.
+
+        A lock file in the per-user state directory serializes startup so
+        exactly one worker launches Chromium, on a random localhost CDP
+        port that it records in a 0600 file; the others read the port and
+        connect over CDP.
+        """
+        state_dir = get_shared_browser_dir()
+        port_path = os.path.join(state_dir, "cdp-port")
+        fd = os.open(os.path.join(state_dir, "lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+") as lock_file:
+            await asyncio.to_thread(_lock_file, lock_file)
+            try:
+                port = _read_port_file(port_path)
+                browser = None
+                if port is not None:
+                    with suppress(Exception):
+                        browser = await self._playwright.chromium.connect_over_cdp(
+                            f"http://127.0.0.1:{port}"
+                        )
+                if browser is not None:
+                    self._owns_browser = False
+                else:
+                    port = _pick_free_port()
+                    browser = await self._launch_browser(
+                        f"--remote-debugging-port={port}"
+                    )
+                    _write_port_file(port_path, port)
+                    self._owns_browser = True
+            finally:
+                _unlock_file(lock_file)
+        return browser
+
+    def _on_browser_disconnected(self, browser: Browser) -> None:
+        """Forget a browser that went away so the next capture relaunches."""
+        if self._browser is browser:
+            self._browser = None
+            self._ready_event.clear()
+            self._ctx_pools.clear()
+
+    def start_background(self) -> None:
+        """Start launching the browser without waiting for it.
+
+        Call from application startup so the launch overlaps with the
+        server coming up instead of delaying the first capture request.
+        Must be called from a running event loop.
+        """
+        if self._init_task is None and not self._ready_event.is_set():
+            self._init_task = asyncio.create_task(self.initialize())
+
+    async def _wait_ready(self) -> None:
+        """Wait until the browser is available, launching it if needed.
+
+        Waits for a pending background launch first; if there is none, or it
+        failed, initialize() is awaited directly so the caller sees the error.
+        """
+        if self._ready_event.is_set():
+            return
+        if self._init_task is not None:
+            with suppress(Exception):
+                await asyncio.shield(self._init_task)
+            if self._ready_event.is_set():
+                return
+        await self.initialize()
 
     async def shutdown(self) -> None:
         """Clean up browser and Playwright resources."""
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
+        if self._init_task is not None:
+            self._init_task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await self._init_task
+            self._init_task = None
+        self._ready_event.clear()
+        pools, self._ctx_pools = self._ctx_pools, {}
+        browser, self._browser = self._browser, None
+        if browser:
+            if self._owns_browser:
+                # Pooled contexts belong to the browser and are closed with it
+                await browser.close()
+            else:
+                # Leave the shared browser running for the other workers
+                for pool in pools.values():
+                    while not pool.empty():
+                        context, _, _ = pool.get_nowait()
+                        with suppress(Exception):
+                            await context.close()
         if self._playwright:
             await self._playwright.stop()
             self._playwright = None
 
-    @asynccontextmanager
-    async def _get_page(self, request: ScreenshotRequest):
-        """Context manager for creating and cleaning up browser pages.
+    async def _new_context(self, key: ContextKey) -> BrowserContext:
+        """Create a browser context for a (width, height, color_scheme) key."""
+        width, height, color_scheme = key
+        context = await self._browser.new_context(
+            viewport={"width": width, "height": height},
+            color_scheme=color_scheme,
+            user_agent=_USER_AGENT,
+        )
+        self._ctx_origins[context] = track_navigation_origins(context)
+        return context
 
-        Handles two-step navigation for storage injection:
-        1. If storage (localStorage/sessionStorage) is provided, first navigate
-           to the origin to establish the browsing context
-        2. Inject storage values via page.evaluate()
-        3. Then navigate to the actual target URL
-        """
-        if not self._browser:
-            await self.initialize()
+    async def _acquire_page(
+        self, key: ContextKey
+    ) -> tuple[BrowserContext, Page, int]:
+        """Check out an idle pooled context and page, creating them if needed.
 
-        context = await self._browser.new_context(
-            viewport={"width": request.width, "height": request.height},
-            color_scheme="dark" if request.dark_mode else "light",
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            ),
+        Returns:
+            Tuple of (context, page, number of captures already served)
+        """
+        pool = self._ctx_pools.get(key)
+        if pool is not None:
+            try:
+                return pool.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        context = await self._new_context(key)
+        try:
+            return context, await context.new_page(), 0
+        except BaseException:
+            await context.close()
+            raise
+
+    async def _release_page(
+        self,
+        key: ContextKey,
+        context: BrowserContext,
+        page: Page,
+        uses: int,
+        ad_session: Optional[CDPSession] = None,
+    ) -> None:
+        """Reset a context and its page and return them to the pool, or close.
+
+        The pooled page may be a fresh one (see _reset_page). The context is
+        closed instead of pooled when it has reached
+        BROWSER_POOL_RECYCLE_AFTER uses, the pool is full, the origins it
+        visited are unknown (it was not created by _new_context), or the
+        reset fails. ad_session, if the capture blocked ads, is detached so
+        the next capture on this page starts without a block list.
+        """
+        uses += 1
+        pool = self._ctx_pools.setdefault(
+            key, asyncio.Queue(maxsize=CONTEXT_POOL_MAX_IDLE)
         )
+        origins = self._ctx_origins.get(context)
+        if uses >= BROWSER_POOL_RECYCLE_AFTER or pool.full() or origins is None:
+            await context.close()
+            return
 
-        # Block ads if requested
-        if request.block_ads:
-            await context.route(
-                "**/*",
-                lambda route: (
-                    route.abort()
-                    if any(domain in route.request.url for domain in AD_DOMAINS)
-                    else route.continue_()
-                ),
+        try:
+            if ad_session is not None:
+                await ad_session.detach()
+            page = await self._reset_page(
+                context, page, origins, keep_http_cache=keeps_pooled_http_cache()
             )
+            origins.clear()
+            pool.put_nowait((context, page, uses))
+        except Exception:
+            await context.close()
 
-        # Inject cookies if provided
-        if request.cookies:
-            playwright_cookies = prepare_cookies_for_playwright(
-                request.cookies, str(request.url)
+    @staticmethod
+    async def _reset_page(
+        context: BrowserContext,
+        page: Page,
+        visited: Iterable[str] = (),
+        keep_http_cache: bool = False,
+    ) -> Page:
+        """Blank the page, then clear site data left behind by a capture.
+
+        Other pages (e.g. popups) are closed and the page navigates to
+        about:blank first, so no timer, unload/pagehide handler or popup of
+        the captured site can write new state after it has been cleared.
+        The origins to clear are collected before that: every visited
+        origin (see track_navigation_origins) and every http(s) origin
+        still loaded in the context's frames.
+
+        Storage (localStorage, IndexedDB, CacheStorage, service workers) is
+        then cleared via CDP for each origin, cookies are cleared
+        context-wide, and the HTTP cache is cleared unless keep_http_cache
+        is set (see keeps_pooled_http_cache). sessionStorage belongs to the
+        tab, so a page that loaded any site is replaced by a new one.
+
+        Returns:
+            The blank page to pool with the context
+        """
+        origins = set(visited)
+        origins.update(
+            extract_origin(frame.url)
+            for other in context.pages
+            for frame in other.frames
+            if frame.url.startswith(("http://", "https://"))
+        )
+
+        for other in context.pages:
+            if other is not page:
+                await other.close()
+        await page.goto("about:blank")
+
+        if not origins:
+            await context.clear_cookies()
+            return page
+
+        cdp = await context.new_cdp_session(page)
+        for origin in origins:
+            await cdp.send(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": "all"},
             )
-            if playwright_cookies:
-                await context.add_cookies(playwright_cookies)
+        await context.clear_cookies()
+        if not keep_http_cache:
+            await cdp.send("Network.clearBrowserCache")
+        await cdp.detach()
+
+        await page.close()
+        return await context.new_page()
 
-        page = await context.new_page()
+    @asynccontextmanager
+    async def _get_page(self, request: ScreenshotRequest, url_str: str):
+        """Context manager for creating and cleaning up browser pages.
+
+        Storage (localStorage/sessionStorage) is injected by an init script
+        registered on the context, which runs before the target page's own
+        scripts on its first navigation.
+
+        url_str is str(request.url), serialized once by the caller.
+        """
+        await self._wait_ready()
+
+        key = (
+            request.width,
+            request.height,
+            "dark" if request.dark_mode else "light",
+        )
+        # Requests carrying cookies or storage always get a fresh context
+        pooled = not request.cookies and not has_storage_to_inject(request)
+        if pooled:
+            context, page, uses = await self._acquire_page(key)
+        else:
+            context, page, uses = await self._new_context(key), None, 0
+        ad_session = None
 
-        # Two-step navigation for storage injection
-        if has_storage_to_inject(request):
-            # Step 1: Navigate to origin first (fast, just establish context)
-            origin = extract_origin(str(request.url))
-            await page.goto(origin, wait_until="domcontentloaded", timeout=30000)
+        try:
+            if page is None:
+                page = await context.new_page()
 
-            # Step 2: Inject localStorage values
-            if request.localStorage:
-                script = build_storage_injection_script(
-                    "localStorage", request.localStorage
+            # Inject cookies if provided
+            if request.cookies:
+                playwright_cookies = prepare_cookies_for_playwright(
+                    request.cookies, url_str
                 )
-                await page.evaluate(script)
+                if playwright_cookies:
+                    await context.add_cookies(playwright_cookies)
 
-            # Step 3: Inject sessionStorage values
-            if request.sessionStorage:
-                script = build_storage_injection_script(
-                    "sessionStorage", request.sessionStorage
+            # Block ads if requested
+            if request.block_ads:
+                ad_session = await block_ads(context, page)
+
+            # Storage is set by an init script as the target URL loads
+            if has_storage_to_inject(request):
+                await context.add_init_script(
+                    build_storage_init_script(request, extract_origin(url_str))
                 )
-                await page.evaluate(script)
 
-        try:
             yield page
+        except BaseException:
+            # Never return a context to the pool after a failed capture
+            pooled = False
+            raise
         finally:
-            await context.close()
+            if pooled:
+                await self._release_page(key, context, page, uses, ad_session)
+            else:
+                await context.close()
+
+    async def _load_page(
+        self,
+        page: Page,
+        request: ScreenshotRequest | TiledScreenshotRequest,
+        url_str: str,
+    ) -> None:
+        """Navigate to the request URL and apply the request's wait options.
+
+        Waits for the request's wait_strategy load event, then
+        wait_for_timeout, wait_for_selector and delay, in that order.
+        url_str is str(request.url).
+        """
+        # Navigate to URL
+        await page.goto(
+            url_str,
+            wait_until=request.wait_strategy,
+            timeout=30000,
+        )
+
+        # Wait for additional timeout if specified
+        if request.wait_for_timeout > 0:
+            await page.wait_for_timeout(request.wait_for_timeout)
+
+        # Wait for specific selector if provided
+        if request.wait_for_selector:
+            await page.wait_for_selector(
+                request.wait_for_selector,
+                timeout=10000,
+            )
+
+        # Apply delay before capture if specified
+        if request.delay > 0:
+            await asyncio.sleep(request.delay / 1000)
 
     async def capture(
         self, request: ScreenshotRequest
@@ -284,46 +930,17 @@ class ScreenshotService:
             Exception: If screenshot capture fails
         """
         start_time = time.perf_counter()
+        url_str = str(request.url)
         dom_result: Optional[dict[str, Any]] = None
 
-        async with self._get_page(request) as page:
-            # Navigate to URL
-            await page.goto(
-                str(request.url),
-                wait_until="networkidle",
-                timeout=30000,
-            )
-
-            # Wait for additional timeout if specified
-            if request.wait_for_timeout > 0:
-                await page.wait_for_timeout(request.wait_for_timeout)
-
-            # Wait for specific selector if provided
-            if request.wait_for_selector:
-                await page.wait_for_selector(
-                    request.wait_for_selector,
-                    timeout=10000,
-                )
-
-            # Apply delay before capture if specified
-            if request.delay > 0:
-                await asyncio.sleep(request.delay / 1000)
+        async with self._get_page(request, url_str) as page:
+            await self._load_page(page, request, url_str)
 
             # Extract DOM elements if enabled (do this before screenshot
             # to ensure same page state)
             if request.extract_dom and request.extract_dom.enabled:
-                extraction_script = get_extraction_script()
-                options = {
-                    "selectors": request.extract_dom.selectors,
-                    "includeHidden": request.extract_dom.include_hidden,
-                    "minTextLength": request.extract_dom.min_text_length,
-                    "maxElements": request.extract_dom.max_elements,
-                }
                 dom_result = await page.evaluate(
-                    f"""
-                    {extraction_script}
-                    extractDomElements({json.dumps(options)});
-                    """
+                    build_extraction_expression(request.extract_dom)
                 )
 
             # Prepare screenshot options
@@ -364,12 +981,10 @@ class ScreenshotService:
         Raises:
             Exception: If screenshot capture fails
         """
-        import base64
-
         start_time = time.perf_counter()
+        url_str = str(request.url)
 
-        if not self._browser:
-            await self.initialize()
+        await self._wait_ready()
 
         # Apply Vision AI preset if specified
         effective_tile_width = request.tile_width
@@ -389,76 +1004,43 @@ class ScreenshotService:
             effective_overlap = preset_config["overlap"]
             applied_preset = request.target_vision_model.lower()
 
-        # Create context with tile dimensions as viewport
-        context = await self._browser.new_context(
-            viewport={"width": effective_tile_width, "height": effective_tile_height},
-            color_scheme="dark" if request.dark_mode else "light",
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            ),
+        # Context with tile dimensions as viewport; pooled as in _get_page
+        key = (
+            effective_tile_width,
+            effective_tile_height,
+            "dark" if request.dark_mode else "light",
         )
+        pooled = not request.cookies and not has_storage_to_inject(request)
+        if pooled:
+            context, page, uses = await self._acquire_page(key)
+        else:
+            context, page, uses = await self._new_context(key), None, 0
+        ad_session = None
 
         try:
-            # Block ads if requested
-            if request.block_ads:
-                await context.route(
-                    "**/*",
-                    lambda route: (
-                        route.abort()
-                        if any(domain in route.request.url for domain in AD_DOMAINS)
-                        else route.continue_()
-                    ),
-                )
+            if page is None:
+                page = await context.new_page()
 
             # Inject cookies if provided
             if request.cookies:
                 playwright_cookies = prepare_cookies_for_playwright(
-                    request.cookies, str(request.url)
+                    request.cookies, url_str
                 )
                 if playwright_cookies:
                     await context.add_cookies(playwright_cookies)
 
-            page = await context.new_page()
-
-            # Handle storage injection if needed
-            if request.localStorage or request.sessionStorage:
-                origin = extract_origin(str(request.url))
-                await page.goto(origin, wait_until="domcontentloaded", timeout=30000)
-
-                if request.localStorage:
-                    script = build_storage_injection_script(
-                        "localStorage", request.localStorage
-                    )
-                    await page.evaluate(script)
-
-                if request.sessionStorage:
-                    script = build_storage_injection_script(
-                        "sessionStorage", request.sessionStorage
-                    )
-                    await page.evaluate(script)
-
-            # Navigate to target URL
-            await page.goto(
-                str(request.url),
-                wait_until="networkidle",
-                timeout=30000,
-            )
-
-            # Wait for additional timeout if specified
-            if request.wait_for_timeout > 0:
-                await page.wait_for_timeout(request.wait_for_timeout)
+            # Block ads if requested
+            if request.block_ads:
+                ad_session = await block_ads(context, page)
 
-            # Wait for specific selector if provided
-            if request.wait_for_selector:
-                await page.wait_for_selector(
-                    request.wait_for_selector,
-                    timeout=10000,
+            # Storage is set by an init script as the target URL loads; it
+            # also covers the extra pages tile shards are captured from
+            if has_storage_to_inject(request):
+                await context.add_init_script(
+                    build_storage_init_script(request, extract_origin(url_str))
                 )
 
-            # Apply delay before capture if specified
-            if request.delay > 0:
-                await asyncio.sleep(request.delay / 1000)
+            await self._load_page(page, request, url_str)
 
             # Get full page dimensions
             page_dimensions = await page.evaluate(
@@ -484,6 +1066,7 @@ class ScreenshotService:
                 overlap=effective_overlap,
                 page_width=page_width,
                 viewport_width=effective_tile_width,
+                uniform=request.uniform_tiles,
             )
 
             # Validate max_tile_count limit - return HTTP 400 if exceeded
@@ -500,7 +1083,6 @@ class ScreenshotService:
                 )
 
             # Capture tiles
-            tiles: list[Tile] = []
             screenshot_options = {
                 "type": request.format.value,
             }
@@ -512,95 +1094,61 @@ class ScreenshotService:
                 request.wait_for_timeout, len(tile_bounds_list)
             )
 
-            for bounds in tile_bounds_list:
-                # Scroll to tile position
-                await page.evaluate(f"window.scrollTo({bounds.x}, {bounds.y})")
-                await page.wait_for_timeout(per_tile_wait)  # Wait for lazy loading
-
-                # Capture screenshot with clip region
-                screenshot_bytes = await page.screenshot(
-                    **screenshot_options,
-                    clip={
-                        "x": 0,
-                        "y": 0,
-                        "width": bounds.width,
-                        "height": bounds.height,
-                    },
-                )
+            # Multipart responses carry raw image bytes instead of base64
+            encode_base64 = request.response_format == "json"
+            extract_dom = (
+                request.extract_dom
+                if request.extract_dom and request.extract_dom.enabled
+                else None
+            )
 
-                # Convert to base64
-                image_base64 = base64.b64encode(screenshot_bytes).decode("utf-8")
-
-                # Extract DOM if enabled
-                dom_extraction = None
-                if request.extract_dom and request.extract_dom.enabled:
-                    extraction_script = get_extraction_script()
-                    options = {
-                        "selectors": request.extract_dom.selectors,
-                        "includeHidden": request.extract_dom.include_hidden,
-                        "minTextLength": request.extract_dom.min_text_length,
-                        "maxElements": request.extract_dom.max_elements,
-                    }
-                    dom_extraction = await page.evaluate(
-                        f"""
-                        {extraction_script}
-                        extractDomElements({json.dumps(options)});
-                        """
-                    )
+            # Split tiles into contiguous shards captured concurrently, one
+            # page per shard. The first shard reuses the loaded page; the rest
+            # load the URL in extra pages of the same context, where the
+            # storage init script injects per-tab sessionStorage again.
+            shards = split_tile_shards(
+                tile_bounds_list, get_tile_capture_concurrency()
+            )
 
-                    # Enrich DOM elements with tile metadata (US-02)
-                    if dom_extraction and "elements" in dom_extraction:
-                        for element in dom_extraction["elements"]:
-                            # Set tile_index to identify which tile contains this element
-                            element["tile_index"] = bounds.index
-
-                            # Store original tile-relative rect before adjustment
-                            if "rect" in element:
-                                element["tile_relative_rect"] = {
-                                    "x": element["rect"]["x"],
-                                    "y": element["rect"]["y"],
-                                    "width": element["rect"]["width"],
-                                    "height": element["rect"]["height"],
-                                }
-                                # Adjust rect to absolute page coordinates
-                                element["rect"]["x"] += bounds.x
-                                element["rect"]["y"] += bounds.y
-
-                    # Add low element warning if fewer than 5 elements in tile
-                    elem_count = dom_extraction.get("element_count", 0)
-                    if elem_count < 5:
-                        if "warnings" not in dom_extraction:
-                            dom_extraction["warnings"] = []
-                        dom_extraction["warnings"].append({
-                            "code": "low_element_count_per_tile",
-                            "message": (
-                                f"Tile {bounds.index} has only {elem_count} elements "
-                                f"(threshold: 5)"
-                            ),
-                            "severity": "info",
-                            "suggestion": (
-                                "Consider using different selectors or checking "
-                                "if page content loaded correctly"
-                            ),
-                        })
-
-                tile = Tile(
-                    index=bounds.index,
-                    row=bounds.row,
-                    column=bounds.column,
-                    bounds=bounds,
-                    image_base64=image_base64,
-                    file_size_bytes=len(screenshot_bytes),
-                    dom_extraction=dom_extraction,
-                )
-                tiles.append(tile)
+            async def capture_extra_shard(shard: Sequence[TileBounds]) -> list[Tile]:
+                shard_page = await context.new_page()
+                try:
+                    if request.block_ads:
+                        await block_ads(context, shard_page)
+                    await self._load_page(shard_page, request, url_str)
+                    return await self._capture_shard(
+                        shard_page,
+                        shard,
+                        screenshot_options,
+                        per_tile_wait,
+                        extract_dom,
+                        encode_base64,
+                    )
+                finally:
+                    await shard_page.close()
+
+            shard_tiles = await gather_or_cancel(
+                self._capture_shard(
+                    page,
+                    shards[0],
+                    screenshot_options,
+                    per_tile_wait,
+                    extract_dom,
+                    encode_base64,
+                ),
+                *(capture_extra_shard(shard) for shard in shards[1:]),
+            )
+            # Shards are contiguous and in grid order
+            tiles = [tile for shard in shard_tiles for tile in shard]
 
-            # Calculate grid dimensions
-            max_row = max(t.row for t in tiles) if tiles else 0
-            max_col = max(t.column for t in tiles) if tiles else 0
+            # Grid is generated row-major, so the last tile holds the
+            # largest row and column
+            last_bounds = tile_bounds_list[-1]
+            max_row = last_bounds.row
+            max_col = last_bounds.column
 
             # Build tile config
-            tile_config = TileConfig(
+            tile_config = TileConfig.model_construct(
                 tile_width=effective_tile_width,
                 tile_height=effective_tile_height,
                 overlap=effective_overlap,
@@ -610,7 +1158,7 @@ class ScreenshotService:
             )
 
             # Build coordinate mapping
-            coordinate_mapping = CoordinateMapping(
+            coordinate_mapping = CoordinateMapping.model_construct(
                 type="tile_offset",
                 instructions=(
                     "Add tile bounds.x/y to element coordinates for full-page position"
@@ -623,7 +1171,7 @@ class ScreenshotService:
 
             return TiledScreenshotResponse(
                 success=True,
-                url=str(request.url),
+                url=url_str,
                 full_page_dimensions={"width": page_width, "height": page_height},
                 tile_config=tile_config,
                 tiles=tiles,
@@ -631,8 +1179,125 @@ class ScreenshotService:
                 coordinate_mapping=coordinate_mapping,
             )
 
+        except BaseException:
+            pooled = False
+            raise
         finally:
-            await context.close()
+            if pooled:
+                await self._release_page(key, context, page, uses, ad_session)
+            else:
+                await context.close()
+
+    async def _capture_shard(
+        self,
+        page: Page,
+        shard: Sequence[TileBounds],
+        screenshot_options: dict[str, Any],
+        per_tile_wait: int,
+        extract_dom: Optional[DomExtractionOptions],
+        encode_base64: bool = True,
+    ) -> list[Tile]:
+        """Capture a contiguous run of tiles on one page and extract their DOM.
+
+        The DOM is extracted once per shard, after the page has scrolled
+        through all of its tiles, so lazily loaded and scroll-triggered
+        content is included. Each page extracts its own DOM, and each tile
+        gets the elements overlapping it (see build_tile_dom_extraction).
+
+        Args:
+            page: Loaded page to capture from
+            shard: Tiles to capture, in grid order
+            screenshot_options: Options passed through to page.screenshot()
+            per_tile_wait: Milliseconds to wait after scrolling (lazy loading)
+            extract_dom: DOM extraction options, or None to skip extraction
+            encode_base64: Store images as base64 text (see _capture_tile)
+
+        Returns:
+            The captured tiles, in shard order
+        """
+        tiles = [
+            await self._capture_tile(
+                page, bounds, screenshot_options, per_tile_wait, encode_base64
+            )
+            for bounds in shard
+        ]
+
+        if extract_dom is not None:
+            shard_dom = await page.evaluate(
+                build_extraction_expression(extract_dom, shard)
+            )
+            # The elements come from the page, so they are still validated
+            for position, tile in enumerate(tiles):
+                tile.dom_extraction = DomExtractionResult.model_validate(
+                    build_tile_dom_extraction(shard_dom, tile.bounds, position)
+                )
+
+        return tiles
+
+    async def _capture_tile(
+        self,
+        page: Page,
+        bounds: TileBounds,
+        screenshot_options: dict[str, Any],
+        per_tile_wait: int,
+        encode_base64: bool = True,
+    ) -> Tile:
+        """Scroll to one tile and screenshot it.
+
+        Args:
+            page: Loaded page to capture from
+            bounds: Tile position and size within the full page
+            screenshot_options: Options passed through to page.screenshot()
+            per_tile_wait: Milliseconds to wait after scrolling (lazy loading)
+            encode_base64: Store the image as base64 text; when False a
+                MultipartTile keeping the raw bytes is returned instead
+
+        Returns:
+            Tile with its image; DOM extraction is attached by _capture_shard
+        """
+        # Scroll to tile position and wait for lazy loading in one round-trip
+        await page.evaluate(
+            """([x, y, wait]) => new Promise((resolve) => {
+                window.scrollTo(x, y);
+                setTimeout(resolve, wait);
+            })""",
+            [bounds.x, bounds.y, per_tile_wait],
+        )
+
+        # Capture screenshot with clip region
+        screenshot_bytes = await page.screenshot(
+            **screenshot_options,
+            clip={
+                "x": 0,
+                "y": 0,
+                "width": bounds.width,
+                "height": bounds.height,
+            },
+        )
+
+        # All other fields are computed here, so skip Tile validation
+        if not encode_base64:
+            return MultipartTile.model_construct(
+                index=bounds.index,
+                row=bounds.row,
+                column=bounds.column,
+                bounds=bounds,
+                image_bytes=screenshot_bytes,
+                file_size_bytes=len(screenshot_bytes),
+            )
+
+        # Convert to base64 in a worker thread so large tiles don't stall the
+        # event loop while other shards scroll and capture (ASCII decode:
+        # base64 output is pure ASCII)
+        encoded = await asyncio.to_thread(base64.b64encode, screenshot_bytes)
+        return Tile.model_construct(
+            index=bounds.index,
+            row=bounds.row,
+            column=bounds.column,
+            bounds=bounds,
+            image_base64=encoded.decode("ascii"),
+            file_size_bytes=len(screenshot_bytes),
+        )
 
     async def health_check(self) -> bool:
         """Check if the browser is healthy and can take screenshots."""
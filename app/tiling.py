@@ -4,6 +4,8 @@ This module provides functions to calculate tile grids for full-page screenshots
 and adjust DOM element coordinates for tile-relative positioning.
 """
 
+import functools
+from collections.abc import Sequence
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -55,6 +57,9 @@ VISION_AI_PRESETS = {
     },
 }
 
+# Valid preset names for error messages
+_PRESET_NAMES = ", ".join(sorted(VISION_AI_PRESETS))
+
 
 def _validate_dimensions(
     page_width: int,
@@ -101,7 +106,8 @@ def calculate_tile_grid(
     overlap: int = 50,
     page_width: Optional[int] = None,
     viewport_width: Optional[int] = None,
-) -> list[TileBounds]:
+    uniform: bool = False,
+) -> tuple[TileBounds, ...]:
     """Calculate tile grid with overlap for full-page capture.
 
     Generates a grid of tiles that covers the entire page with configurable
@@ -114,9 +120,13 @@ def calculate_tile_grid(
         overlap: Pixel overlap between adjacent tiles (default: 50)
         page_width: Full page width (default: viewport_width, single column)
         viewport_width: Width of each tile (default: page_width, single column)
+        uniform: Spread the same number of tiles evenly so every tile is full
+            size, widening the overlap instead of clipping the last row and
+            column ("minverlap"). ``overlap`` is then the minimum overlap.
 
     Returns:
-        List of TileBounds objects defining each tile's position
+        Tuple of TileBounds objects defining each tile's position. The grid
+        geometry is memoized; every call gets its own TileBounds instances.
 
     Raises:
         ValueError: If dimensions are invalid (negative, zero, or overlap >= viewport)
@@ -138,59 +148,73 @@ def calculate_tile_grid(
     if page_width is None:
         page_width = viewport_width  # Single column
 
+    grid = _calculate_tile_grid_cached(
+        page_width, page_height, viewport_width, viewport_height, overlap, uniform
+    )
+    # TileBounds is mutable, so the cached plain tuples become fresh models
+    return tuple(
+        TileBounds.model_construct(
+            index=index, row=row, column=column, x=x, y=y, width=width, height=height
+        )
+        for index, row, column, x, y, width, height in grid
+    )
+
+
+def _axis_positions(
+    page: int, viewport: int, step: int, uniform: bool
+) -> list[tuple[int, int]]:
+    """Return (offset, size) for each tile along one axis."""
+    # Tiles are added until one reaches the page edge, so the count is the
+    # ceil-division of the remaining length by the step, plus the first tile
+    count = 1 + max(0, -(-(page - viewport) // step))
+    if not uniform or count == 1:
+        return [
+            (i * step, min(viewport, page - i * step)) for i in range(count)
+        ]
+    # Minverlap: first tile at 0, last flush with the page edge, the rest
+    # evenly spaced (rounded). Spacing never exceeds step, so the overlap
+    # is at least the requested one.
+    span = page - viewport
+    gaps = count - 1
+    return [((i * span + gaps // 2) // gaps, viewport) for i in range(count)]
+
+
+@functools.lru_cache(maxsize=128)
+def _calculate_tile_grid_cached(
+    page_width: int,
+    page_height: int,
+    viewport_width: int,
+    viewport_height: int,
+    overlap: int,
+    uniform: bool = False,
+) -> tuple[tuple[int, int, int, int, int, int, int], ...]:
+    """Build the tile grid for resolved dimensions, memoized.
+
+    Pages of the same size (e.g. a same-site crawl with one preset) reuse
+    the grid. Tiles are (index, row, column, x, y, width, height) tuples,
+    which are immutable and safe to share between callers.
+    """
     # Validate all dimensions
     _validate_dimensions(
         page_width, page_height, viewport_width, viewport_height, overlap
     )
 
-    tiles: list[TileBounds] = []
-
     # Calculate step size (tile size minus overlap)
     step_x = viewport_width - overlap
     step_y = viewport_height - overlap
 
-    tile_index = 0
-    row = 0
-    y = 0
-
-    while y < page_height:
-        col = 0
-        x = 0
-
-        while x < page_width:
-            # Calculate actual tile dimensions (may be clipped at edges)
-            tile_width = min(viewport_width, page_width - x)
-            tile_height = min(viewport_height, page_height - y)
-
-            tiles.append(
-                TileBounds(
-                    index=tile_index,
-                    row=row,
-                    column=col,
-                    x=x,
-                    y=y,
-                    width=tile_width,
-                    height=tile_height,
-                )
-            )
-
-            tile_index += 1
-
-            # Break if this tile reached the page edge
-            if x + tile_width >= page_width:
-                break
-
-            x += step_x
-            col += 1
-
-        # Break if this row's tiles reached the page bottom
-        if y + tile_height >= page_height:
-            break
-
-        y += step_y
-        row += 1
+    # Column offsets and widths are the same for every row
+    columns = list(
+        enumerate(_axis_positions(page_width, viewport_width, step_x, uniform))
+    )
+    n_cols = len(columns)
 
-    return tiles
+    rows = _axis_positions(page_height, viewport_height, step_y, uniform)
+    return tuple(
+        (row * n_cols + col, row, col, x, y, tile_width, tile_height)
+        for row, (y, tile_height) in enumerate(rows)
+        for col, (x, tile_width) in columns
+    )
 
 
 def adjust_element_coordinates(
@@ -247,7 +271,19 @@ def adjust_elements_batch(
         >>> [e["y"] for e in adjusted]
         [1600, 1800]
     """
-    return [adjust_element_coordinates(el, tile_bounds) for el in elements]
+    # Same result as adjust_element_coordinates per element, with the tile
+    # offset read once instead of a function call and attribute lookups each
+    dx = tile_bounds.x
+    dy = tile_bounds.y
+    return [
+        {
+            "x": el["x"] + dx,
+            "y": el["y"] + dy,
+            "width": el["width"],
+            "height": el["height"],
+        }
+        for el in elements
+    ]
 
 
 def apply_vision_preset(
@@ -280,16 +316,15 @@ def apply_vision_preset(
         >>> config['tile_height']
         1568
     """
-    preset_name_lower = preset_name.lower()
+    base_preset = VISION_AI_PRESETS.get(preset_name.lower())
 
-    if preset_name_lower not in VISION_AI_PRESETS:
-        valid_presets = ", ".join(sorted(VISION_AI_PRESETS.keys()))
+    if base_preset is None:
         raise ValueError(
             f"Unknown Vision AI preset '{preset_name}'. "
-            f"Valid options: {valid_presets}"
+            f"Valid options: {_PRESET_NAMES}"
         )
 
-    preset = VISION_AI_PRESETS[preset_name_lower].copy()
+    preset = dict(base_preset)
 
     # Apply user overrides (user-specified values take precedence)
     if tile_width is not None:
@@ -328,8 +363,37 @@ def calculate_per_tile_wait(
         >>> calculate_per_tile_wait(0, 4)     # No timeout = use min_wait
         50
     """
-    if wait_for_timeout <= 0:
-        return min_wait
+    # A non-positive timeout divides to at most 0, leaving min_wait
+    return max(min_wait, max(wait_for_timeout, 0) // max(tile_count, 1))
+
 
-    calculated = wait_for_timeout // tile_count
-    return max(min_wait, calculated)
+def split_tile_shards(
+    tiles: Sequence[TileBounds],
+    shard_count: int,
+) -> list[Sequence[TileBounds]]:
+    """Split tiles into contiguous shards for concurrent capture.
+
+    Shards keep grid order, so each page scrolls steadily down its own
+    band of the document. Sizes differ by at most one tile.
+
+    Args:
+        tiles: Tile bounds in capture order
+        shard_count: Maximum number of shards (pages) to use
+
+    Returns:
+        List of non-empty shards; fewer than shard_count if there are
+        fewer tiles than shards
+
+    Examples:
+        >>> [len(s) for s in split_tile_shards(list(range(10)), 4)]
+        [3, 3, 2, 2]
+    """
+    shard_count = max(1, min(shard_count, len(tiles)))
+    base, extra = divmod(len(tiles), shard_count)
+    shards = []
+    start = 0
+    for i in range(shard_count):
+        end = start + base + (1 if i < extra else 0)
+        shards.append(tiles[start:end])
+        start = end
+    return [shard for shard in shards if shard]
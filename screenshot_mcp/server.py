@@ -4,352 +4,395 @@ Provides screenshot capture tools for AI agents via the Model Context Protocol.
 """
 
 import asyncio
-import base64
+import binascii
+import os
 import sys
+import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Installed or run with -m, app is importable as a sibling package; only a
+# direct `python screenshot_mcp/server.py` run needs the repo root on the path
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.models import (
-    Cookie,
-    DomExtractionOptions,
-    ImageFormat,
-    ScreenshotRequest,
-    ScreenshotType,
-)
-from app.screenshot import ScreenshotService
+# app.screenshot (Playwright) and app.models are imported on first use so
+# starting the server and listing tools don't pay for them
+if TYPE_CHECKING:
+    from app.models import ScreenshotRequest
+    from app.screenshot import ScreenshotService
 
 # Create server instance
 server = Server("chromium-screenshots")
 
 # Screenshot service instance (initialized lazily)
-_screenshot_service: ScreenshotService | None = None
+_screenshot_service: "ScreenshotService | None" = None
 
 
-async def get_screenshot_service() -> ScreenshotService:
+async def get_screenshot_service() -> "ScreenshotService":
     """Get or initialize the screenshot service."""
     global _screenshot_service
     if _screenshot_service is None:
+        from app.screenshot import ScreenshotService
+
         _screenshot_service = ScreenshotService()
         await _screenshot_service.initialize()
     return _screenshot_service
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available screenshot tools."""
-    return [
-        Tool(
-            name="screenshot",
-            description=(
-                "Capture a screenshot of a webpage. Returns base64-encoded image data. "
-                "Supports cookie injection for authenticated pages. "
-                "Use this for capturing web pages, especially long/full-page screenshots."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "URL to capture (must include protocol, e.g., https://)",
-                    },
-                    "screenshot_type": {
-                        "type": "string",
-                        "enum": ["viewport", "full_page"],
-                        "default": "viewport",
-                        "description": "Type: viewport (visible area) or full_page (entire page)",
-                    },
-                    "format": {
-                        "type": "string",
-                        "enum": ["png", "jpeg"],
-                        "default": "png",
-                        "description": "Output image format",
-                    },
-                    "width": {
-                        "type": "integer",
-                        "minimum": 320,
-                        "maximum": 3840,
-                        "default": 1920,
-                        "description": "Viewport width in pixels",
-                    },
-                    "height": {
-                        "type": "integer",
-                        "minimum": 240,
-                        "maximum": 2160,
-                        "default": 1080,
-                        "description": "Viewport height in pixels",
-                    },
-                    "quality": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "default": 90,
-                        "description": "Image quality (1-100, only applies to JPEG)",
-                    },
-                    "wait_for_timeout": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 30000,
-                        "default": 0,
-                        "description": "Additional wait time in ms after page load",
-                    },
-                    "wait_for_selector": {
-                        "type": "string",
-                        "description": "CSS selector to wait for before capture",
-                    },
-                    "delay": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 10000,
-                        "default": 0,
-                        "description": "Delay in ms before taking screenshot",
-                    },
-                    "dark_mode": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Emulate dark color scheme preference",
-                    },
-                    "block_ads": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Block common ad/tracking domains",
-                    },
-                    "cookies": {
-                        "type": "array",
-                        "description": "Cookies to inject for authenticated pages",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string", "description": "Cookie name"},
-                                "value": {"type": "string", "description": "Cookie value"},
-                                "domain": {"type": "string", "description": "Cookie domain"},
-                                "path": {"type": "string", "description": "Cookie path"},
-                                "httpOnly": {"type": "boolean", "description": "HTTP-only"},
-                                "secure": {"type": "boolean", "description": "Secure flag"},
-                                "sameSite": {
-                                    "type": "string",
-                                    "enum": ["Strict", "Lax", "None"],
-                                    "description": "SameSite policy",
-                                },
-                                "expires": {"type": "integer", "description": "Unix timestamp"},
-                            },
-                            "required": ["name", "value"],
-                        },
-                    },
-                    "localStorage": {
-                        "type": "object",
-                        "description": (
-                            "localStorage key-value pairs to inject before capture. "
-                            "For localStorage-based auth (Wasp, OpenSaaS, Firebase). "
-                            "Example: {'wasp:sessionId': 'abc123', 'theme': 'dark'}"
-                        ),
-                    },
-                    "sessionStorage": {
-                        "type": "object",
-                        "description": (
-                            "sessionStorage key-value pairs to inject before capture. "
-                            "For temporary session data. "
-                            "Example: {'tempToken': 'xyz789'}"
-                        ),
-                    },
-                    "extract_dom": {
+# Maximum captures in flight for one batched screenshot call
+MCP_BATCH_CONCURRENCY = 4
+
+# Maximum URLs accepted by one batched screenshot call
+MCP_BATCH_MAX_URLS = 20
+
+
+# Tool definitions are static, so they are built once at import
+_TOOLS = (
+    Tool(
+        name="screenshot",
+        description=(
+            "Capture a screenshot of a webpage. Returns base64-encoded image data. "
+            "Supports cookie injection for authenticated pages. "
+            "Use this for capturing web pages, especially long/full-page screenshots. "
+            f"Pass exactly one of url or urls (up to {MCP_BATCH_MAX_URLS} URLs)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to capture (must include protocol, e.g., https://)",
+                },
+                "urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "maxItems": MCP_BATCH_MAX_URLS,
+                    "description": (
+                        "Capture several URLs with the same options instead of url; "
+                        "returns one result per URL"
+                    ),
+                },
+                "screenshot_type": {
+                    "type": "string",
+                    "enum": ["viewport", "full_page"],
+                    "default": "viewport",
+                    "description": "Type: viewport (visible area) or full_page (entire page)",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["png", "jpeg"],
+                    "default": "png",
+                    "description": "Output image format",
+                },
+                "width": {
+                    "type": "integer",
+                    "minimum": 320,
+                    "maximum": 3840,
+                    "default": 1920,
+                    "description": "Viewport width in pixels",
+                },
+                "height": {
+                    "type": "integer",
+                    "minimum": 240,
+                    "maximum": 2160,
+                    "default": 1080,
+                    "description": "Viewport height in pixels",
+                },
+                "quality": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 100,
+                    "default": 90,
+                    "description": "Image quality (1-100, only applies to JPEG)",
+                },
+                "wait_strategy": {
+                    "type": "string",
+                    "enum": ["domcontentloaded", "load", "networkidle"],
+                    "default": "networkidle",
+                    "description": (
+                        "Page load event to wait for before capture; "
+                        "domcontentloaded and load return sooner on busy pages"
+                    ),
+                },
+                "wait_for_timeout": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 30000,
+                    "default": 0,
+                    "description": "Additional wait time in ms after page load",
+                },
+                "wait_for_selector": {
+                    "type": "string",
+                    "description": "CSS selector to wait for before capture",
+                },
+                "delay": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 10000,
+                    "default": 0,
+                    "description": "Delay in ms before taking screenshot",
+                },
+                "dark_mode": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Emulate dark color scheme preference",
+                },
+                "block_ads": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Block common ad/tracking domains",
+                },
+                "cookies": {
+                    "type": "array",
+                    "description": "Cookies to inject for authenticated pages",
+                    "items": {
                         "type": "object",
-                        "description": (
-                            "Extract DOM element positions and text alongside screenshot. "
-                            "Enables hybrid text identification with Vision AI."
-                        ),
                         "properties": {
-                            "enabled": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Enable DOM extraction",
-                            },
-                            "selectors": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "CSS selectors for elements to extract",
-                            },
-                            "include_hidden": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Include hidden elements",
-                            },
-                            "min_text_length": {
-                                "type": "integer",
-                                "default": 1,
-                                "description": "Minimum text content length",
-                            },
-                            "max_elements": {
-                                "type": "integer",
-                                "default": 500,
-                                "description": "Maximum elements to extract",
+                            "name": {"type": "string", "description": "Cookie name"},
+                            "value": {"type": "string", "description": "Cookie value"},
+                            "domain": {"type": "string", "description": "Cookie domain"},
+                            "path": {"type": "string", "description": "Cookie path"},
+                            "httpOnly": {"type": "boolean", "description": "HTTP-only"},
+                            "secure": {"type": "boolean", "description": "Secure flag"},
+                            "sameSite": {
+                                "type": "string",
+                                "enum": ["Strict", "Lax", "None"],
+                                "description": "SameSite policy",
                             },
+                            "expires": {"type": "integer", "description": "Unix timestamp"},
                         },
+                        "required": ["name", "value"],
                     },
                 },
-                "required": ["url"],
-            },
-        ),
-        Tool(
-            name="screenshot_to_file",
-            description=(
-                "Capture a screenshot and save it to a file. Returns the file path. "
-                "Supports cookie injection for authenticated pages."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "URL to capture (must include protocol)",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Path where the screenshot will be saved",
-                    },
-                    "screenshot_type": {
-                        "type": "string",
-                        "enum": ["viewport", "full_page"],
-                        "default": "viewport",
-                        "description": "Type of screenshot",
-                    },
-                    "format": {
-                        "type": "string",
-                        "enum": ["png", "jpeg"],
-                        "default": "png",
-                        "description": "Output image format",
-                    },
-                    "width": {
-                        "type": "integer",
-                        "minimum": 320,
-                        "maximum": 3840,
-                        "default": 1920,
-                        "description": "Viewport width in pixels",
-                    },
-                    "height": {
-                        "type": "integer",
-                        "minimum": 240,
-                        "maximum": 2160,
-                        "default": 1080,
-                        "description": "Viewport height in pixels",
-                    },
-                    "quality": {
-                        "type": "integer",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "default": 90,
-                        "description": "JPEG quality",
-                    },
-                    "wait_for_timeout": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 30000,
-                        "default": 0,
-                        "description": "Wait time after page load in ms",
-                    },
-                    "wait_for_selector": {
-                        "type": "string",
-                        "description": "CSS selector to wait for",
-                    },
-                    "delay": {
-                        "type": "integer",
-                        "minimum": 0,
-                        "maximum": 10000,
-                        "default": 0,
-                        "description": "Delay before capture in ms",
-                    },
-                    "dark_mode": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Emulate dark color scheme",
-                    },
-                    "block_ads": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Block ad domains",
-                    },
-                    "cookies": {
-                        "type": "array",
-                        "description": "Cookies to inject for authenticated pages",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string", "description": "Cookie name"},
-                                "value": {"type": "string", "description": "Cookie value"},
-                                "domain": {"type": "string", "description": "Cookie domain"},
-                                "path": {"type": "string", "description": "Cookie path"},
-                                "httpOnly": {"type": "boolean", "description": "HTTP-only"},
-                                "secure": {"type": "boolean", "description": "Secure flag"},
-                                "sameSite": {
-                                    "type": "string",
-                                    "enum": ["Strict", "Lax", "None"],
-                                    "description": "SameSite policy",
-                                },
-                                "expires": {"type": "integer", "description": "Unix timestamp"},
-                            },
-                            "required": ["name", "value"],
+                "localStorage": {
+                    "type": "object",
+                    "description": (
+                        "localStorage key-value pairs to inject before capture. "
+                        "For localStorage-based auth (Wasp, OpenSaaS, Firebase). "
+                        "Example: {'wasp:sessionId': 'abc123', 'theme': 'dark'}"
+                    ),
+                },
+                "sessionStorage": {
+                    "type": "object",
+                    "description": (
+                        "sessionStorage key-value pairs to inject before capture. "
+                        "For temporary session data. "
+                        "Example: {'tempToken': 'xyz789'}"
+                    ),
+                },
+                "extract_dom": {
+                    "type": "object",
+                    "description": (
+                        "Extract DOM element positions and text alongside screenshot. "
+                        "Enables hybrid text identification with Vision AI."
+                    ),
+                    "properties": {
+                        "enabled": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Enable DOM extraction",
+                        },
+                        "selectors": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "CSS selectors for elements to extract",
+                        },
+                        "include_hidden": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Include hidden elements",
+                        },
+                        "min_text_length": {
+                            "type": "integer",
+                            "default": 1,
+                            "description": "Minimum text content length",
+                        },
+                        "max_elements": {
+                            "type": "integer",
+                            "default": 500,
+                            "description": "Maximum elements to extract",
                         },
                     },
-                    "localStorage": {
-                        "type": "object",
-                        "description": (
-                            "localStorage key-value pairs to inject before capture. "
-                            "For localStorage-based auth (Wasp, OpenSaaS, Firebase). "
-                            "Example: {'wasp:sessionId': 'abc123', 'theme': 'dark'}"
-                        ),
-                    },
-                    "sessionStorage": {
-                        "type": "object",
-                        "description": (
-                            "sessionStorage key-value pairs to inject before capture. "
-                            "For temporary session data. "
-                            "Example: {'tempToken': 'xyz789'}"
-                        ),
-                    },
-                    "extract_dom": {
+                },
+            },
+        },
+    ),
+    Tool(
+        name="screenshot_to_file",
+        description=(
+            "Capture a screenshot and save it to a file. Returns the file path. "
+            "Supports cookie injection for authenticated pages."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to capture (must include protocol)",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Path where the screenshot will be saved",
+                },
+                "screenshot_type": {
+                    "type": "string",
+                    "enum": ["viewport", "full_page"],
+                    "default": "viewport",
+                    "description": "Type of screenshot",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["png", "jpeg"],
+                    "default": "png",
+                    "description": "Output image format",
+                },
+                "width": {
+                    "type": "integer",
+                    "minimum": 320,
+                    "maximum": 3840,
+                    "default": 1920,
+                    "description": "Viewport width in pixels",
+                },
+                "height": {
+                    "type": "integer",
+                    "minimum": 240,
+                    "maximum": 2160,
+                    "default": 1080,
+                    "description": "Viewport height in pixels",
+                },
+                "quality": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 100,
+                    "default": 90,
+                    "description": "JPEG quality",
+                },
+                "wait_strategy": {
+                    "type": "string",
+                    "enum": ["domcontentloaded", "load", "networkidle"],
+                    "default": "networkidle",
+                    "description": (
+                        "Page load event to wait for before capture; "
+                        "domcontentloaded and load return sooner on busy pages"
+                    ),
+                },
+                "wait_for_timeout": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 30000,
+                    "default": 0,
+                    "description": "Wait time after page load in ms",
+                },
+                "wait_for_selector": {
+                    "type": "string",
+                    "description": "CSS selector to wait for",
+                },
+                "delay": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 10000,
+                    "default": 0,
+                    "description": "Delay before capture in ms",
+                },
+                "dark_mode": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Emulate dark color scheme",
+                },
+                "block_ads": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Block ad domains",
+                },
+                "cookies": {
+                    "type": "array",
+                    "description": "Cookies to inject for authenticated pages",
+                    "items": {
                         "type": "object",
-                        "description": (
-                            "Extract DOM element positions and text alongside screenshot. "
-                            "Enables hybrid text identification with Vision AI."
-                        ),
                         "properties": {
-                            "enabled": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Enable DOM extraction",
-                            },
-                            "selectors": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "CSS selectors for elements to extract",
-                            },
-                            "include_hidden": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Include hidden elements",
-                            },
-                            "min_text_length": {
-                                "type": "integer",
-                                "default": 1,
-                                "description": "Minimum text content length",
-                            },
-                            "max_elements": {
-                                "type": "integer",
-                                "default": 500,
-                                "description": "Maximum elements to extract",
+                            "name": {"type": "string", "description": "Cookie name"},
+                            "value": {"type": "string", "description": "Cookie value"},
+                            "domain": {"type": "string", "description": "Cookie domain"},
+                            "path": {"type": "string", "description": "Cookie path"},
+                            "httpOnly": {"type": "boolean", "description": "HTTP-only"},
+                            "secure": {"type": "boolean", "description": "Secure flag"},
+                            "sameSite": {
+                                "type": "string",
+                                "enum": ["Strict", "Lax", "None"],
+                                "description": "SameSite policy",
                             },
+                            "expires": {"type": "integer", "description": "Unix timestamp"},
+                        },
+                        "required": ["name", "value"],
+                    },
+                },
+                "localStorage": {
+                    "type": "object",
+                    "description": (
+                        "localStorage key-value pairs to inject before capture. "
+                        "For localStorage-based auth (Wasp, OpenSaaS, Firebase). "
+                        "Example: {'wasp:sessionId': 'abc123', 'theme': 'dark'}"
+                    ),
+                },
+                "sessionStorage": {
+                    "type": "object",
+                    "description": (
+                        "sessionStorage key-value pairs to inject before capture. "
+                        "For temporary session data. "
+                        "Example: {'tempToken': 'xyz789'}"
+                    ),
+                },
+                "extract_dom": {
+                    "type": "object",
+                    "description": (
+                        "Extract DOM element positions and text alongside screenshot. "
+                        "Enables hybrid text identification with Vision AI."
+                    ),
+                    "properties": {
+                        "enabled": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Enable DOM extraction",
+                        },
+                        "selectors": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "CSS selectors for elements to extract",
+                        },
+                        "include_hidden": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Include hidden elements",
+                        },
+                        "min_text_length": {
+                            "type": "integer",
+                            "default": 1,
+                            "description": "Minimum text content length",
+                        },
+                        "max_elements": {
+                            "type": "integer",
+                            "default": 500,
+                            "description": "Maximum elements to extract",
                         },
                     },
                 },
-                "required": ["url", "output_path"],
             },
-        ),
-    ]
+            "required": ["url", "output_path"],
+        },
+    ),
+)
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available screenshot tools."""
+    return list(_TOOLS)
 
 
 @server.call_tool()
@@ -363,42 +406,97 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
 
-def _parse_cookies(cookie_dicts: list[dict] | None) -> list[Cookie] | None:
-    """Convert cookie dictionaries to Cookie model instances."""
-    if not cookie_dicts:
-        return None
-    return [Cookie(**cookie) for cookie in cookie_dicts]
+def _build_request(arguments: dict, **overrides) -> "ScreenshotRequest":
+    """Validate tool arguments into a ScreenshotRequest in one pass.
+
+    Tool argument names match the model's fields, so the arguments are
+    validated directly; unknown keys (e.g. output_path) are ignored and
+    missing ones take the model defaults. Empty cookies and extract_dom
+    values are treated as absent.
+    """
+    from app.models import ScreenshotRequest
 
+    data = {**arguments, **overrides}
+    for key in ("cookies", "extract_dom"):
+        if not data.get(key):
+            data.pop(key, None)
+    return ScreenshotRequest.model_validate(data)
 
-def _parse_extract_dom(extract_dom_dict: dict | None) -> DomExtractionOptions | None:
-    """Convert extract_dom dictionary to DomExtractionOptions model."""
-    if not extract_dom_dict:
-        return None
-    return DomExtractionOptions(**extract_dom_dict)
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a temporary sibling file and os.replace.
+
+    Readers never see a partially written screenshot, and a failed write
+    leaves any existing file untouched. The temporary file gets a unique
+    name, so concurrent writes to the same path don't clobber each other
+    before the replace; the last one wins.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 async def handle_screenshot(arguments: dict) -> list[TextContent]:
-    """Capture a screenshot and return base64-encoded image."""
+    """Capture a screenshot and return base64-encoded image.
+
+    With a ``urls`` list, every URL is captured with the shared options,
+    up to MCP_BATCH_CONCURRENCY at a time, and one text result is returned
+    per URL in the given order. Exactly one of ``url`` and ``urls`` must be
+    given; the schema can't say so, as tool clients reject top-level anyOf.
+    """
+    urls = arguments.get("urls")
+    if urls is None:
+        if not arguments.get("url"):
+            return [TextContent(type="text", text="Screenshot failed: url or urls is required")]
+        return [await _screenshot_result(arguments)]
+    if arguments.get("url") is not None:
+        return [
+            TextContent(type="text", text="Screenshot failed: pass either url or urls, not both")
+        ]
+    if not urls or len(urls) > MCP_BATCH_MAX_URLS:
+        return [
+            TextContent(
+                type="text",
+                text=f"Screenshot failed: urls must list 1 to {MCP_BATCH_MAX_URLS} URLs",
+            )
+        ]
+
+    # Options shared by every URL, without the batch list itself
+    shared = {key: value for key, value in arguments.items() if key != "urls"}
+    semaphore = asyncio.Semaphore(MCP_BATCH_CONCURRENCY)
+
+    async def capture_one(url: str) -> TextContent:
+        async with semaphore:
+            return await _screenshot_result({**shared, "url": url})
+
+    # gather() rather than a TaskGroup: an error escaping one capture is
+    # reported for its URL instead of cancelling the rest of the batch
+    results = await asyncio.gather(
+        *(capture_one(url) for url in urls), return_exceptions=True
+    )
+    return [
+        TextContent(type="text", text=f"Screenshot failed: {str(result)}")
+        if isinstance(result, Exception)
+        else result
+        for result in results
+    ]
+
+
+async def _screenshot_result(arguments: dict) -> TextContent:
+    """Capture one screenshot and describe it as a text result.
+
+    Failures are reported in the text rather than raised, so one failing
+    URL of a batch doesn't cancel the others.
+    """
     try:
         service = await get_screenshot_service()
 
-        request = ScreenshotRequest(
-            url=arguments["url"],
-            screenshot_type=ScreenshotType(arguments.get("screenshot_type", "viewport")),
-            format=ImageFormat(arguments.get("format", "png")),
-            width=arguments.get("width", 1920),
-            height=arguments.get("height", 1080),
-            quality=arguments.get("quality", 90),
-            wait_for_timeout=arguments.get("wait_for_timeout", 0),
-            wait_for_selector=arguments.get("wait_for_selector"),
-            delay=arguments.get("delay", 0),
-            dark_mode=arguments.get("dark_mode", False),
-            block_ads=arguments.get("block_ads", False),
-            cookies=_parse_cookies(arguments.get("cookies")),
-            localStorage=arguments.get("localStorage"),
-            sessionStorage=arguments.get("sessionStorage"),
-            extract_dom=_parse_extract_dom(arguments.get("extract_dom")),
-        )
+        request = _build_request(arguments)
 
         result = await service.capture(request)
 
@@ -409,7 +507,10 @@ async def handle_screenshot(arguments: dict) -> list[TextContent]:
             screenshot_bytes, capture_time = result
             dom_result = None
 
-        base64_image = base64.b64encode(screenshot_bytes).decode("utf-8")
+        # base64 output is pure ASCII, the cheapest codec to decode
+        base64_image = binascii.b2a_base64(screenshot_bytes, newline=False).decode(
+            "ascii"
+        )
 
         # Build response text
         response_text = (
@@ -439,7 +540,8 @@ async def handle_screenshot(arguments: dict) -> list[TextContent]:
                 )
                 for el in dom_result["elements"]
             ]
-            quality_result = assess_extraction_quality(elements)
+            # Only quality and warnings are reported, so skip detailed metrics
+            quality_result = assess_extraction_quality(elements, detailed=False)
 
             response_text += (
                 f"\nDOM Extraction:\n"
@@ -460,17 +562,19 @@ async def handle_screenshot(arguments: dict) -> list[TextContent]:
                 for w in quality_result.warnings
             ]
 
-        response_text += f"\nBase64 image data:\n{base64_image}"
+        # Join the parts once so the (possibly MB-sized) image string is
+        # copied a single time instead of on every concatenation
+        parts = [response_text, "\nBase64 image data:\n", base64_image]
 
         # Include DOM data as JSON if extracted
         if dom_result:
             import json
-            response_text += f"\n\nDOM Elements (JSON):\n{json.dumps(dom_result, indent=2)}"
+            parts.append(f"\n\nDOM Elements (JSON):\n{json.dumps(dom_result, indent=2)}")
 
-        return [TextContent(type="text", text=response_text)]
+        return TextContent(type="text", text="".join(parts))
 
     except Exception as e:
-        return [TextContent(type="text", text=f"Screenshot failed: {str(e)}")]
+        return TextContent(type="text", text=f"Screenshot failed: {str(e)}")
 
 
 async def handle_screenshot_to_file(arguments: dict) -> list[TextContent]:
@@ -489,23 +593,7 @@ async def handle_screenshot_to_file(arguments: dict) -> list[TextContent]:
             else:
                 file_format = "png"
 
-        request = ScreenshotRequest(
-            url=arguments["url"],
-            screenshot_type=ScreenshotType(arguments.get("screenshot_type", "viewport")),
-            format=ImageFormat(file_format),
-            width=arguments.get("width", 1920),
-            height=arguments.get("height", 1080),
-            quality=arguments.get("quality", 90),
-            wait_for_timeout=arguments.get("wait_for_timeout", 0),
-            wait_for_selector=arguments.get("wait_for_selector"),
-            delay=arguments.get("delay", 0),
-            dark_mode=arguments.get("dark_mode", False),
-            block_ads=arguments.get("block_ads", False),
-            cookies=_parse_cookies(arguments.get("cookies")),
-            localStorage=arguments.get("localStorage"),
-            sessionStorage=arguments.get("sessionStorage"),
-            extract_dom=_parse_extract_dom(arguments.get("extract_dom")),
-        )
+        request = _build_request(arguments, format=file_format)
 
         result = await service.capture(request)
 
@@ -519,8 +607,9 @@ async def handle_screenshot_to_file(arguments: dict) -> list[TextContent]:
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write screenshot to file
-        output_path.write_bytes(screenshot_bytes)
+        # Write screenshot to file off the event loop so concurrent tool
+        # calls keep running during multi-MB writes
+        await asyncio.to_thread(_write_atomic, output_path, screenshot_bytes)
 
         # Build response text
         response_text = (
@@ -553,7 +642,8 @@ async def handle_screenshot_to_file(arguments: dict) -> list[TextContent]:
                 )
                 for el in dom_result["elements"]
             ]
-            quality_result = assess_extraction_quality(elements)
+            # Only quality and warnings are reported, so skip detailed metrics
+            quality_result = assess_extraction_quality(elements, detailed=False)
 
             response_text += (
                 f"\n\nDOM Extraction:\n"
@@ -0,0 +1,65 @@
+"""Shared pytest fixtures."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+# Default (image bytes, capture time ms) returned by the mocked capture
+FAKE_CAPTURE_RESULT = (b"fake_image", 100.0)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole run; building one per test is slow.
+
+    Not entered as a context manager, so the app lifespan (and the browser
+    bootstrap in it) never runs.
+    """
+    from app.main import app
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.fixture
+async def aclient():
+    """AsyncClient calling the ASGI app directly, without TestClient's portal thread."""
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client):
+    """The app's OpenAPI document, fetched and decoded once per run."""
+    return client.get("/openapi.json").json()
+
+
+async def _fake_capture(*args, **kwargs):
+    return FAKE_CAPTURE_RESULT
+
+
+@pytest.fixture(scope="class")
+def fake_capture():
+    """Stub screenshot_service.capture with a plain coroutine (no call recording).
+
+    Class-scoped: applied once for all cases of a class, reverted after it.
+    """
+    from app.main import screenshot_service
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(screenshot_service, "capture", _fake_capture)
+        yield
+
+
+@pytest.fixture
+def mock_capture(monkeypatch):
+    """Replace screenshot_service.capture with an AsyncMock for tests that set results."""
+    from app.main import screenshot_service
+
+    mock = AsyncMock(return_value=FAKE_CAPTURE_RESULT)
+    monkeypatch.setattr(screenshot_service, "capture", mock)
+    return mock
@@ -1,246 +1,181 @@
 """Tests for HTTP API endpoints - cookie parameter support."""
 
-from unittest.mock import patch
+import json
+from email import message_from_bytes
+from email.policy import HTTP
+from unittest.mock import AsyncMock
 
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import HTTPException
+
+from app.main import parse_cookie_string, screenshot_service
+from app.models import (
+    CoordinateMapping,
+    MultipartTile,
+    TileBounds,
+    TileConfig,
+    TiledScreenshotResponse,
+)
+
+# Mocked DOM extraction results, shared read-only by the quality tests
+
+# 10 elements -> LOW quality
+_LOW_QUALITY_DOM = {
+    "elements": [
+        {
+            "selector": f"#el-{i}",
+            "xpath": f"/html/body/p[{i}]",
+            "tag_name": "p",
+            "text": f"Paragraph text content {i}" * 3,  # >10 chars avg
+            "rect": {"x": 0, "y": i * 20, "width": 100, "height": 20},
+            "computed_style": {},
+            "is_visible": True,
+            "z_index": 0,
+        }
+        for i in range(10)
+    ],
+    "viewport": {"width": 1920, "height": 1080},
+    "extraction_time_ms": 25.0,
+    "element_count": 10,
+}
+
+_EMPTY_DOM = {
+    "elements": [],
+    "viewport": {"width": 1920, "height": 1080},
+    "extraction_time_ms": 5.0,
+    "element_count": 0,
+}
+
+# 25 diverse elements with headings -> eligible for GOOD
+_DIVERSE_TAGS = ["h1", "h2", "p", "span", "a", "li", "div"]
+_GOOD_QUALITY_DOM = {
+    "elements": [
+        {
+            "selector": f"#el-{i}",
+            "xpath": f"/html/body/el[{i}]",
+            "tag_name": _DIVERSE_TAGS[i % len(_DIVERSE_TAGS)],
+            "text": f"Element {i} with sufficient text content here",
+            "rect": {"x": 0, "y": i * 20, "width": 100, "height": 20},
+            "computed_style": {},
+            "is_visible": True,
+            "z_index": 0,
+        }
+        for i in range(25)
+    ],
+    "viewport": {"width": 1920, "height": 1080},
+    "extraction_time_ms": 30.0,
+    "element_count": 25,
+}
 
 
 class TestGetEndpointCookies:
     """Tests for GET /screenshot cookies query parameter."""
 
-    def test_get_endpoint_accepts_cookies_parameter(self):
-        """GET endpoint accepts cookies query parameter."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        # Mock the screenshot service to avoid actual browser calls
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.get(
-                "/screenshot",
-                params={
-                    "url": "https://example.com",
-                    "cookies": "session=abc123",
-                },
-            )
-
-            # Should not fail due to parameter validation
-            assert response.status_code in [200, 500]  # 500 if browser not ready
-
-    def test_get_endpoint_cookies_optional(self):
-        """GET endpoint works without cookies parameter."""
-        from app.main import app
+    @pytest.mark.usefixtures("fake_capture")
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"url": "https://example.com", "cookies": "session=abc123"},
+            {"url": "https://example.com"},
+            {"url": "https://example.com", "cookies": ""},
+        ],
+        ids=["cookies", "no_cookies", "empty_cookies"],
+    )
+    async def test_get_endpoint_accepts_cookies(self, aclient, params):
+        """GET endpoint accepts, omits or ignores an empty cookies parameter."""
+        response = await aclient.get("/screenshot", params=params)
 
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.get(
-                "/screenshot",
-                params={"url": "https://example.com"},
-            )
-
-            # Should work without cookies
-            assert response.status_code in [200, 500]
-
-    def test_get_endpoint_empty_cookies_string(self):
-        """GET endpoint handles empty cookies string."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.get(
-                "/screenshot",
-                params={
-                    "url": "https://example.com",
-                    "cookies": "",
-                },
-            )
-
-            # Should handle gracefully
-            assert response.status_code in [200, 500]
+        # Should not fail due to parameter validation (500 if browser not ready)
+        assert response.status_code in (200, 500)
 
 
 class TestCookieStringParsing:
     """Tests for parsing cookie strings from GET query parameter."""
 
-    def test_parse_single_cookie(self):
-        """Parse single cookie from string."""
-        from app.main import parse_cookie_string
-
-        cookies = parse_cookie_string("session=abc123")
-        assert len(cookies) == 1
-        assert cookies[0].name == "session"
-        assert cookies[0].value == "abc123"
-
-    def test_parse_multiple_cookies(self):
-        """Parse multiple semicolon-separated cookies."""
-        from app.main import parse_cookie_string
-
-        cookies = parse_cookie_string("session=abc123;user_id=456")
-        assert len(cookies) == 2
-        assert cookies[0].name == "session"
-        assert cookies[0].value == "abc123"
-        assert cookies[1].name == "user_id"
-        assert cookies[1].value == "456"
-
-    def test_parse_cookies_with_whitespace(self):
-        """Parse cookies with whitespace around semicolons."""
-        from app.main import parse_cookie_string
-
-        cookies = parse_cookie_string("session=abc123 ; user_id=456")
-        assert len(cookies) == 2
-        assert cookies[0].name == "session"
-        assert cookies[0].value == "abc123"
-        assert cookies[1].name == "user_id"
-        assert cookies[1].value == "456"
-
-    def test_parse_cookies_with_equals_in_value(self):
-        """Parse cookies where value contains equals sign."""
-        from app.main import parse_cookie_string
-
-        cookies = parse_cookie_string("token=abc=def=ghi")
-        assert len(cookies) == 1
-        assert cookies[0].name == "token"
-        assert cookies[0].value == "abc=def=ghi"
-
-    def test_parse_empty_string_returns_empty_list(self):
-        """Empty string returns empty cookie list."""
-        from app.main import parse_cookie_string
-
-        cookies = parse_cookie_string("")
-        assert cookies == []
-
-    def test_parse_none_returns_empty_list(self):
-        """None returns empty cookie list."""
-        from app.main import parse_cookie_string
-
-        cookies = parse_cookie_string(None)
-        assert cookies == []
+    @pytest.mark.parametrize(
+        "raw, names, values",
+        [
+            ("session=abc123", ["session"], ["abc123"]),
+            ("session=abc123;user_id=456", ["session", "user_id"], ["abc123", "456"]),
+            ("session=abc123 ; user_id=456", ["session", "user_id"], ["abc123", "456"]),
+            ("token=abc=def=ghi", ["token"], ["abc=def=ghi"]),
+            ("", [], []),
+            (None, [], []),
+        ],
+        ids=[
+            "single",
+            "multiple",
+            "whitespace",
+            "equals_in_value",
+            "empty_string",
+            "none",
+        ],
+    )
+    def test_parse_cookie_string(self, raw, names, values):
+        """Parse semicolon-separated name=value pairs; empty input gives []."""
+        cookies = parse_cookie_string(raw)
+        assert [cookie.name for cookie in cookies] == names
+        assert [cookie.value for cookie in cookies] == values
 
     def test_parse_invalid_format_raises_error(self):
         """Invalid cookie format (missing =) raises HTTPException."""
-        from fastapi import HTTPException
-
-        from app.main import parse_cookie_string
-
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(HTTPException, match="Invalid cookie format") as exc_info:
             parse_cookie_string("invalid_cookie_no_equals")
 
         assert exc_info.value.status_code == 400
-        assert "Invalid cookie format" in exc_info.value.detail
 
 
 class TestPostEndpointCookies:
     """Tests for POST /screenshot cookies in JSON body."""
 
-    def test_post_endpoint_accepts_cookies_array(self):
-        """POST endpoint accepts cookies array in request body."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot",
-                json={
-                    "url": "https://example.com",
-                    "cookies": [
-                        {"name": "session", "value": "abc123"},
-                        {"name": "user_id", "value": "456"},
-                    ],
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_post_endpoint_cookies_with_all_fields(self):
-        """POST endpoint accepts cookies with all optional fields."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot",
-                json={
-                    "url": "https://example.com",
-                    "cookies": [
-                        {
-                            "name": "session",
-                            "value": "abc123",
-                            "domain": "example.com",
-                            "path": "/app",
-                            "httpOnly": True,
-                            "secure": True,
-                            "sameSite": "Strict",
-                        },
-                    ],
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_post_endpoint_cookies_optional(self):
-        """POST endpoint works without cookies field."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot",
-                json={"url": "https://example.com"},
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_post_endpoint_validates_cookie_objects(self):
-        """POST endpoint validates cookie objects in array."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        response = client.post(
-            "/screenshot",
-            json={
+    @pytest.mark.usefixtures("fake_capture")
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {
                 "url": "https://example.com",
                 "cookies": [
-                    {"invalid": "cookie"},  # Missing required name/value
+                    {"name": "session", "value": "abc123"},
+                    {"name": "user_id", "value": "456"},
                 ],
             },
-        )
-
-        # Should return validation error
-        assert response.status_code == 422
-
-    def test_post_endpoint_validates_samesite(self):
-        """POST endpoint validates sameSite value."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        response = client.post(
-            "/screenshot",
-            json={
+            {
                 "url": "https://example.com",
                 "cookies": [
-                    {"name": "session", "value": "abc", "sameSite": "Invalid"},
+                    {
+                        "name": "session",
+                        "value": "abc123",
+                        "domain": "example.com",
+                        "path": "/app",
+                        "httpOnly": True,
+                        "secure": True,
+                        "sameSite": "Strict",
+                    },
                 ],
             },
+            {"url": "https://example.com"},
+        ],
+        ids=["cookies_array", "cookies_with_all_fields", "no_cookies"],
+    )
+    async def test_post_endpoint_accepts_cookies(self, aclient, body):
+        """POST endpoint accepts cookie arrays, all optional fields, or none."""
+        response = await aclient.post("/screenshot", json=body)
+
+        assert response.status_code in (200, 500)
+
+    @pytest.mark.parametrize(
+        "cookie",
+        [
+            {"invalid": "cookie"},  # Missing required name/value
+            {"name": "session", "value": "abc", "sameSite": "Invalid"},
+        ],
+        ids=["missing_name_value", "invalid_samesite"],
+    )
+    def test_post_endpoint_validates_cookies(self, client, cookie):
+        """POST endpoint rejects malformed cookie objects before capturing."""
+        response = client.post(
+            "/screenshot",
+            json={"url": "https://example.com", "cookies": [cookie]},
         )
 
         # Should return validation error
@@ -250,106 +185,37 @@ class TestPostEndpointCookies:
 class TestGetEndpointStorage:
     """Tests for GET /screenshot localStorage and sessionStorage parameters."""
 
-    def test_get_endpoint_accepts_localstorage_parameter(self):
-        """GET endpoint accepts localStorage query parameter."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.get(
-                "/screenshot",
-                params={
-                    "url": "https://example.com",
-                    "localStorage": "wasp:sessionId=abc123",
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_get_endpoint_accepts_sessionstorage_parameter(self):
-        """GET endpoint accepts sessionStorage query parameter."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.get(
-                "/screenshot",
-                params={
-                    "url": "https://example.com",
-                    "sessionStorage": "temp=data",
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_get_endpoint_accepts_multiple_storage_values(self):
-        """GET endpoint accepts semicolon-separated storage values."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.get(
-                "/screenshot",
-                params={
-                    "url": "https://example.com",
-                    "localStorage": "key1=val1;key2=val2;key3=val3",
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_get_endpoint_accepts_combined_cookies_and_storage(self):
-        """GET endpoint accepts cookies and storage together."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.get(
-                "/screenshot",
-                params={
-                    "url": "https://example.com",
-                    "cookies": "session=abc123",
-                    "localStorage": "wasp:sessionId=token",
-                    "sessionStorage": "temp=data",
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_get_endpoint_storage_optional(self):
-        """GET endpoint works without storage parameters."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.get(
-                "/screenshot",
-                params={"url": "https://example.com"},
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_get_endpoint_invalid_localstorage_format(self):
+    @pytest.mark.usefixtures("fake_capture")
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"url": "https://example.com", "localStorage": "wasp:sessionId=abc123"},
+            {"url": "https://example.com", "sessionStorage": "temp=data"},
+            {"url": "https://example.com", "localStorage": "key1=val1;key2=val2;key3=val3"},
+            {
+                "url": "https://example.com",
+                "cookies": "session=abc123",
+                "localStorage": "wasp:sessionId=token",
+                "sessionStorage": "temp=data",
+            },
+            {"url": "https://example.com"},
+        ],
+        ids=[
+            "localstorage",
+            "sessionstorage",
+            "multiple_values",
+            "combined_with_cookies",
+            "no_storage",
+        ],
+    )
+    async def test_get_endpoint_accepts_storage(self, aclient, params):
+        """GET endpoint accepts semicolon-separated storage parameters."""
+        response = await aclient.get("/screenshot", params=params)
+
+        assert response.status_code in (200, 500)
+
+    def test_get_endpoint_invalid_localstorage_format(self, client):
         """GET endpoint returns 400 for invalid localStorage format."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         response = client.get(
             "/screenshot",
             params={
@@ -364,112 +230,50 @@ class TestGetEndpointStorage:
 class TestPostEndpointStorage:
     """Tests for POST /screenshot localStorage and sessionStorage in JSON body."""
 
-    def test_post_endpoint_accepts_localstorage_object(self):
-        """POST endpoint accepts localStorage dict in request body."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot",
-                json={
-                    "url": "https://example.com",
-                    "localStorage": {"wasp:sessionId": "abc123", "theme": "dark"},
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_post_endpoint_accepts_sessionstorage_object(self):
-        """POST endpoint accepts sessionStorage dict in request body."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot",
-                json={
-                    "url": "https://example.com",
-                    "sessionStorage": {"temp": "data"},
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_post_endpoint_accepts_nested_objects(self):
-        """POST endpoint accepts nested objects in localStorage."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot",
-                json={
-                    "url": "https://example.com",
-                    "localStorage": {
-                        "user": {"id": 123, "name": "test"},
-                        "prefs": {"theme": "dark", "lang": "en"},
-                    },
-                },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_post_endpoint_combined_cookies_and_storage(self):
-        """POST endpoint accepts cookies and storage together."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot",
-                json={
-                    "url": "https://example.com",
-                    "cookies": [{"name": "tracking", "value": "123"}],
-                    "localStorage": {"wasp:sessionId": "abc123"},
-                    "sessionStorage": {"temp": "data"},
+    @pytest.mark.usefixtures("fake_capture")
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {
+                "url": "https://example.com",
+                "localStorage": {"wasp:sessionId": "abc123", "theme": "dark"},
+            },
+            {"url": "https://example.com", "sessionStorage": {"temp": "data"}},
+            {
+                "url": "https://example.com",
+                "localStorage": {
+                    "user": {"id": 123, "name": "test"},
+                    "prefs": {"theme": "dark", "lang": "en"},
                 },
-            )
-
-            assert response.status_code in [200, 500]
-
-    def test_post_endpoint_storage_optional(self):
-        """POST endpoint works without storage fields."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot",
-                json={"url": "https://example.com"},
-            )
-
-            assert response.status_code in [200, 500]
+            },
+            {
+                "url": "https://example.com",
+                "cookies": [{"name": "tracking", "value": "123"}],
+                "localStorage": {"wasp:sessionId": "abc123"},
+                "sessionStorage": {"temp": "data"},
+            },
+            {"url": "https://example.com"},
+        ],
+        ids=[
+            "localstorage",
+            "sessionstorage",
+            "nested_objects",
+            "combined_with_cookies",
+            "no_storage",
+        ],
+    )
+    async def test_post_endpoint_accepts_storage(self, aclient, body):
+        """POST endpoint accepts storage dicts, including nested values."""
+        response = await aclient.post("/screenshot", json=body)
+
+        assert response.status_code in (200, 500)
 
 
 class TestOpenAPISchemaExtractDom:
     """Tests for OpenAPI schema extract_dom parameter."""
 
-    def test_openapi_schema_includes_extract_dom(self):
+    def test_openapi_schema_includes_extract_dom(self, client):
         """OpenAPI schema includes extract_dom in ScreenshotRequest."""
-        from app.main import app
-
-        client = TestClient(app)
         response = client.get("/openapi.json")
         assert response.status_code == 200
 
@@ -481,15 +285,9 @@ class TestOpenAPISchemaExtractDom:
 
         assert "extract_dom" in properties
 
-    def test_openapi_schema_extract_dom_references_dom_extraction_options(self):
+    def test_openapi_schema_extract_dom_references_dom_extraction_options(self, openapi_schema):
         """OpenAPI extract_dom references DomExtractionOptions schema."""
-        from app.main import app
-
-        client = TestClient(app)
-        response = client.get("/openapi.json")
-        openapi = response.json()
-
-        schemas = openapi.get("components", {}).get("schemas", {})
+        schemas = openapi_schema.get("components", {}).get("schemas", {})
         screenshot_request = schemas.get("ScreenshotRequest", {})
         extract_dom_prop = screenshot_request.get("properties", {}).get("extract_dom", {})
 
@@ -501,26 +299,14 @@ class TestOpenAPISchemaExtractDom:
         elif "$ref" in extract_dom_prop:
             assert "DomExtractionOptions" in extract_dom_prop["$ref"]
 
-    def test_openapi_schema_has_dom_extraction_options(self):
+    def test_openapi_schema_has_dom_extraction_options(self, openapi_schema):
         """OpenAPI schema includes DomExtractionOptions type."""
-        from app.main import app
-
-        client = TestClient(app)
-        response = client.get("/openapi.json")
-        openapi = response.json()
-
-        schemas = openapi.get("components", {}).get("schemas", {})
+        schemas = openapi_schema.get("components", {}).get("schemas", {})
         assert "DomExtractionOptions" in schemas
 
-    def test_openapi_dom_extraction_options_has_all_fields(self):
+    def test_openapi_dom_extraction_options_has_all_fields(self, openapi_schema):
         """DomExtractionOptions schema has all expected fields."""
-        from app.main import app
-
-        client = TestClient(app)
-        response = client.get("/openapi.json")
-        openapi = response.json()
-
-        schemas = openapi.get("components", {}).get("schemas", {})
+        schemas = openapi_schema.get("components", {}).get("schemas", {})
         dom_options = schemas.get("DomExtractionOptions", {})
         properties = dom_options.get("properties", {})
 
@@ -534,157 +320,80 @@ class TestOpenAPISchemaExtractDom:
 class TestDomExtractionQualityIntegration:
     """Tests for DOM extraction quality assessment integration."""
 
-    def test_json_endpoint_returns_quality_when_dom_extracted(self):
+    def test_json_endpoint_returns_quality_when_dom_extracted(self, client, mock_capture):
         """POST /screenshot/json includes quality field when DOM extraction enabled."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        # Mock DOM extraction result with elements
-        mock_dom_result = {
-            "elements": [
-                {
-                    "selector": f"#el-{i}",
-                    "xpath": f"/html/body/p[{i}]",
-                    "tag_name": "p",
-                    "text": f"Paragraph text content {i}" * 3,  # >10 chars avg
-                    "rect": {"x": 0, "y": i * 20, "width": 100, "height": 20},
-                    "computed_style": {},
-                    "is_visible": True,
-                    "z_index": 0,
-                }
-                for i in range(10)  # 10 elements -> LOW quality
-            ],
-            "viewport": {"width": 1920, "height": 1080},
-            "extraction_time_ms": 25.0,
-            "element_count": 10,
-        }
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0, mock_dom_result)
+        mock_capture.return_value = (b"fake_image", 100.0, _LOW_QUALITY_DOM)
 
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "extract_dom": {"enabled": True},
-                },
-            )
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "extract_dom": {"enabled": True},
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                assert "dom_extraction" in data
-                assert data["dom_extraction"] is not None
-                # Quality field should be present
-                assert "quality" in data["dom_extraction"]
-                # With 10 elements, should be LOW
-                assert data["dom_extraction"]["quality"] == "low"
-                # Warnings should be present (as list)
-                assert "warnings" in data["dom_extraction"]
-                assert isinstance(data["dom_extraction"]["warnings"], list)
-
-    def test_json_endpoint_quality_is_empty_for_zero_elements(self):
+        if response.status_code == 200:
+            data = response.json()
+            assert "dom_extraction" in data
+            assert data["dom_extraction"] is not None
+            # Quality field should be present
+            assert "quality" in data["dom_extraction"]
+            # With 10 elements, should be LOW
+            assert data["dom_extraction"]["quality"] == "low"
+            # Warnings should be present (as list)
+            assert "warnings" in data["dom_extraction"]
+            assert isinstance(data["dom_extraction"]["warnings"], list)
+
+    def test_json_endpoint_quality_is_empty_for_zero_elements(self, client, mock_capture):
         """POST /screenshot/json returns EMPTY quality when no elements extracted."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
+        mock_capture.return_value = (b"fake_image", 100.0, _EMPTY_DOM)
 
-        mock_dom_result = {
-            "elements": [],
-            "viewport": {"width": 1920, "height": 1080},
-            "extraction_time_ms": 5.0,
-            "element_count": 0,
-        }
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0, mock_dom_result)
-
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "extract_dom": {"enabled": True},
-                },
-            )
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "extract_dom": {"enabled": True},
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                assert data["dom_extraction"]["quality"] == "empty"
-                # Should have NO_ELEMENTS warning
-                warning_codes = [w["code"] for w in data["dom_extraction"]["warnings"]]
-                assert "NO_ELEMENTS" in warning_codes
+        if response.status_code == 200:
+            data = response.json()
+            assert data["dom_extraction"]["quality"] == "empty"
+            # Should have NO_ELEMENTS warning
+            warning_codes = [w["code"] for w in data["dom_extraction"]["warnings"]]
+            assert "NO_ELEMENTS" in warning_codes
 
-    def test_json_endpoint_quality_good_for_diverse_extraction(self):
+    def test_json_endpoint_quality_good_for_diverse_extraction(self, client, mock_capture):
         """POST /screenshot/json returns GOOD quality for diverse extraction."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        # Create diverse elements with headings
-        tags = ["h1", "h2", "p", "span", "a", "li", "div"]
-        mock_dom_result = {
-            "elements": [
-                {
-                    "selector": f"#el-{i}",
-                    "xpath": f"/html/body/el[{i}]",
-                    "tag_name": tags[i % len(tags)],
-                    "text": f"Element {i} with sufficient text content here",
-                    "rect": {"x": 0, "y": i * 20, "width": 100, "height": 20},
-                    "computed_style": {},
-                    "is_visible": True,
-                    "z_index": 0,
-                }
-                for i in range(25)  # 25 elements -> eligible for GOOD
-            ],
-            "viewport": {"width": 1920, "height": 1080},
-            "extraction_time_ms": 30.0,
-            "element_count": 25,
-        }
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0, mock_dom_result)
+        mock_capture.return_value = (b"fake_image", 100.0, _GOOD_QUALITY_DOM)
 
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "extract_dom": {"enabled": True},
-                },
-            )
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "extract_dom": {"enabled": True},
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                assert data["dom_extraction"]["quality"] == "good"
+        if response.status_code == 200:
+            data = response.json()
+            assert data["dom_extraction"]["quality"] == "good"
 
-    def test_json_endpoint_no_quality_without_dom_extraction(self):
+    def test_json_endpoint_no_quality_without_dom_extraction(self, client, mock_capture):
         """POST /screenshot/json has no quality when DOM extraction disabled."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (b"fake_image", 100.0)
-
-            response = client.post(
-                "/screenshot/json",
-                json={"url": "https://example.com"},
-            )
+        response = client.post(
+            "/screenshot/json",
+            json={"url": "https://example.com"},
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                # dom_extraction should be null/None
-                assert data.get("dom_extraction") is None
+        if response.status_code == 200:
+            data = response.json()
+            # dom_extraction should be null/None
+            assert data.get("dom_extraction") is None
 
-    def test_openapi_schema_includes_quality_fields(self):
+    def test_openapi_schema_includes_quality_fields(self, openapi_schema):
         """OpenAPI schema includes quality and warnings in DomExtractionResult."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        response = client.get("/openapi.json")
-        openapi = response.json()
-
-        schemas = openapi.get("components", {}).get("schemas", {})
+        schemas = openapi_schema.get("components", {}).get("schemas", {})
         dom_result = schemas.get("DomExtractionResult", {})
         properties = dom_result.get("properties", {})
 
@@ -697,258 +406,231 @@ class TestDomExtractionQualityIntegration:
 class TestApiMetricsIntegration:
     """Tests for QualityMetrics API integration (Sprint 5.0)."""
 
-    def test_json_endpoint_with_include_metrics_true_returns_metrics(self):
+    def test_json_endpoint_with_include_metrics_true_returns_metrics(self, client, mock_capture):
         """POST /screenshot/json with include_metrics=true returns metrics."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         # Mock the screenshot service with DOM result
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (
-                b"fake_image",
-                100.0,
-                {
-                    "elements": [
-                        {
-                            "selector": "#test",
-                            "xpath": "/html/body/div",
-                            "tag_name": "h1",
-                            "text": "Test heading",
-                            "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
-                            "computed_style": {},
-                            "is_visible": True,
-                            "z_index": 0,
-                        },
-                        {
-                            "selector": "#para",
-                            "xpath": "/html/body/p",
-                            "tag_name": "p",
-                            "text": "Test paragraph",
-                            "rect": {"x": 0, "y": 50, "width": 100, "height": 30},
-                            "computed_style": {},
-                            "is_visible": True,
-                            "z_index": 0,
-                        },
-                    ],
-                    "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
-                    "extraction_time_ms": 10.5,
-                    "element_count": 2,
-                },
-            )
-
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "extract_dom": {
-                        "enabled": True,
-                        "include_metrics": True,
+        mock_capture.return_value = (
+            b"fake_image",
+            100.0,
+            {
+                "elements": [
+                    {
+                        "selector": "#test",
+                        "xpath": "/html/body/div",
+                        "tag_name": "h1",
+                        "text": "Test heading",
+                        "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
+                        "computed_style": {},
+                        "is_visible": True,
+                        "z_index": 0,
                     },
-                },
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                dom_extraction = data.get("dom_extraction")
-                assert dom_extraction is not None
-
-                # Metrics should be populated
-                metrics = dom_extraction.get("metrics")
-                assert metrics is not None
-                assert "element_count" in metrics
-                assert "visible_count" in metrics
-                assert "unique_tags" in metrics
-                assert "tag_distribution" in metrics
+                    {
+                        "selector": "#para",
+                        "xpath": "/html/body/p",
+                        "tag_name": "p",
+                        "text": "Test paragraph",
+                        "rect": {"x": 0, "y": 50, "width": 100, "height": 30},
+                        "computed_style": {},
+                        "is_visible": True,
+                        "z_index": 0,
+                    },
+                ],
+                "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
+                "extraction_time_ms": 10.5,
+                "element_count": 2,
+            },
+        )
 
-    def test_json_endpoint_without_include_metrics_returns_no_metrics(self):
-        """POST /screenshot/json without include_metrics returns no metrics."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (
-                b"fake_image",
-                100.0,
-                {
-                    "elements": [
-                        {
-                            "selector": "#test",
-                            "xpath": "/html/body/div",
-                            "tag_name": "h1",
-                            "text": "Test heading",
-                            "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
-                            "computed_style": {},
-                            "is_visible": True,
-                            "z_index": 0,
-                        },
-                    ],
-                    "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
-                    "extraction_time_ms": 10.5,
-                    "element_count": 1,
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "extract_dom": {
+                    "enabled": True,
+                    "include_metrics": True,
                 },
-            )
+            },
+        )
 
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "extract_dom": {
-                        "enabled": True,
-                        # include_metrics NOT specified (should default to False)
+        if response.status_code == 200:
+            data = response.json()
+            dom_extraction = data.get("dom_extraction")
+            assert dom_extraction is not None
+
+            # Metrics should be populated
+            metrics = dom_extraction.get("metrics")
+            assert metrics is not None
+            assert "element_count" in metrics
+            assert "visible_count" in metrics
+            assert "unique_tags" in metrics
+            assert "tag_distribution" in metrics
+
+    def test_json_endpoint_without_include_metrics_returns_no_metrics(self, client, mock_capture):
+        """POST /screenshot/json without include_metrics returns no metrics."""
+        mock_capture.return_value = (
+            b"fake_image",
+            100.0,
+            {
+                "elements": [
+                    {
+                        "selector": "#test",
+                        "xpath": "/html/body/div",
+                        "tag_name": "h1",
+                        "text": "Test heading",
+                        "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
+                        "computed_style": {},
+                        "is_visible": True,
+                        "z_index": 0,
                     },
+                ],
+                "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
+                "extraction_time_ms": 10.5,
+                "element_count": 1,
+            },
+        )
+
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "extract_dom": {
+                    "enabled": True,
+                    # include_metrics NOT specified (should default to False)
                 },
-            )
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                dom_extraction = data.get("dom_extraction")
-                assert dom_extraction is not None
+        if response.status_code == 200:
+            data = response.json()
+            dom_extraction = data.get("dom_extraction")
+            assert dom_extraction is not None
 
-                # Metrics should be null/None
-                metrics = dom_extraction.get("metrics")
-                assert metrics is None
+            # Metrics should be null/None
+            metrics = dom_extraction.get("metrics")
+            assert metrics is None
 
-    def test_json_endpoint_include_metrics_false_returns_no_metrics(self):
+    def test_json_endpoint_include_metrics_false_returns_no_metrics(self, client, mock_capture):
         """POST /screenshot/json with include_metrics=false returns no metrics."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (
-                b"fake_image",
-                100.0,
-                {
-                    "elements": [
-                        {
-                            "selector": "#test",
-                            "xpath": "/html/body/div",
-                            "tag_name": "h1",
-                            "text": "Test heading",
-                            "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
-                            "computed_style": {},
-                            "is_visible": True,
-                            "z_index": 0,
-                        },
-                    ],
-                    "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
-                    "extraction_time_ms": 10.5,
-                    "element_count": 1,
-                },
-            )
-
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "extract_dom": {
-                        "enabled": True,
-                        "include_metrics": False,
+        mock_capture.return_value = (
+            b"fake_image",
+            100.0,
+            {
+                "elements": [
+                    {
+                        "selector": "#test",
+                        "xpath": "/html/body/div",
+                        "tag_name": "h1",
+                        "text": "Test heading",
+                        "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
+                        "computed_style": {},
+                        "is_visible": True,
+                        "z_index": 0,
                     },
+                ],
+                "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
+                "extraction_time_ms": 10.5,
+                "element_count": 1,
+            },
+        )
+
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "extract_dom": {
+                    "enabled": True,
+                    "include_metrics": False,
                 },
-            )
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                dom_extraction = data.get("dom_extraction")
-                assert dom_extraction is not None
+        if response.status_code == 200:
+            data = response.json()
+            dom_extraction = data.get("dom_extraction")
+            assert dom_extraction is not None
 
-                # Metrics should be null/None
-                metrics = dom_extraction.get("metrics")
-                assert metrics is None
+            # Metrics should be null/None
+            metrics = dom_extraction.get("metrics")
+            assert metrics is None
 
-    def test_metrics_structure_matches_quality_metrics_schema(self):
+    def test_metrics_structure_matches_quality_metrics_schema(self, client, mock_capture):
         """Metrics structure matches QualityMetrics pydantic model schema."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (
-                b"fake_image",
-                100.0,
-                {
-                    "elements": [
-                        {
-                            "selector": "#h1",
-                            "xpath": "/html/body/h1",
-                            "tag_name": "h1",
-                            "text": "Heading",
-                            "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
-                            "computed_style": {},
-                            "is_visible": True,
-                            "z_index": 0,
-                        },
-                        {
-                            "selector": "#p1",
-                            "xpath": "/html/body/p[1]",
-                            "tag_name": "p",
-                            "text": "Paragraph 1",
-                            "rect": {"x": 0, "y": 50, "width": 100, "height": 30},
-                            "computed_style": {},
-                            "is_visible": True,
-                            "z_index": 0,
-                        },
-                        {
-                            "selector": "#p2",
-                            "xpath": "/html/body/p[2]",
-                            "tag_name": "p",
-                            "text": "Paragraph 2",
-                            "rect": {"x": 0, "y": 80, "width": 100, "height": 30},
-                            "computed_style": {},
-                            "is_visible": False,
-                            "z_index": 0,
-                        },
-                    ],
-                    "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
-                    "extraction_time_ms": 10.5,
-                    "element_count": 3,
-                },
-            )
-
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "extract_dom": {
-                        "enabled": True,
-                        "include_metrics": True,
+        mock_capture.return_value = (
+            b"fake_image",
+            100.0,
+            {
+                "elements": [
+                    {
+                        "selector": "#h1",
+                        "xpath": "/html/body/h1",
+                        "tag_name": "h1",
+                        "text": "Heading",
+                        "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
+                        "computed_style": {},
+                        "is_visible": True,
+                        "z_index": 0,
+                    },
+                    {
+                        "selector": "#p1",
+                        "xpath": "/html/body/p[1]",
+                        "tag_name": "p",
+                        "text": "Paragraph 1",
+                        "rect": {"x": 0, "y": 50, "width": 100, "height": 30},
+                        "computed_style": {},
+                        "is_visible": True,
+                        "z_index": 0,
+                    },
+                    {
+                        "selector": "#p2",
+                        "xpath": "/html/body/p[2]",
+                        "tag_name": "p",
+                        "text": "Paragraph 2",
+                        "rect": {"x": 0, "y": 80, "width": 100, "height": 30},
+                        "computed_style": {},
+                        "is_visible": False,
+                        "z_index": 0,
                     },
+                ],
+                "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
+                "extraction_time_ms": 10.5,
+                "element_count": 3,
+            },
+        )
+
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "extract_dom": {
+                    "enabled": True,
+                    "include_metrics": True,
                 },
-            )
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                metrics = data.get("dom_extraction", {}).get("metrics", {})
-
-                # Verify all 15 fields are present with correct values
-                assert metrics.get("element_count") == 3
-                assert metrics.get("visible_count") == 2
-                assert metrics.get("hidden_count") == 1
-                assert metrics.get("heading_count") == 1
-                assert metrics.get("unique_tag_count") == 2
-                assert metrics.get("visible_ratio") == pytest.approx(2/3)
-                assert metrics.get("hidden_ratio") == pytest.approx(1/3)
-                assert set(metrics.get("unique_tags", [])) == {"h1", "p"}
-                assert metrics.get("has_headings") is True
-                assert metrics.get("tag_distribution") == {"h1": 1, "p": 2}
-                assert "total_text_length" in metrics
-                assert "avg_text_length" in metrics
-                assert "min_text_length" in metrics
-                assert "max_text_length" in metrics
-
-    def test_openapi_schema_includes_metrics_field(self):
+        if response.status_code == 200:
+            data = response.json()
+            metrics = data.get("dom_extraction", {}).get("metrics", {})
+
+            # Verify all 15 fields are present with correct values
+            assert metrics.get("element_count") == 3
+            assert metrics.get("visible_count") == 2
+            assert metrics.get("hidden_count") == 1
+            assert metrics.get("heading_count") == 1
+            assert metrics.get("unique_tag_count") == 2
+            assert metrics.get("visible_ratio") == pytest.approx(2/3)
+            assert metrics.get("hidden_ratio") == pytest.approx(1/3)
+            assert metrics.get("unique_tags") == ["h1", "p"]
+            assert metrics.get("has_headings") is True
+            assert metrics.get("tag_distribution") == {"h1": 1, "p": 2}
+            assert "total_text_length" in metrics
+            assert "avg_text_length" in metrics
+            assert "min_text_length" in metrics
+            assert "max_text_length" in metrics
+
+    def test_openapi_schema_includes_metrics_field(self, openapi_schema):
         """OpenAPI schema includes metrics field in DomExtractionResult."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        response = client.get("/openapi.json")
-        openapi = response.json()
-
-        schemas = openapi.get("components", {}).get("schemas", {})
+        schemas = openapi_schema.get("components", {}).get("schemas", {})
         dom_result = schemas.get("DomExtractionResult", {})
         properties = dom_result.get("properties", {})
 
@@ -959,152 +641,134 @@ class TestApiMetricsIntegration:
 class TestApiVisionHintsIntegration:
     """Tests for VisionAIHints API integration (Sprint 5.0)."""
 
-    def test_json_endpoint_with_include_vision_hints_true_returns_vision_hints(self):
+    def test_json_endpoint_with_include_vision_hints_true_returns_vision_hints(
+        self, client, mock_capture
+    ):
         """POST /screenshot/json with include_vision_hints=true returns vision_hints."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (
-                b"fake_image",
-                100.0,
-                {
-                    "elements": [
-                        {
-                            "selector": "#test",
-                            "xpath": "/html/body/div",
-                            "tag_name": "h1",
-                            "text": "Test heading",
-                            "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
-                            "computed_style": {},
-                            "is_visible": True,
-                            "z_index": 0,
-                        },
-                    ],
-                    "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
-                    "extraction_time_ms": 10.5,
-                    "element_count": 1,
-                },
-            )
-
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "width": 1920,
-                    "height": 1080,
-                    "extract_dom": {
-                        "enabled": True,
-                        "include_vision_hints": True,
+        mock_capture.return_value = (
+            b"fake_image",
+            100.0,
+            {
+                "elements": [
+                    {
+                        "selector": "#test",
+                        "xpath": "/html/body/div",
+                        "tag_name": "h1",
+                        "text": "Test heading",
+                        "rect": {"x": 0, "y": 0, "width": 100, "height": 50},
+                        "computed_style": {},
+                        "is_visible": True,
+                        "z_index": 0,
                     },
+                ],
+                "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
+                "extraction_time_ms": 10.5,
+                "element_count": 1,
+            },
+        )
+
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "width": 1920,
+                "height": 1080,
+                "extract_dom": {
+                    "enabled": True,
+                    "include_vision_hints": True,
                 },
-            )
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                vision_hints = data.get("vision_hints")
-                assert vision_hints is not None
-
-                # Check required fields
-                assert "image_width" in vision_hints
-                assert "image_height" in vision_hints
-                assert "claude_compatible" in vision_hints
-                assert "gemini_compatible" in vision_hints
-                assert "gpt4v_compatible" in vision_hints
-                assert "qwen_compatible" in vision_hints
-                assert "estimated_resize_factor" in vision_hints
-                assert "tiling_recommended" in vision_hints
-
-    def test_json_endpoint_without_vision_hints_flag_returns_none(self):
+        if response.status_code == 200:
+            data = response.json()
+            vision_hints = data.get("vision_hints")
+            assert vision_hints is not None
+
+            # Check required fields
+            assert "image_width" in vision_hints
+            assert "image_height" in vision_hints
+            assert "claude_compatible" in vision_hints
+            assert "gemini_compatible" in vision_hints
+            assert "gpt4v_compatible" in vision_hints
+            assert "qwen_compatible" in vision_hints
+            assert "estimated_resize_factor" in vision_hints
+            assert "tiling_recommended" in vision_hints
+
+    def test_json_endpoint_without_vision_hints_flag_returns_none(self, client, mock_capture):
         """POST /screenshot/json without include_vision_hints returns no vision_hints."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (
-                b"fake_image",
-                100.0,
-                {
-                    "elements": [],
-                    "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
-                    "extraction_time_ms": 1.0,
-                    "element_count": 0,
-                },
-            )
+        mock_capture.return_value = (
+            b"fake_image",
+            100.0,
+            {
+                "elements": [],
+                "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
+                "extraction_time_ms": 1.0,
+                "element_count": 0,
+            },
+        )
 
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "extract_dom": {
-                        "enabled": True,
-                        "include_vision_hints": False,
-                    },
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "extract_dom": {
+                    "enabled": True,
+                    "include_vision_hints": False,
                 },
-            )
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                # Vision hints should be None when not requested
-                assert data.get("vision_hints") is None
+        if response.status_code == 200:
+            data = response.json()
+            # Vision hints should be None when not requested
+            assert data.get("vision_hints") is None
 
-    def test_vision_hints_contains_correct_compatibility_for_small_image(self):
+    def test_vision_hints_contains_correct_compatibility_for_small_image(
+        self, client, mock_capture
+    ):
         """Vision hints shows all models compatible for small image."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        with patch("app.main.screenshot_service.capture") as mock_capture:
-            mock_capture.return_value = (
-                b"fake_image" * 1000,  # 10000 bytes
-                100.0,
-                {
-                    "elements": [],
-                    "viewport": {"width": 1280, "height": 720, "deviceScaleFactor": 1},
-                    "extraction_time_ms": 1.0,
-                    "element_count": 0,
-                },
-            )
+        mock_capture.return_value = (
+            b"fake_image" * 1000,  # 10000 bytes
+            100.0,
+            {
+                "elements": [],
+                "viewport": {"width": 1280, "height": 720, "deviceScaleFactor": 1},
+                "extraction_time_ms": 1.0,
+                "element_count": 0,
+            },
+        )
 
-            response = client.post(
-                "/screenshot/json",
-                json={
-                    "url": "https://example.com",
-                    "width": 1280,
-                    "height": 720,
-                    "extract_dom": {
-                        "enabled": True,
-                        "include_vision_hints": True,
-                    },
+        response = client.post(
+            "/screenshot/json",
+            json={
+                "url": "https://example.com",
+                "width": 1280,
+                "height": 720,
+                "extract_dom": {
+                    "enabled": True,
+                    "include_vision_hints": True,
                 },
-            )
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                vision_hints = data.get("vision_hints")
-
-                if vision_hints:
-                    # Small image (1280x720) should be compatible with all models
-                    assert vision_hints["image_width"] == 1280
-                    assert vision_hints["image_height"] == 720
-                    assert vision_hints["claude_compatible"] is True
-                    assert vision_hints["gemini_compatible"] is True
-                    assert vision_hints["gpt4v_compatible"] is True
-                    assert vision_hints["qwen_compatible"] is True
-                    assert vision_hints["tiling_recommended"] is False
-
-    def test_openapi_schema_includes_vision_hints_field(self):
+        if response.status_code == 200:
+            data = response.json()
+            vision_hints = data.get("vision_hints")
+
+            if vision_hints:
+                # Small image (1280x720) should be compatible with all models
+                assert vision_hints["image_width"] == 1280
+                assert vision_hints["image_height"] == 720
+                assert vision_hints["claude_compatible"] is True
+                assert vision_hints["gemini_compatible"] is True
+                assert vision_hints["gpt4v_compatible"] is True
+                assert vision_hints["qwen_compatible"] is True
+                assert vision_hints["tiling_recommended"] is False
+
+    def test_openapi_schema_includes_vision_hints_field(self, openapi_schema):
         """OpenAPI schema includes vision_hints field in ScreenshotResponse."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
-        response = client.get("/openapi.json")
-        openapi = response.json()
-
-        schemas = openapi.get("components", {}).get("schemas", {})
+        schemas = openapi_schema.get("components", {}).get("schemas", {})
         screenshot_response = schemas.get("ScreenshotResponse", {})
         properties = screenshot_response.get("properties", {})
 
@@ -1123,12 +787,8 @@ class TestTiledScreenshotEndpoint:
     AC: 01-02 - Tiled Endpoint
     """
 
-    def test_tiled_endpoint_exists(self):
+    def test_tiled_endpoint_exists(self, client):
         """POST /screenshot/tiled endpoint exists."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         response = client.post(
             "/screenshot/tiled",
             json={"url": "https://example.com"},
@@ -1138,12 +798,8 @@ class TestTiledScreenshotEndpoint:
         assert response.status_code != 405
         assert response.status_code != 404
 
-    def test_tiled_endpoint_success(self):
+    def test_tiled_endpoint_success(self, client):
         """POST /screenshot/tiled returns 200 with tiles."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         response = client.post(
             "/screenshot/tiled",
             json={"url": "https://example.com"},
@@ -1157,12 +813,8 @@ class TestTiledScreenshotEndpoint:
             assert "tile_config" in data
             assert "coordinate_mapping" in data
 
-    def test_tiled_endpoint_default_values(self):
+    def test_tiled_endpoint_default_values(self, client):
         """POST /screenshot/tiled uses default tile dimensions."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         response = client.post(
             "/screenshot/tiled",
             json={"url": "https://example.com"},
@@ -1176,12 +828,8 @@ class TestTiledScreenshotEndpoint:
             assert config.get("tile_height") == 1568
             assert config.get("overlap") == 50
 
-    def test_tiled_endpoint_custom_config(self):
+    def test_tiled_endpoint_custom_config(self, client):
         """POST /screenshot/tiled accepts custom tile dimensions."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         response = client.post(
             "/screenshot/tiled",
             json={
@@ -1199,12 +847,8 @@ class TestTiledScreenshotEndpoint:
             assert config.get("tile_height") == 800
             assert config.get("overlap") == 100
 
-    def test_tiled_endpoint_invalid_overlap(self):
+    def test_tiled_endpoint_invalid_overlap(self, client):
         """POST /screenshot/tiled returns 422 for overlap >= tile dimension."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         response = client.post(
             "/screenshot/tiled",
             json={
@@ -1218,12 +862,8 @@ class TestTiledScreenshotEndpoint:
         # Should return validation error
         assert response.status_code == 422
 
-    def test_tiled_endpoint_max_tile_count_respected(self):
+    def test_tiled_endpoint_max_tile_count_respected(self, client):
         """POST /screenshot/tiled respects max_tile_count parameter."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         response = client.post(
             "/screenshot/tiled",
             json={
@@ -1238,12 +878,8 @@ class TestTiledScreenshotEndpoint:
             data = response.json()
             assert len(data["tiles"]) <= 5
 
-    def test_tiled_endpoint_response_structure(self):
+    def test_tiled_endpoint_response_structure(self, client):
         """POST /screenshot/tiled response has expected structure."""
-        from app.main import app
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         response = client.post(
             "/screenshot/tiled",
             json={"url": "https://example.com"},
@@ -1270,16 +906,85 @@ class TestTiledScreenshotEndpoint:
                 assert "image_base64" in tile
                 assert "file_size_bytes" in tile
 
-    def test_tiled_endpoint_openapi_schema(self):
-        """OpenAPI schema includes tiled endpoint."""
-        from app.main import app
+    def test_tiled_endpoint_multipart_response(self, client, monkeypatch):
+        """response_format=multipart returns JSON metadata then raw tile parts."""
+        images = [b"\x89PNG-tile-0", b"\x89PNG-tile-1"]
+        tiles = [
+            MultipartTile(
+                index=i,
+                row=i,
+                column=0,
+                bounds=TileBounds(
+                    index=i, row=i, column=0, x=0, y=i * 750, width=1200, height=800
+                ),
+                image_bytes=image,
+                file_size_bytes=len(image),
+            )
+            for i, image in enumerate(images)
+        ]
+        result = TiledScreenshotResponse(
+            url="https://example.com",
+            full_page_dimensions={"width": 1200, "height": 1550},
+            tile_config=TileConfig(
+                tile_width=1200,
+                tile_height=800,
+                overlap=50,
+                total_tiles=2,
+                grid={"rows": 2, "columns": 1},
+            ),
+            tiles=tiles,
+            capture_time_ms=10.0,
+            coordinate_mapping=CoordinateMapping(
+                type="tile_offset",
+                instructions="Add tile offset",
+                full_page_width=1200,
+                full_page_height=1550,
+            ),
+        )
 
-        client = TestClient(app, raise_server_exceptions=False)
+        monkeypatch.setattr(
+            screenshot_service, "capture_tiled", AsyncMock(return_value=result)
+        )
+        response = client.post(
+            "/screenshot/tiled",
+            json={"url": "https://example.com", "response_format": "multipart"},
+        )
 
-        response = client.get("/openapi.json")
-        openapi = response.json()
+        assert response.status_code == 200
+        content_type = response.headers["content-type"]
+        assert content_type.startswith("multipart/mixed; boundary=")
 
-        paths = openapi.get("paths", {})
+        # Parse the body back with a MIME parser
+        message = message_from_bytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + response.content,
+            policy=HTTP,
+        )
+        assert message.is_multipart()
+        parts = message.get_payload()
+        assert len(parts) == 1 + len(images)
+
+        assert parts[0].get_content_type() == "application/json"
+        metadata = json.loads(parts[0].get_payload(decode=True))
+        assert [tile["index"] for tile in metadata["tiles"]] == [0, 1]
+        assert "image_base64" not in metadata["tiles"][0]
+        assert "image_bytes" not in metadata["tiles"][0]
+
+        for i, (part, image) in enumerate(zip(parts[1:], images)):
+            assert part.get_content_type() == "image/png"
+            assert part["Content-ID"] == f"<tile-{i}>"
+            assert int(part["Content-Length"]) == len(image)
+            assert part.get_payload(decode=True) == image
+
+    def test_tile_image_base64_required_in_schema(self, openapi_schema):
+        """The public Tile schema keeps image_base64 required."""
+        tile_schema = openapi_schema["components"]["schemas"]["Tile"]
+        assert "image_base64" in tile_schema["required"]
+        assert "image_bytes" not in tile_schema["properties"]
+        assert "MultipartTile" not in openapi_schema["components"]["schemas"]
+
+    def test_tiled_endpoint_openapi_schema(self, openapi_schema):
+        """OpenAPI schema includes tiled endpoint."""
+        paths = openapi_schema.get("paths", {})
         # Should have /screenshot/tiled path
         assert "/screenshot/tiled" in paths
 
@@ -1,34 +1,77 @@
 """Tests for cookie security - isolation and logging protection."""
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.main import parse_cookie_string
+from app.models import Cookie, ScreenshotRequest
+from app.screenshot import ScreenshotService
 
 
 class TestCookieIsolation:
     """Tests for cookie isolation between requests."""
 
-    def test_fresh_context_per_request(self):
-        """Each screenshot request gets a fresh browser context."""
-        # This is verified by the architecture - _get_page creates new context
-        # and closes it in the finally block
-        from app.screenshot import ScreenshotService
-
+    @pytest.mark.parametrize(
+        "extra,pooled",
+        [
+            ({}, True),
+            ({"cookies": [Cookie(name="session", value="abc123")]}, False),
+            ({"localStorage": {"token": "abc123"}}, False),
+        ],
+    )
+    async def test_fresh_context_with_cookies_or_storage(self, extra, pooled):
+        """Cookies or storage get a fresh context; other requests reuse a reset pool."""
         service = ScreenshotService()
-        # The context is created fresh in _get_page and closed after use
-        # Cookie isolation is guaranteed by this pattern
-        assert service._browser is None  # Not initialized until first use
-
-    def test_context_closes_on_error(self):
+        context = MagicMock()
+        context.new_page = AsyncMock()
+        context.add_cookies = AsyncMock()
+        context.add_init_script = AsyncMock()
+        context.close = AsyncMock()
+        service._wait_ready = AsyncMock()
+        service._new_context = AsyncMock(return_value=context)
+        service._acquire_page = AsyncMock(return_value=(context, MagicMock(), 0))
+        service._release_page = AsyncMock()
+
+        request = ScreenshotRequest(url="https://example.com", **extra)
+        async with service._get_page(request, "https://example.com/"):
+            pass
+
+        if pooled:
+            # Pooled contexts are reset (cookies, storage, cache) on release
+            service._acquire_page.assert_awaited_once()
+            service._release_page.assert_awaited_once()
+            service._new_context.assert_not_awaited()
+        else:
+            # Credentials never enter or leave the pool
+            service._new_context.assert_awaited_once()
+            service._acquire_page.assert_not_awaited()
+            service._release_page.assert_not_awaited()
+            context.close.assert_awaited_once()
+
+    async def test_context_closes_on_error(self):
         """Context closes properly even if an error occurs."""
-        # This is tested by examining the _get_page implementation
-        # The finally block ensures context.close() is called
-        import inspect
-
-        from app.screenshot import ScreenshotService
-
         service = ScreenshotService()
-        source = inspect.getsource(service._get_page)
-        assert "finally:" in source
-        assert "context.close()" in source
+        context = MagicMock()
+        context.new_page = AsyncMock()
+        context.add_cookies = AsyncMock()
+        context.close = AsyncMock()
+        service._wait_ready = AsyncMock()
+        service._new_context = AsyncMock(return_value=context)
+
+        # Cookies force a fresh, unpooled context
+        request = ScreenshotRequest(
+            url="https://example.com",
+            cookies=[Cookie(name="session", value="abc123")],
+        )
+        with pytest.raises(RuntimeError):
+            async with service._get_page(request, "https://example.com/"):
+                raise RuntimeError("capture failed")
+
+        context.add_cookies.assert_awaited_once()
+        context.close.assert_awaited_once()
 
 
 class TestCookieLoggingSecurity:
@@ -36,8 +79,6 @@ class TestCookieLoggingSecurity:
 
     def test_cookie_repr_masks_value(self):
         """Cookie __repr__ masks the value for security."""
-        from app.models import Cookie
-
         cookie = Cookie(name="session", value="supersecret123")
         repr_str = repr(cookie)
 
@@ -50,8 +91,6 @@ class TestCookieLoggingSecurity:
 
     def test_cookie_str_also_masks(self):
         """Cookie string conversion also masks value."""
-        from app.models import Cookie
-
         cookie = Cookie(name="auth", value="token12345")
         str_repr = str(cookie)
 
@@ -61,14 +100,11 @@ class TestCookieLoggingSecurity:
 
     def test_multiple_cookies_all_masked(self):
         """All cookies in a list have values masked."""
-        from app.models import Cookie
-
         cookies = [
             Cookie(name="session", value="secret1"),
             Cookie(name="auth", value="secret2"),
             Cookie(name="tracking", value="secret3"),
         ]
-
         for cookie in cookies:
             repr_str = repr(cookie)
             assert cookie.value not in repr_str
@@ -79,22 +115,13 @@ class TestCookieValidationErrors:
 
     def test_invalid_cookie_format_returns_400(self):
         """Invalid cookie format in GET returns 400 with clear message."""
-        from fastapi import HTTPException
-
-        from app.main import parse_cookie_string
-
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(HTTPException, match="Invalid cookie format") as exc_info:
             parse_cookie_string("no_equals_sign")
 
         assert exc_info.value.status_code == 400
-        assert "Invalid cookie format" in exc_info.value.detail
 
     def test_error_message_does_not_contain_value(self):
         """Error messages don't leak cookie values."""
-        from fastapi import HTTPException
-
-        from app.main import parse_cookie_string
-
         # Even if the cookie string has sensitive data mixed in,
         # we only show the problematic part in the error
         with pytest.raises(HTTPException) as exc_info:
@@ -107,27 +134,15 @@ class TestCookieValidationErrors:
 
     def test_pydantic_validation_for_missing_name(self):
         """Pydantic validation catches missing name field."""
-        from pydantic import ValidationError
-
-        from app.models import Cookie
-
         with pytest.raises(ValidationError):
             Cookie(value="test")  # type: ignore
 
     def test_pydantic_validation_for_missing_value(self):
         """Pydantic validation catches missing value field."""
-        from pydantic import ValidationError
-
-        from app.models import Cookie
-
         with pytest.raises(ValidationError):
             Cookie(name="test")  # type: ignore
 
     def test_pydantic_validation_for_invalid_samesite(self):
         """Pydantic validation catches invalid sameSite value."""
-        from pydantic import ValidationError
-
-        from app.models import Cookie
-
         with pytest.raises(ValidationError):
             Cookie(name="test", value="val", sameSite="BadValue")
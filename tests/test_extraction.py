@@ -944,3 +944,120 @@ class TestDocumentDimensions:
             # Document width should be >= 4000
             assert viewport["document_width"] >= 4000
             await browser.close()
+
+
+class TestBinElementsByTile:
+    """Tests for binElementsByTile() JavaScript function."""
+
+    RESULT = """{
+        elements: [
+            {tag_name: 'h1', rect: {x: 0, y: -990, width: 100, height: 20}, is_fixed: false},
+            {tag_name: 'p', rect: {x: 0, y: -10, width: 100, height: 20}, is_fixed: false},
+            {tag_name: 'hr', rect: {x: 0, y: -20, width: 100, height: 20}, is_fixed: false},
+            {tag_name: 'nav', rect: {x: 0, y: 0, width: 100, height: 20}, is_fixed: true}
+        ],
+        viewport: {width: 1280, height: 1000},
+        extraction_time_ms: 1,
+        element_count: 4
+    }"""
+    TILES = """[
+        {index: 0, x: 0, y: 0, width: 1280, height: 1000},
+        {index: 1, x: 0, y: 1000, width: 1280, height: 1000}
+    ]"""
+
+    async def _bin(self):
+        from playwright.async_api import async_playwright
+
+        from app.dom_extraction import get_extraction_script
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            page = await browser.new_page(viewport={"width": 1280, "height": 1000})
+            await page.set_content('<div style="height: 5000px"></div>')
+            # Scrolled to the second tile: rects are viewport-relative
+            await page.evaluate("window.scrollTo(0, 1000)")
+            result = await page.evaluate(
+                f"""
+                {get_extraction_script()}
+                binElementsByTile({self.RESULT}, {self.TILES});
+                """
+            )
+            await browser.close()
+        return result
+
+    @pytest.mark.asyncio
+    async def test_elements_binned_by_overlap(self):
+        """Elements go to each tile they overlap, in page coordinates."""
+        top, bottom = (await self._bin())["tiles"]
+
+        assert [e["tag_name"] for e in top] == ["h1", "p", "hr", "nav"]
+        assert [e["tag_name"] for e in bottom] == ["p", "hr", "nav"]
+        spanning = bottom[0]
+        assert spanning["rect"]["y"] == 990
+        assert spanning["tile_relative_rect"]["y"] == -10
+        assert spanning["tile_index"] == 1
+
+    @pytest.mark.asyncio
+    async def test_touching_edge_counts_as_overlap(self):
+        """An element ending exactly at a tile's top edge is in that tile."""
+        bottom = (await self._bin())["tiles"][1]
+
+        hr = next(e for e in bottom if e["tag_name"] == "hr")
+        assert hr["rect"]["y"] + hr["rect"]["height"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_fixed_elements_repeat_at_viewport_position(self):
+        """Fixed elements keep their viewport rect in every tile."""
+        result = await self._bin()
+
+        nav = result["tiles"][1][-1]
+        assert nav["tile_relative_rect"]["y"] == 0
+        assert nav["rect"]["y"] == 1000
+        assert result["viewport"]["width"] == 1280
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "x,y,overlaps",
+        [
+            (150, 1200, True),  # inside
+            (150, 990, True),  # crossing the top edge
+            (50, 1200, True),  # ends exactly at the left edge
+            (150, 980, True),  # ends exactly at the top edge
+            (300, 1200, True),  # starts exactly at the right edge
+            (150, 1500, True),  # starts exactly at the bottom edge
+            (49, 1200, False),
+            (150, 979, False),
+            (301, 1200, False),
+            (150, 1501, False),
+        ],
+    )
+    async def test_overlap_rule_on_every_edge(self, x, y, overlaps):
+        """Touching edges overlap; one pixel clear of any edge does not."""
+        from playwright.async_api import async_playwright
+
+        from app.dom_extraction import get_extraction_script
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            page = await browser.new_page(viewport={"width": 1280, "height": 1000})
+            # Unscrolled, so the 50x20 rect is already in page coordinates
+            result = await page.evaluate(
+                f"""
+                {get_extraction_script()}
+                binElementsByTile(
+                    {{
+                        elements: [{{
+                            tag_name: 'p',
+                            rect: {{x: {x}, y: {y}, width: 50, height: 20}},
+                            is_fixed: false
+                        }}],
+                        viewport: {{width: 1280, height: 1000}},
+                        extraction_time_ms: 1
+                    }},
+                    [{{index: 1, x: 100, y: 1000, width: 200, height: 500}}]
+                );
+                """
+            )
+            await browser.close()
+
+        assert len(result["tiles"][0]) == (1 if overlaps else 0)
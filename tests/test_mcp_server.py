@@ -3,6 +3,22 @@
 import pytest
 
 
+class TestToolListing:
+    """Tests for listing the server's tools."""
+
+    @pytest.mark.asyncio
+    async def test_tools_built_once(self):
+        """list_tools returns new lists of the same prebuilt Tool objects."""
+        from screenshot_mcp.server import list_tools
+
+        first = await list_tools()
+        second = await list_tools()
+
+        assert first is not second
+        assert [t.name for t in first] == ["screenshot", "screenshot_to_file"]
+        assert all(a is b for a, b in zip(first, second))
+
+
 class TestMCPInputSchemaCookies:
     """Tests for MCP tool inputSchema cookies parameter."""
 
@@ -120,6 +136,60 @@ class TestMCPHandlersCookiePassthrough:
             assert request.cookies[0].name == "session"
             assert request.cookies[0].value == "abc123"
 
+    @pytest.mark.asyncio
+    async def test_handle_screenshot_embeds_base64_image(self):
+        """handle_screenshot returns the image as unwrapped base64 text."""
+        import base64
+        from unittest.mock import AsyncMock, patch
+
+        with patch("screenshot_mcp.server.get_screenshot_service") as mock_get_service:
+            mock_service = AsyncMock()
+            mock_service.capture.return_value = (b"fake_image" * 20, 100.0)
+            mock_get_service.return_value = mock_service
+
+            from screenshot_mcp.server import handle_screenshot
+
+            result = await handle_screenshot({"url": "https://example.com"})
+
+            expected = base64.b64encode(b"fake_image" * 20).decode("ascii")
+            assert result[0].text.endswith(f"\nBase64 image data:\n{expected}")
+
+    @pytest.mark.asyncio
+    async def test_handle_screenshot_to_file_writes_atomically(self, tmp_path):
+        """The screenshot is written in full and no temporary file remains."""
+        from unittest.mock import AsyncMock, patch
+
+        with patch("screenshot_mcp.server.get_screenshot_service") as mock_get_service:
+            mock_service = AsyncMock()
+            mock_service.capture.return_value = (b"fake_image", 100.0)
+            mock_get_service.return_value = mock_service
+
+            from screenshot_mcp.server import handle_screenshot_to_file
+
+            output_path = tmp_path / "shots" / "page.png"
+            result = await handle_screenshot_to_file({
+                "url": "https://example.com",
+                "output_path": str(output_path),
+            })
+
+            assert "saved successfully" in result[0].text
+            assert output_path.read_bytes() == b"fake_image"
+            assert [p.name for p in output_path.parent.iterdir()] == ["page.png"]
+
+    def test_concurrent_writes_to_one_path_use_separate_temp_files(self, tmp_path):
+        """Parallel writes of the same path each replace it with a whole image."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from screenshot_mcp.server import _write_atomic
+
+        output_path = tmp_path / "page.png"
+        payloads = [bytes([i]) * 200_000 for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda data: _write_atomic(output_path, data), payloads))
+
+        assert output_path.read_bytes() in payloads
+        assert [p.name for p in tmp_path.iterdir()] == ["page.png"]
+
     @pytest.mark.asyncio
     async def test_handle_screenshot_to_file_accepts_cookies_argument(self):
         """handle_screenshot_to_file accepts cookies in arguments."""
@@ -399,3 +469,185 @@ class TestMCPQualityIntegration:
                 # Should include quality in response
                 assert "Quality:" in response_text
                 assert "low" in response_text.lower()
+
+
+class TestBuildRequest:
+    """Tests for validating tool arguments into a ScreenshotRequest."""
+
+    def test_arguments_validated_with_defaults(self):
+        """Tool arguments map onto model fields; extra keys are ignored."""
+        from app.models import ImageFormat, ScreenshotType
+        from screenshot_mcp.server import _build_request
+
+        request = _build_request({
+            "url": "https://example.com",
+            "screenshot_type": "full_page",
+            "output_path": "/tmp/page.png",
+            "localStorage": {"token": "abc"},
+        })
+
+        assert request.screenshot_type == ScreenshotType.FULL_PAGE
+        assert request.format == ImageFormat.PNG
+        assert request.width == 1920
+        assert request.localStorage == {"token": "abc"}
+
+    @pytest.mark.asyncio
+    async def test_wait_strategy_in_schemas_and_request(self):
+        """Both tools expose wait_strategy and it reaches the request."""
+        from app.models import ScreenshotRequest
+        from screenshot_mcp.server import _build_request, list_tools
+
+        expected = list(
+            ScreenshotRequest.model_json_schema()["properties"]["wait_strategy"]["enum"]
+        )
+        for tool in await list_tools():
+            assert tool.inputSchema["properties"]["wait_strategy"]["enum"] == expected
+
+        request = _build_request({"url": "https://example.com", "wait_strategy": "load"})
+        assert request.wait_strategy == "load"
+
+    def test_empty_cookies_and_extract_dom_are_absent(self):
+        """Empty cookies and extract_dom become None, as before."""
+        from screenshot_mcp.server import _build_request
+
+        request = _build_request(
+            {"url": "https://example.com", "cookies": [], "extract_dom": {}},
+            format="jpeg",
+        )
+
+        assert request.cookies is None
+        assert request.extract_dom is None
+        assert request.format.value == "jpeg"
+
+
+class TestLazyImports:
+    """Tests for keeping the server's import light."""
+
+    def test_import_does_not_load_playwright(self):
+        """Importing the server defers Playwright and the app models."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, screenshot_mcp.server; "
+            "print(any(m in sys.modules for m in "
+            "('playwright', 'app.screenshot', 'app.models')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+
+class TestBatchedScreenshots:
+    """Tests for capturing a list of URLs in one screenshot call."""
+
+    @pytest.mark.asyncio
+    async def test_urls_captured_concurrently_in_order(self):
+        """Each URL gets its own result, in order, with shared options."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_capture(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "fail" in str(request.url):
+                raise RuntimeError("boom")
+            return (b"img", 1.0)
+
+        with patch("screenshot_mcp.server.get_screenshot_service") as mock_get_service:
+            mock_service = AsyncMock()
+            mock_service.capture.side_effect = fake_capture
+            mock_get_service.return_value = mock_service
+
+            from screenshot_mcp.server import handle_screenshot
+
+            urls = [f"https://example.com/{i}" for i in range(6)]
+            urls[2] = "https://example.com/fail"
+            result = await handle_screenshot({"urls": urls, "width": 800})
+
+        assert len(result) == 6
+        assert result[2].text == "Screenshot failed: boom"
+        assert all("captured successfully" in r.text for i, r in enumerate(result) if i != 2)
+        assert 1 < peak <= 4
+        requests = [call.args[0] for call in mock_service.capture.call_args_list]
+        assert all(r.width == 800 for r in requests)
+
+    @pytest.mark.asyncio
+    async def test_escaping_error_does_not_cancel_batch(self):
+        """An error raised out of one URL's capture is reported for that URL only."""
+        import asyncio
+        from unittest.mock import patch
+
+        from mcp.types import TextContent
+
+        seen = []
+
+        async def fake_result(arguments):
+            seen.append(arguments)
+            if arguments["url"].endswith("/fail"):
+                raise RuntimeError("crashed")
+            await asyncio.sleep(0.01)
+            return TextContent(type="text", text=f"ok {arguments['url']}")
+
+        with patch("screenshot_mcp.server._screenshot_result", fake_result):
+            from screenshot_mcp.server import handle_screenshot
+
+            urls = [
+                "https://example.com/0",
+                "https://example.com/fail",
+                "https://example.com/2",
+            ]
+            result = await handle_screenshot({"urls": urls, "width": 800})
+
+        assert [r.text for r in result] == [
+            "ok https://example.com/0",
+            "Screenshot failed: crashed",
+            "ok https://example.com/2",
+        ]
+        assert all("urls" not in args and args["width"] == 800 for args in seen)
+
+    @pytest.mark.asyncio
+    async def test_schema_has_no_top_level_combinators(self):
+        """Tool clients reject top-level anyOf/oneOf/allOf, so the schema has none."""
+        from screenshot_mcp.server import MCP_BATCH_MAX_URLS, list_tools
+
+        schema = next(t for t in await list_tools() if t.name == "screenshot").inputSchema
+
+        assert not {"anyOf", "oneOf", "allOf"} & schema.keys()
+        assert schema["properties"]["urls"]["maxItems"] == MCP_BATCH_MAX_URLS
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "arguments,message",
+        [
+            ({}, "url or urls is required"),
+            (
+                {"url": "https://example.com", "urls": ["https://example.com/1"]},
+                "pass either url or urls, not both",
+            ),
+            ({"urls": []}, "urls must list 1 to"),
+            ({"urls": ["https://example.com"] * 21}, "urls must list 1 to"),
+        ],
+    )
+    async def test_invalid_url_arguments_rejected(self, arguments, message):
+        """Missing, combined, empty or oversized URL arguments capture nothing."""
+        from unittest.mock import patch
+
+        with patch("screenshot_mcp.server._screenshot_result") as mock_result:
+            from screenshot_mcp.server import handle_screenshot
+
+            result = await handle_screenshot(arguments)
+
+        assert len(result) == 1
+        assert result[0].text.startswith("Screenshot failed: ")
+        assert message in result[0].text
+        mock_result.assert_not_called()
+
@@ -165,6 +165,14 @@ class TestQualityWarningModel:
         assert restored.message == 'Message with "quotes" and newline\n'
         assert restored.suggestion == "Suggestion with unicode: cafe"
 
+    def test_quality_warning_is_mutable(self):
+        """QualityWarning is a public response model and stays mutable."""
+        from app.models import QualityWarning
+
+        warning = QualityWarning(code="test", message="msg", suggestion="sug")
+        warning.message = "changed"
+        assert warning.message == "changed"
+
     def test_quality_warning_has_field_descriptions(self):
         """QualityWarning fields have descriptions for OpenAPI."""
         from app.models import QualityWarning
@@ -428,6 +436,35 @@ class TestScreenshotRequestCookies:
             )
 
 
+class TestWaitStrategy:
+    """Tests for the wait_strategy field on screenshot requests."""
+
+    def test_defaults_to_networkidle(self):
+        """Both request models keep networkidle as the default."""
+        from app.models import ScreenshotRequest, TiledScreenshotRequest
+
+        assert ScreenshotRequest(url="https://example.com").wait_strategy == "networkidle"
+        assert (
+            TiledScreenshotRequest(url="https://example.com").wait_strategy
+            == "networkidle"
+        )
+
+    def test_accepts_faster_strategies(self):
+        """domcontentloaded and load are accepted."""
+        from app.models import ScreenshotRequest
+
+        for strategy in ("domcontentloaded", "load"):
+            request = ScreenshotRequest(url="https://example.com", wait_strategy=strategy)
+            assert request.wait_strategy == strategy
+
+    def test_rejects_unknown_strategy(self):
+        """Unknown load events are rejected."""
+        from app.models import ScreenshotRequest
+
+        with pytest.raises(ValidationError):
+            ScreenshotRequest(url="https://example.com", wait_strategy="idle")
+
+
 class TestBoundingRectModel:
     """Tests for BoundingRect Pydantic model."""
 
@@ -68,6 +68,16 @@ class TestElementCountDetection:
         warning_codes = [w.code for w in result.warnings]
         assert "NO_ELEMENTS" in warning_codes
 
+    def test_returned_warnings_are_not_shared(self):
+        """Modifying a returned warning does not leak into later results."""
+        from app.quality_assessment import assess_extraction_quality
+
+        first = assess_extraction_quality([])
+        first.warnings[0].message = "changed"
+
+        second = assess_extraction_quality([])
+        assert second.warnings[0].message != "changed"
+
     def test_sparse_extraction_returns_poor_quality(self):
         """1-4 elements returns POOR quality."""
         from app.quality_assessment import assess_extraction_quality
@@ -533,6 +543,16 @@ class TestTextLengthDetection:
         warning_codes = [w.code for w in result.warnings]
         assert "MINIMAL_TEXT" not in warning_codes
 
+    def test_text_length_boundary_exact_at_large_count(self):
+        """Regression: 249 elements of 10 chars average exactly 10.0, no warning."""
+        from app.quality_assessment import assess_extraction_quality
+
+        elements = [create_dom_element(text="1234567890") for _ in range(249)]
+        result = assess_extraction_quality(elements)
+        warning_codes = [w.code for w in result.warnings]
+        assert "MINIMAL_TEXT" not in warning_codes
+        assert result.metrics.avg_text_length == 10.0
+
     def test_text_length_boundary_under_10_chars(self):
         """Boundary: avg < 10 chars -> warning."""
         from app.quality_assessment import assess_extraction_quality
@@ -850,6 +870,31 @@ class TestQualityMetricsComputation:
         assert isinstance(result.metrics.unique_tags, list)
         assert set(result.metrics.unique_tags) == {"h1", "p", "span"}
 
+    def test_metrics_unique_tags_first_seen_order(self):
+        """unique_tags keeps first-seen order; sorting is left to serialization."""
+        from app.quality_assessment import assess_extraction_quality
+
+        elements = [
+            create_dom_element(tag_name="SPAN", text="Span"),
+            create_dom_element(tag_name="p", text="Para"),
+            create_dom_element(tag_name="h1", text="H1"),
+            create_dom_element(tag_name="span", text="Another span"),
+        ]
+        result = assess_extraction_quality(elements)
+
+        assert result.metrics.unique_tags == ["span", "p", "h1"]
+
+    def test_metrics_data_keeps_unique_tags_field(self):
+        """QualityMetricsData takes unique_tags as a constructor field."""
+        from dataclasses import asdict
+
+        from app.quality_assessment import QualityMetricsData
+
+        metrics = QualityMetricsData(unique_tag_count=2, unique_tags=["h1", "p"])
+
+        assert metrics.unique_tags == ["h1", "p"]
+        assert asdict(metrics)["unique_tags"] == ["h1", "p"]
+
     def test_metrics_has_headings_true(self):
         """has_headings is True when headings present."""
         from app.quality_assessment import assess_extraction_quality
@@ -891,6 +936,20 @@ class TestQualityMetricsComputation:
         assert isinstance(result.metrics.tag_distribution, dict)
         assert result.metrics.tag_distribution == {"h1": 2, "p": 3, "span": 1}
 
+    def test_metrics_tag_distribution_merges_case_variants(self):
+        """Tag names differing only in case are counted together."""
+        from app.quality_assessment import assess_extraction_quality
+
+        elements = [
+            create_dom_element(tag_name="H1", text="Upper"),
+            create_dom_element(tag_name="h1", text="Lower"),
+            create_dom_element(tag_name="Div", text="Mixed"),
+        ]
+        result = assess_extraction_quality(elements)
+
+        assert result.metrics.tag_distribution == {"h1": 2, "div": 1}
+        assert result.metrics.heading_count == 2
+
     def test_metrics_total_text_length(self):
         """total_text_length sums all element text lengths."""
         from app.quality_assessment import assess_extraction_quality
@@ -931,6 +990,24 @@ class TestQualityMetricsComputation:
         assert result.metrics.min_text_length == 2
         assert result.metrics.max_text_length == 15
 
+    def test_non_detailed_skips_distribution_and_text_bounds(self):
+        """detailed=False leaves unique_tags, tag_distribution and min/max text unset."""
+        from app.quality_assessment import assess_extraction_quality
+
+        elements = create_diverse_elements(25)
+        detailed = assess_extraction_quality(elements)
+        sparse = assess_extraction_quality(elements, detailed=False)
+
+        assert sparse.metrics.tag_distribution == {}
+        assert sparse.metrics.unique_tags == []
+        assert sparse.metrics.min_text_length == 0
+        assert sparse.metrics.max_text_length == 0
+        # Quality decision and warnings are unaffected
+        assert sparse.quality == detailed.quality
+        assert sparse.warnings == detailed.warnings
+        assert sparse.metrics.unique_tag_count == detailed.metrics.unique_tag_count
+        assert sparse.metrics.total_text_length == detailed.metrics.total_text_length
+
     # === Edge Cases ===
 
     def test_metrics_empty_elements(self):
@@ -1046,6 +1123,41 @@ class TestQualityMetricsComputation:
         assert result_good.quality == ExtractionQuality.GOOD
 
 
+class TestModelConfigLoading:
+    """Tests for _load_model_config() parsing."""
+
+    def test_missing_config_returns_none(self, tmp_path):
+        """A missing config file yields None."""
+        from app.quality_assessment import _load_model_config
+
+        assert _load_model_config(tmp_path / "missing.json") is None
+
+    def test_invalid_json_returns_none(self, tmp_path):
+        """An unparseable config file yields None."""
+        from app.quality_assessment import _load_model_config
+
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{not json")
+        assert _load_model_config(config_path) is None
+
+    def test_badly_encoded_file_returns_none(self, tmp_path):
+        """Bytes that are not valid UTF-8 yield None instead of raising."""
+        from app.quality_assessment import _load_model_config
+
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(b'{"defaults": "\xff\xfe"}')
+        assert _load_model_config(config_path) is None
+
+    def test_valid_config_is_parsed(self, tmp_path):
+        """A valid config file is returned as a dict."""
+        from app.quality_assessment import _load_model_config
+
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"defaults": {"target_model": "gemini"}}')
+
+        assert _load_model_config(config_path) == {"defaults": {"target_model": "gemini"}}
+
+
 class TestGenerateVisionHints:
     """Tests for generate_vision_hints() function (Sprint 5.0 Story 02+03).
 
@@ -1391,3 +1503,72 @@ class TestGenerateVisionHints:
         )
         # Should use Claude's limit
         assert result.estimated_resize_factor < 1.0
+
+    # === Memoization ===
+
+    def test_repeat_dimensions_reuse_cached_hints(self):
+        """Repeated dimensions hit the cache but still echo image_size_bytes."""
+        from app.quality_assessment import (
+            _compute_vision_hints,
+            clear_vision_caches,
+            generate_vision_hints,
+        )
+
+        clear_vision_caches()
+        first = generate_vision_hints(
+            image_width=5000, image_height=3000, image_size_bytes=100
+        )
+        second = generate_vision_hints(
+            image_width=5000, image_height=3000, image_size_bytes=200
+        )
+
+        assert _compute_vision_hints.cache_info().hits == 1
+        assert first.image_size_bytes == 100
+        assert second.image_size_bytes == 200
+        assert first.model_dump(exclude={"image_size_bytes"}) == second.model_dump(
+            exclude={"image_size_bytes"}
+        )
+
+    def test_cached_tile_size_not_shared_between_results(self):
+        """Mutating one result's suggested_tile_size does not leak into the cache."""
+        from app.quality_assessment import generate_vision_hints
+
+        first = generate_vision_hints(
+            image_width=5000, image_height=3000, image_size_bytes=100
+        )
+        first.suggested_tile_size["width"] = 1
+        second = generate_vision_hints(
+            image_width=5000, image_height=3000, image_size_bytes=100
+        )
+
+        assert second.suggested_tile_size["width"] != 1
+
+    def test_clear_vision_caches_resets_helpers(self):
+        """clear_vision_caches() empties every memoized helper."""
+        from app.quality_assessment import (
+            _check_model_compatibility,
+            clear_vision_caches,
+            generate_vision_hints,
+        )
+
+        generate_vision_hints(image_width=1920, image_height=1080, image_size_bytes=1)
+        assert _check_model_compatibility.cache_info().currsize > 0
+
+        clear_vision_caches()
+        assert _check_model_compatibility.cache_info().currsize == 0
+
+    def test_clear_vision_caches_picks_up_new_limits(self, monkeypatch):
+        """Runtime limit changes apply after clear_vision_caches()."""
+        from app import quality_assessment
+        from app.quality_assessment import clear_vision_caches, generate_vision_hints
+
+        monkeypatch.setitem(quality_assessment.VISION_MODEL_LIMITS, "claude", 2000)
+        try:
+            clear_vision_caches()
+            result = generate_vision_hints(
+                image_width=1920, image_height=1080, image_size_bytes=1
+            )
+            assert result.claude_compatible is True
+        finally:
+            monkeypatch.undo()
+            clear_vision_caches()
@@ -183,3 +183,54 @@ class TestBuildStorageInjectionScript:
         assert "key1" in script
         assert "key2" in script
         assert "key3" in script
+
+    def test_build_request_script_combines_both_storages(self):
+        """Both storage types are injected by a single script."""
+        from app.models import ScreenshotRequest
+        from app.screenshot import build_request_storage_script
+
+        request = ScreenshotRequest(
+            url="https://example.com",
+            localStorage={"token": "abc"},
+            sessionStorage={"temp": "data"},
+        )
+        script = build_request_storage_script(request)
+
+        assert script.splitlines() == [
+            'localStorage.setItem("token", "abc");',
+            'sessionStorage.setItem("temp", "data");',
+        ]
+
+    def test_init_script_guards_on_origin(self):
+        """The init script only writes storage in top-level target-origin documents."""
+        from app.models import ScreenshotRequest
+        from app.screenshot import build_request_storage_script, build_storage_init_script
+
+        request = ScreenshotRequest(
+            url="https://example.com/app",
+            localStorage={"token": "abc"},
+        )
+        script = build_storage_init_script(request, "https://example.com")
+
+        assert script.startswith(
+            'if (window === window.top && location.origin === "https://example.com"'
+        )
+        assert build_request_storage_script(request) in script
+        assert script.endswith("}")
+
+    def test_init_script_injects_once_per_tab(self):
+        """A sessionStorage sentinel stops later loads overwriting page writes."""
+        from app.models import ScreenshotRequest
+        from app.screenshot import STORAGE_INJECTED_SENTINEL, build_storage_init_script
+
+        request = ScreenshotRequest(
+            url="https://example.com/app",
+            localStorage={"token": "abc"},
+        )
+        script = build_storage_init_script(request, "https://example.com")
+        sentinel = f'"{STORAGE_INJECTED_SENTINEL}"'
+
+        assert f"sessionStorage.getItem({sentinel}) === null" in script.splitlines()[1]
+        # The sentinel is set before any request value is written
+        assert script.splitlines()[2] == f'sessionStorage.setItem({sentinel}, "1");'
+        assert script.index("sessionStorage.setItem") < script.index("localStorage.setItem")
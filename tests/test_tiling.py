@@ -8,6 +8,7 @@ from app.tiling import (
     TileBounds,
     VISION_AI_PRESETS,
     apply_vision_preset,
+    split_tile_shards,
 )
 
 
@@ -488,3 +489,103 @@ class TestCalculatePerTileWait:
         """Value just above minimum is preserved."""
         result = calculate_per_tile_wait(204, 4)
         assert result == 51  # 204/4=51, just above 50
+
+    def test_per_tile_wait_zero_tiles_guarded(self):
+        """A zero tile count does not divide by zero."""
+        assert calculate_per_tile_wait(1000, 0) == 1000
+
+
+class TestSplitTileShards:
+    """Tests for split_tile_shards function."""
+
+    def _tiles(self, count: int) -> tuple[TileBounds, ...]:
+        return calculate_tile_grid(
+            page_height=count * 100, viewport_height=100, overlap=0
+        )
+
+    def test_shards_are_contiguous_and_ordered(self):
+        """Concatenated shards reproduce the original tile order."""
+        tiles = self._tiles(10)
+        shards = split_tile_shards(tiles, 4)
+
+        assert [tile for shard in shards for tile in shard] == list(tiles)
+
+    def test_shard_sizes_differ_by_at_most_one(self):
+        """Tiles are spread evenly across shards."""
+        shards = split_tile_shards(self._tiles(10), 4)
+        assert [len(shard) for shard in shards] == [3, 3, 2, 2]
+
+    def test_fewer_tiles_than_shards(self):
+        """Each tile gets its own shard when tiles are scarce."""
+        shards = split_tile_shards(self._tiles(2), 4)
+        assert [len(shard) for shard in shards] == [1, 1]
+
+    def test_single_shard(self):
+        """A shard count of one keeps every tile together."""
+        tiles = self._tiles(5)
+        assert split_tile_shards(tiles, 1) == [tiles]
+
+
+class TestGridDimensionsFromLastTile:
+    """The last tile of a grid carries its largest row and column."""
+
+    def test_last_tile_has_max_row_and_column(self):
+        """capture_tiled reads the grid size from tiles[-1]."""
+        tiles = calculate_tile_grid(
+            page_height=5000, viewport_height=1000, overlap=50,
+            page_width=3000, viewport_width=1280,
+        )
+
+        assert tiles[-1].row == max(t.row for t in tiles)
+        assert tiles[-1].column == max(t.column for t in tiles)
+
+
+class TestTileGridCache:
+    """Tests for memoizing tile grids by page and tile dimensions."""
+
+    def test_same_dimensions_reuse_grid_with_own_tiles(self):
+        """Repeated grids hit the cache but hand out independent TileBounds."""
+        from app.tiling import _calculate_tile_grid_cached
+
+        _calculate_tile_grid_cached.cache_clear()
+        first = calculate_tile_grid(3000, 800, 50, 1200, 1200)
+        second = calculate_tile_grid(3000, 800, 50, 1200, 1200)
+
+        assert isinstance(first, tuple)
+        assert first == second
+        assert _calculate_tile_grid_cached.cache_info().hits == 1
+        # TileBounds stays mutable; changing one grid leaves the next intact
+        first[0].y = 10
+        assert calculate_tile_grid(3000, 800, 50, 1200, 1200)[0].y == 0
+
+
+class TestUniformTileGrid:
+    """Tests for the uniform ("minverlap") tile grid."""
+
+    def test_every_tile_is_full_size(self):
+        """No edge tile is clipped; the last tile is flush with the page."""
+        tiles = calculate_tile_grid(
+            page_height=3000, viewport_height=800, overlap=50,
+            page_width=2000, viewport_width=1200, uniform=True,
+        )
+
+        assert all(t.width == 1200 and t.height == 800 for t in tiles)
+        assert tiles[-1].y + tiles[-1].height == 3000
+        assert tiles[-1].x + tiles[-1].width == 2000
+
+    def test_same_tile_count_and_at_least_requested_overlap(self):
+        """Uniform grids keep the tile count and never shrink the overlap."""
+        default = calculate_tile_grid(3000, 800, 50, 1200, 1200)
+        uniform = calculate_tile_grid(3000, 800, 50, 1200, 1200, uniform=True)
+
+        assert len(uniform) == len(default)
+        ys = [t.y for t in uniform]
+        assert ys[0] == 0
+        assert all(800 - (b - a) >= 50 for a, b in zip(ys, ys[1:]))
+
+    def test_page_smaller_than_tile(self):
+        """A page shorter than one tile still yields one clipped tile."""
+        tiles = calculate_tile_grid(500, 800, 50, 1200, 1200, uniform=True)
+
+        assert len(tiles) == 1
+        assert tiles[0].height == 500